@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Import time benchmark: fails if importing pyzitadelle gets slow or pulls
+# in heavy dependencies again.
+import argparse
+import subprocess
+import sys
+
+# the test case module needs asyncio and friends, only the package itself is
+# held to the time budget
+MODULES = ("pyzitadelle", "pyzitadelle.test_case")
+BUDGETED = ("pyzitadelle",)
+FORBIDDEN = ("requests", "rich", "urllib3", "click")
+
+
+def measure(module: str) -> dict:
+	"""
+	Measure import of module with `python -X importtime`
+
+	:param		module:	 The module
+	:type		module:	 str
+
+	:returns:	cumulative import time in microseconds by imported module
+	:rtype:		dict
+	"""
+	process = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", f"import {module}"],
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	timings = {}
+
+	for line in process.stderr.splitlines():
+		if not line.startswith("import time:") or "cumulative" in line:
+			continue
+
+		_, cumulative, name = line[len("import time:") :].split("|")
+		timings[name.strip()] = int(cumulative)
+
+	return timings
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument(
+		"--budget-ms",
+		type=float,
+		default=20.0,
+		help="maximum cumulative import time of the package",
+	)
+	parser.add_argument("--repeat", type=int, default=5)
+	args = parser.parse_args()
+
+	failed = False
+
+	for module in MODULES:
+		runs = [measure(module) for _ in range(args.repeat)]
+		best = min(run[module] for run in runs) / 1000
+		heavy = sorted({name for name in runs[0] if name.split(".")[0] in FORBIDDEN})
+
+		print(f"import {module}: {best:.2f}ms")
+
+		if heavy:
+			print(f"  heavy modules imported: {', '.join(heavy)}")
+			failed = True
+
+		if module in BUDGETED and best > args.budget_ms:
+			print(f"  import time is over budget of {args.budget_ms}ms")
+			failed = True
+
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from pyzitadelle.benchmark import BenchmarkStats
+from pyzitadelle.reporter import get_platform_info
+
+
+def get_machine_fingerprint() -> str:
+	"""
+	Gets the fingerprint of machine the benchmarks run on, built from the
+	platform information of runner prelude and the count of CPUs.
+
+	:returns:	The machine fingerprint.
+	:rtype:		str
+	"""
+	info = get_platform_info()
+	info["cpus"] = str(os.cpu_count())
+
+	return hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def get_benchmark_key(label: str, stats: BenchmarkStats) -> str:
+	"""
+	Gets the baseline key of benchmark.
+
+	:param		label:	The test case label
+	:type		label:	str
+	:param		stats:	The benchmark statistics
+	:type		stats:	BenchmarkStats
+
+	:returns:	The benchmark key.
+	:rtype:		str
+	"""
+	key = f"{label}::{stats.name}"
+
+	if stats.argument_index is not None:
+		key = f"{key}[{stats.argument_index}]"
+
+	return key
+
+
+@dataclass
+class Regression:
+	"""
+	Benchmark whose median got slower than its baseline.
+	"""
+
+	key: str
+	baseline_median: float
+	median: float
+
+	@property
+	def change(self) -> float:
+		return self.median / self.baseline_median - 1
+
+
+class BenchmarkBaseline:
+	"""
+	This class describes benchmark results saved to a JSON file, separately
+	for every machine fingerprint.
+	"""
+
+	def __init__(
+		self,
+		path: Union[str, Path],
+		threshold: float = 0.1,
+		fail_on_regression: bool = False,
+	):
+		"""
+		Constructs a new instance.
+
+		:param		path:				 The baseline file path
+		:type		path:				 Union[str, Path]
+		:param		threshold:			 The allowed relative slowdown of median
+		:type		threshold:			 float
+		:param		fail_on_regression:	 Fail regressed benchmarks
+		:type		fail_on_regression:	 bool
+		"""
+		self.path = Path(path)
+		self.threshold = threshold
+		self.fail_on_regression = fail_on_regression
+		self.fingerprint = get_machine_fingerprint()
+		self.regressions: List[Regression] = []
+
+		try:
+			self.data = json.loads(self.path.read_text())
+		except (OSError, ValueError):
+			self.data = {"version": 1, "machines": {}}
+
+	@property
+	def benchmarks(self) -> Dict[str, dict]:
+		machine = self.data["machines"].setdefault(
+			self.fingerprint, {"platform": get_platform_info(), "benchmarks": {}}
+		)
+
+		return machine["benchmarks"]
+
+	def check(self, label: str, stats: BenchmarkStats) -> Optional[Regression]:
+		"""
+		Compare benchmark with its baseline
+
+		:param		label:	The test case label
+		:type		label:	str
+		:param		stats:	The benchmark statistics
+		:type		stats:	BenchmarkStats
+
+		:returns:	regression, None if benchmark is not slower than allowed
+		:rtype:		Optional[Regression]
+		"""
+		key = get_benchmark_key(label, stats)
+		saved = self.benchmarks.get(key)
+
+		if saved is None or not saved["median"]:
+			return None
+
+		if stats.median <= saved["median"] * (1 + self.threshold):
+			return None
+
+		regression = Regression(key, saved["median"], stats.median)
+		self.regressions.append(regression)
+
+		return regression
+
+	def update(self, label: str, benchmarks: List[BenchmarkStats]):
+		"""
+		Replace baseline of benchmarks with their current results
+
+		:param		label:		 The test case label
+		:type		label:		 str
+		:param		benchmarks:	 The benchmarks
+		:type		benchmarks:	 List[BenchmarkStats]
+		"""
+		saved = self.benchmarks
+
+		for stats in benchmarks:
+			saved[get_benchmark_key(label, stats)] = {
+				"min": stats.min,
+				"median": stats.median,
+				"p95": stats.p95,
+				"stddev": stats.stddev,
+				"rounds": stats.rounds,
+				"iterations": stats.iterations,
+				"updated_at": time.time(),
+			}
+
+	def save(self):
+		"""
+		Write baseline to the file.
+		"""
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+
+		temp_path = self.path.with_name(f"{self.path.name}.tmp")
+		temp_path.write_text(json.dumps(self.data, indent=2, sort_keys=True))
+		os.replace(temp_path, self.path)
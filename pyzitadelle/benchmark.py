@@ -0,0 +1,239 @@
+import gc
+import math
+import statistics
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, List, Optional
+
+from pyzitadelle.results import ResultListener
+from pyzitadelle.standard import BenchmarkOptions, TestResult
+
+# a calibration batch shorter than this is too noisy to estimate a call
+MIN_CALIBRATION_NS = 1_000_000
+
+
+@dataclass
+class BenchmarkStats:
+	"""
+	Statistics of benchmark rounds, all times are per call in seconds.
+	"""
+
+	name: str
+	argument_index: Optional[int]
+	rounds: int
+	iterations: int
+	min: float
+	median: float
+	p95: float
+	mean: float
+	stddev: float
+
+	@property
+	def ops(self) -> float:
+		return 1 / self.mean if self.mean else math.inf
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+	"""
+	Nearest-rank percentile of sorted samples
+
+	:param		samples:  The sorted samples
+	:type		samples:  List[float]
+	:param		percent:  The percent
+	:type		percent:  float
+
+	:returns:	percentile
+	:rtype:		float
+	"""
+	rank = max(math.ceil(percent / 100 * len(samples)), 1)
+
+	return samples[rank - 1]
+
+
+def compute_stats(
+	name: str, argument_index: Optional[int], iterations: int, samples: List[float]
+) -> BenchmarkStats:
+	"""
+	Compute statistics of per-call times
+
+	:param		name:			 The test name
+	:type		name:			 str
+	:param		argument_index:	 The argument index
+	:type		argument_index:	 Optional[int]
+	:param		iterations:		 The iterations per round
+	:type		iterations:		 int
+	:param		samples:		 The per-call times of rounds
+	:type		samples:		 List[float]
+
+	:returns:	benchmark statistics
+	:rtype:		BenchmarkStats
+	"""
+	samples = sorted(samples)
+
+	return BenchmarkStats(
+		name=name,
+		argument_index=argument_index,
+		rounds=len(samples),
+		iterations=iterations,
+		min=samples[0],
+		median=statistics.median(samples),
+		p95=_percentile(samples, 95),
+		mean=statistics.fmean(samples),
+		stddev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+	)
+
+
+def _get_iterations(per_call_ns: float, options: BenchmarkOptions, rounds: int) -> int:
+	"""
+	Gets the count of calls per round to fill the target time
+
+	:param		per_call_ns:  The estimated time of one call
+	:type		per_call_ns:  float
+	:param		options:	  The options
+	:type		options:	  BenchmarkOptions
+	:param		rounds:		  The rounds
+	:type		rounds:		  int
+
+	:returns:	iterations per round
+	:rtype:		int
+	"""
+	round_ns = options.target_time * 1e9 / rounds
+
+	return max(1, int(round_ns / max(per_call_ns, 1)))
+
+
+def run_benchmark(
+	name: str,
+	argument_index: Optional[int],
+	call: Callable[[], Any],
+	options: BenchmarkOptions,
+	rounds: int,
+) -> BenchmarkStats:
+	"""
+	Benchmark sync callable
+
+	:param		name:			 The test name
+	:type		name:			 str
+	:param		argument_index:	 The argument index
+	:type		argument_index:	 Optional[int]
+	:param		call:			 The callable without arguments
+	:type		call:			 Callable
+	:param		options:		 The options
+	:type		options:		 BenchmarkOptions
+	:param		rounds:			 The rounds
+	:type		rounds:			 int
+
+	:returns:	benchmark statistics
+	:rtype:		BenchmarkStats
+	"""
+	for _ in range(options.warmup):
+		call()
+
+	batch = 1
+
+	while True:
+		start = perf_counter_ns()
+		for _ in range(batch):
+			call()
+		elapsed = perf_counter_ns() - start
+
+		if elapsed >= MIN_CALIBRATION_NS:
+			break
+
+		batch *= 2
+
+	iterations = _get_iterations(elapsed / batch, options, rounds)
+	samples = []
+	gc_enabled = gc.isenabled()
+
+	if options.disable_gc:
+		gc.collect()
+		gc.disable()
+
+	try:
+		for _ in range(rounds):
+			start = perf_counter_ns()
+			for _ in range(iterations):
+				call()
+			samples.append((perf_counter_ns() - start) / iterations / 1e9)
+	finally:
+		if gc_enabled:
+			gc.enable()
+
+	return compute_stats(name, argument_index, iterations, samples)
+
+
+async def run_benchmark_async(
+	name: str,
+	argument_index: Optional[int],
+	call: Callable[[], Awaitable],
+	options: BenchmarkOptions,
+	rounds: int,
+) -> BenchmarkStats:
+	"""
+	Benchmark coroutine function inside of the running event loop
+
+	:param		name:			 The test name
+	:type		name:			 str
+	:param		argument_index:	 The argument index
+	:type		argument_index:	 Optional[int]
+	:param		call:			 The callable without arguments returning awaitable
+	:type		call:			 Callable
+	:param		options:		 The options
+	:type		options:		 BenchmarkOptions
+	:param		rounds:			 The rounds
+	:type		rounds:			 int
+
+	:returns:	benchmark statistics
+	:rtype:		BenchmarkStats
+	"""
+	for _ in range(options.warmup):
+		await call()
+
+	batch = 1
+
+	while True:
+		start = perf_counter_ns()
+		for _ in range(batch):
+			await call()
+		elapsed = perf_counter_ns() - start
+
+		if elapsed >= MIN_CALIBRATION_NS:
+			break
+
+		batch *= 2
+
+	iterations = _get_iterations(elapsed / batch, options, rounds)
+	samples = []
+	gc_enabled = gc.isenabled()
+
+	if options.disable_gc:
+		gc.collect()
+		gc.disable()
+
+	try:
+		for _ in range(rounds):
+			start = perf_counter_ns()
+			for _ in range(iterations):
+				await call()
+			samples.append((perf_counter_ns() - start) / iterations / 1e9)
+	finally:
+		if gc_enabled:
+			gc.enable()
+
+	return compute_stats(name, argument_index, iterations, samples)
+
+
+class BenchmarkCollector(ResultListener):
+	"""
+	This class describes a collector of benchmark statistics.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.benchmarks: List[BenchmarkStats] = []
+
+	def add_result(self, test_name: str, line: int, test_result: TestResult):
+		self.benchmarks.extend(test_result.benchmarks)
@@ -0,0 +1,385 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import types
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from pyzitadelle.standard import Argument, TestInvocation, TestOutcome, TestResult
+
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+_PRIMITIVES = (type(None), bool, int, float, complex, str, bytes)
+
+
+class UncacheableError(Exception):
+	"""
+	Value of test cannot be hashed reproducibly.
+	"""
+
+
+def hash_source(path: Optional[str]) -> str:
+	"""
+	Hash content of source file
+
+	:param		path:  The path
+	:type		path:  Optional[str]
+
+	:returns:	sha1 hex digest, empty if file is unreadable
+	:rtype:		str
+	"""
+	if path is None:
+		return ""
+
+	digest = hashlib.sha1()
+
+	try:
+		with open(path, "rb") as file:
+			for chunk in iter(lambda: file.read(65536), b""):
+				digest.update(chunk)
+	except OSError:
+		return ""
+
+	return digest.hexdigest()
+
+
+class _Fingerprint:
+	"""
+	This class describes a hash of test: its bytecode, constants, closure
+	and the globals it refers to, with sources of modules they come from.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.digest = hashlib.sha1()
+		self._seen = set()
+		self._sources: Dict[str, str] = {}
+
+	def _update(self, *parts: Any):
+		for part in parts:
+			self.digest.update(repr(part).encode())
+			self.digest.update(b"\0")
+
+	def add_module_source(self, module_name: Optional[str]):
+		"""
+		Adds source hash of module.
+
+		:param		module_name:  The module name
+		:type		module_name:  Optional[str]
+		"""
+		module = sys.modules.get(module_name or "")
+		path = getattr(module, "__file__", None)
+
+		if path not in self._sources:
+			self._sources[path] = hash_source(path)
+
+		self._update("source", module_name, self._sources[path])
+
+	def add_code(self, code: types.CodeType, namespace: Dict[str, Any]):
+		"""
+		Adds code object, its nested code and globals it refers to.
+
+		:param		code:		The code
+		:type		code:		CodeType
+		:param		namespace:	The globals of code
+		:type		namespace:	Dict[str, Any]
+
+		:raises		UncacheableError:  global value cannot be hashed
+		"""
+		self._update(
+			"code",
+			code.co_code,
+			code.co_names,
+			code.co_varnames,
+			code.co_argcount,
+			code.co_kwonlyargcount,
+		)
+
+		for const in code.co_consts:
+			if isinstance(const, types.CodeType):
+				self.add_code(const, namespace)
+			else:
+				self._update(const)
+
+		for name in code.co_names:
+			if name in namespace:
+				self._update("global", name)
+				self.add_value(namespace[name])
+
+	def add_value(self, value: Any):
+		"""
+		Adds value referred by test.
+
+		:param		value:	The value
+		:type		value:	Any
+
+		:raises		UncacheableError:  value cannot be hashed
+		"""
+		if isinstance(value, _PRIMITIVES):
+			self._update(type(value).__name__, value)
+			return
+
+		if id(value) in self._seen:
+			self._update("seen", type(value).__qualname__)
+			return
+
+		self._seen.add(id(value))
+
+		if isinstance(value, types.ModuleType):
+			self.add_module_source(value.__name__)
+		elif isinstance(value, (types.FunctionType, types.MethodType)):
+			function = inspect.unwrap(getattr(value, "__func__", value))
+			self.add_module_source(function.__module__)
+			self.add_code(function.__code__, function.__globals__)
+			self.add_value(function.__defaults__)
+
+			for cell in function.__closure__ or ():
+				self.add_value(cell.cell_contents)
+		elif isinstance(value, type):
+			self._update("class", value.__module__, value.__qualname__)
+			self.add_module_source(value.__module__)
+		elif isinstance(value, (tuple, list)):
+			self._update(type(value).__name__, len(value))
+
+			for item in value:
+				self.add_value(item)
+		elif isinstance(value, dict):
+			self._update("dict", len(value))
+
+			for key, item in value.items():
+				self.add_value(key)
+				self.add_value(item)
+		elif isinstance(value, (set, frozenset)):
+			self._update(type(value).__name__, sorted(map(repr, value)))
+		elif isinstance(value, Argument):
+			self.add_value(tuple(value.args))
+			self.add_value(value.kwargs)
+		else:
+			try:
+				self.digest.update(pickle.dumps(value, protocol=4))
+			except Exception as ex:
+				raise UncacheableError(
+					f"cannot hash {type(value).__qualname__}"
+				) from ex
+
+
+def get_test_fingerprint(test: Any) -> Optional[str]:
+	"""
+	Gets the fingerprint of test: hash of its bytecode, closure, the globals it
+	refers to and sources of their modules.
+
+	:param		test:  The test
+	:type		test:  TestInfo
+
+	:returns:	sha1 hex digest, None if test cannot be hashed
+	:rtype:		Optional[str]
+	"""
+	fingerprint = _Fingerprint()
+
+	try:
+		fingerprint.add_value(inspect.unwrap(test))
+		fingerprint.add_value(test.pztdmeta.count_of_launchs)
+	except UncacheableError:
+		return None
+
+	return fingerprint.digest.hexdigest()
+
+
+def get_case_key(fingerprint: str, argument: Optional[Argument]) -> Optional[str]:
+	"""
+	Gets the cache key of test case.
+
+	:param		fingerprint:  The test fingerprint
+	:type		fingerprint:  str
+	:param		argument:	  The argument set
+	:type		argument:	  Optional[Argument]
+
+	:returns:	sha1 hex digest, None if arguments cannot be hashed
+	:rtype:		Optional[str]
+	"""
+	case = _Fingerprint()
+	case.digest.update(fingerprint.encode())
+
+	try:
+		case.add_value(argument)
+	except UncacheableError:
+		return None
+
+	return case.digest.hexdigest()
+
+
+class ResultCache:
+	"""
+	This class describes an on-disk cache of passed test cases, one JSON file
+	per case.
+
+	An entry is valid while the files executed by its test have the same
+	content. Hits touch the entry, and the least recently used entries are
+	evicted when the cache grows over its size.
+	"""
+
+	def __init__(
+		self, directory: Union[str, Path], max_size: int = DEFAULT_CACHE_SIZE
+	):
+		"""
+		Constructs a new instance.
+
+		:param		directory:	The cache directory
+		:type		directory:	Union[str, Path]
+		:param		max_size:	The maximum size of entries in bytes
+		:type		max_size:	int
+		"""
+		self.directory = Path(directory)
+		self.max_size = max_size
+		self._size: Optional[int] = None
+		self._hashes: Dict[str, str] = {}
+		self._fingerprints: Dict[Any, Optional[str]] = {}
+
+	def _get_path(self, key: str) -> Path:
+		return self.directory / f"{key}.json"
+
+	def _get_hash(self, path: str) -> str:
+		digest = self._hashes.get(path)
+
+		if digest is None:
+			digest = self._hashes[path] = hash_source(path)
+
+		return digest
+
+	def get_key(self, test: Any, argument: Optional[Argument]) -> Optional[str]:
+		"""
+		Gets the cache key of test case, the test is hashed once.
+
+		:param		test:	   The test
+		:type		test:	   TestInfo
+		:param		argument:  The argument set
+		:type		argument:  Optional[Argument]
+
+		:returns:	cache key, None if test case cannot be cached
+		:rtype:		Optional[str]
+		"""
+		if test not in self._fingerprints:
+			self._fingerprints[test] = get_test_fingerprint(test)
+
+		fingerprint = self._fingerprints[test]
+
+		if fingerprint is None:
+			return None
+
+		return get_case_key(fingerprint, argument)
+
+	def get(
+		self, key: str, argument_index: Optional[int]
+	) -> Optional[Tuple[TestResult, List[str]]]:
+		"""
+		Gets the cached result of test case and the files it executed.
+
+		:param		key:			 The key
+		:type		key:			 str
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+
+		:returns:	test result and files, None if there is no valid entry
+		:rtype:		Optional[Tuple[TestResult, List[str]]]
+		"""
+		path = self._get_path(key)
+
+		try:
+			entry = json.loads(path.read_text())
+		except (OSError, ValueError):
+			return None
+
+		if any(
+			self._get_hash(file_path) != digest
+			for file_path, digest in entry["files"].items()
+		):
+			return None
+
+		try:
+			os.utime(path)
+		except OSError:
+			pass
+
+		test_result = TestResult(
+			status="success",
+			postmessage="cached",
+			invocations=[
+				TestInvocation(launch, argument_index, TestOutcome.PASS)
+				for launch in range(entry["launches"])
+			],
+			argument_index=argument_index,
+		)
+
+		return test_result, list(entry["files"])
+
+	def put(self, key: str, test_result: TestResult, files: Iterable[str]):
+		"""
+		Store passed test case.
+
+		:param		key:		  The key
+		:type		key:		  str
+		:param		test_result:  The test result
+		:type		test_result:  TestResult
+		:param		files:		  The files executed by test
+		:type		files:		  Iterable[str]
+		"""
+		data = json.dumps(
+			{
+				"launches": len(test_result.invocations),
+				"duration_ns": sum(
+					invocation.duration_ns for invocation in test_result.invocations
+				),
+				"files": {path: self._get_hash(path) for path in sorted(files)},
+			}
+		)
+		path = self._get_path(key)
+
+		self.directory.mkdir(parents=True, exist_ok=True)
+
+		temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+		temp_path.write_text(data)
+		os.replace(temp_path, path)
+
+		self._evict(len(data))
+
+	def _evict(self, added: int):
+		"""
+		Remove least recently used entries while the cache is over its size
+
+		:param		added:	The size of added entry
+		:type		added:	int
+		"""
+		if self._size is not None:
+			self._size += added
+
+			if self._size <= self.max_size:
+				return
+
+		entries: List[tuple] = []
+
+		for path in self.directory.glob("*.json"):
+			try:
+				stat = path.stat()
+			except OSError:
+				continue
+
+			entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+		self._size = sum(size for _, size, _ in entries)
+		entries.sort()
+
+		for _, size, path in entries:
+			if self._size <= self.max_size:
+				break
+
+			try:
+				path.unlink()
+			except OSError:
+				continue
+
+			self._size -= size
@@ -0,0 +1,300 @@
+import sys
+from time import time
+from typing import Optional, Tuple
+
+import click
+
+from pyzitadelle import __version__
+from pyzitadelle.collection import DEFAULT_PATTERN, CollectionCache, collect
+from pyzitadelle.history import ONLY, ORDERS
+from pyzitadelle.planning import merge_plans, write_plan
+from pyzitadelle.reporter import get_reporter
+from pyzitadelle.sharding import print_summary, write_summary
+from pyzitadelle.utils import (
+	UpdateCheck,
+	get_project_cache_dir,
+	is_update_check_enabled,
+)
+
+
+@click.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True))
+@click.option(
+	"--pattern",
+	default=DEFAULT_PATTERN,
+	show_default=True,
+	help="File name pattern of test modules.",
+)
+@click.option(
+	"-j",
+	"--jobs",
+	type=click.IntRange(min=1),
+	help="Processes compiling test modules.",
+)
+@click.option(
+	"--collection-cache/--no-collection-cache",
+	default=True,
+	help="Skip unchanged modules without test cases.",
+)
+@click.option("--tag", "tags", multiple=True, help="Skip tests with this tag.")
+@click.option(
+	"-m",
+	"--select",
+	help='Run only tests matching tag expression, e.g. "db and not slow".',
+)
+@click.option(
+	"--concurrency",
+	type=click.IntRange(min=1),
+	help="Run async tests concurrently.",
+)
+@click.option(
+	"--workers",
+	type=click.IntRange(min=1),
+	help="Run sync tests in a process pool.",
+)
+@click.option(
+	"--threads",
+	type=click.IntRange(min=1),
+	help="Run sync tests in a thread pool.",
+)
+@click.option(
+	"--case-threads",
+	type=click.IntRange(min=1),
+	help="Run argument sets of sync tests in a thread pool.",
+)
+@click.option(
+	"--timeout",
+	type=float,
+	help="Default timeout of test invocation in seconds.",
+)
+@click.option(
+	"--reporter",
+	type=click.Choice(["rich", "plain"]),
+	default="rich",
+	show_default=True,
+)
+@click.option(
+	"--durations",
+	type=click.IntRange(min=0),
+	help="Show slowest tests (0 for all).",
+)
+@click.option(
+	"--incremental",
+	is_flag=True,
+	help="Skip passed tests whose sources have not changed.",
+)
+@click.option(
+	"--no-cache",
+	is_flag=True,
+	help="Do not reuse results of cacheable tests.",
+)
+@click.option(
+	"--order",
+	type=click.Choice(ORDERS),
+	help="Order of tests by previous runs.",
+)
+@click.option(
+	"--only",
+	type=click.Choice(ONLY),
+	help="Run only tests failed last time.",
+)
+@click.option("-x", "--fail-fast", is_flag=True, help="Stop after the first failure.")
+@click.option(
+	"--max-failures",
+	type=click.IntRange(min=1),
+	help="Stop after this many failures.",
+)
+@click.option(
+	"--shard",
+	type=click.IntRange(min=0),
+	help="Run only the tests of this shard (from 0).",
+)
+@click.option("--total-shards", type=click.IntRange(min=1), help="Count of shards.")
+@click.option(
+	"--shard-history",
+	type=click.Path(dir_okay=False),
+	help="Balance shards by durations from this history file shared by all nodes.",
+)
+@click.option(
+	"--summary",
+	type=click.Path(dir_okay=False),
+	help="Write results counts to this JSON file.",
+)
+@click.option(
+	"--dry-run",
+	is_flag=True,
+	help="List test cases without executing them.",
+)
+@click.option(
+	"--collect-only",
+	is_flag=True,
+	help="Only print the plan of run as JSON.",
+)
+@click.option(
+	"--plan",
+	type=click.Path(dir_okay=False),
+	help="Write the plan to this file instead of stdout.",
+)
+@click.option(
+	"--check-updates/--no-check-updates",
+	default=None,
+	help="Check pypi for a new version.",
+)
+def main(
+	paths: Tuple[str, ...],
+	pattern: str,
+	jobs: Optional[int],
+	collection_cache: bool,
+	tags: Tuple[str, ...],
+	select: Optional[str],
+	concurrency: Optional[int],
+	workers: Optional[int],
+	threads: Optional[int],
+	case_threads: Optional[int],
+	timeout: Optional[float],
+	reporter: str,
+	durations: Optional[int],
+	incremental: bool,
+	no_cache: bool,
+	order: Optional[str],
+	only: Optional[str],
+	fail_fast: bool,
+	max_failures: Optional[int],
+	shard: Optional[int],
+	total_shards: Optional[int],
+	shard_history: Optional[str],
+	summary: Optional[str],
+	dry_run: bool,
+	collect_only: bool,
+	plan: Optional[str],
+	check_updates: Optional[bool],
+):
+	"""
+	Discover test modules in PATHS (the current directory by default),
+	collect their test cases and run all of them in one session.
+
+	run() called at module level is suppressed while modules are collected.
+	Exit code is 1 if any test failed the session (error, timeout or
+	unexpected pass), 2 if collection failed.
+	"""
+	reporter = get_reporter(reporter)
+	cache = None
+
+	if collection_cache:
+		cache = CollectionCache(get_project_cache_dir() / "collection.json")
+
+	test_cases, errors = collect(paths or (".",), pattern, jobs, cache)
+
+	if cache is not None:
+		cache.save()
+
+	if errors:
+		for path, error in errors.items():
+			reporter.print_header(f"ERROR collecting {path}", style="bold red")
+			reporter.flush()
+			click.echo(error, err=True)
+
+		sys.exit(2)
+
+	if collect_only:
+		write_plan(
+			plan,
+			merge_plans(
+				test_case.plan(
+					list(tags),
+					order=order,
+					only=only,
+					shard=shard,
+					total_shards=total_shards,
+					select=select,
+					shard_history=shard_history,
+				)
+				for test_case in test_cases
+			),
+		)
+		sys.exit(0)
+
+	update_check = (
+		UpdateCheck().start() if is_update_check_enabled(check_updates) else None
+	)
+
+	reporter.print_banner(__version__)
+
+	if fail_fast:
+		max_failures = 1
+
+	failures = 0
+	exit_code = 0
+	start = time()
+
+	for test_case in test_cases:
+		remaining = None
+
+		if max_failures is not None:
+			remaining = max_failures - failures
+
+			if remaining <= 0:
+				break
+
+		exit_code |= test_case.run(
+			tags=list(tags),
+			concurrency=concurrency,
+			workers=workers,
+			check_updates=False,
+			reporter=reporter,
+			durations=durations,
+			timeout=timeout,
+			threads=threads,
+			case_threads=case_threads,
+			incremental=incremental,
+			use_cache=not no_cache,
+			order=order,
+			only=only,
+			max_failures=remaining,
+			shard=shard,
+			total_shards=total_shards,
+			shard_history=shard_history,
+			standalone=False,
+			dry_run=dry_run,
+			select=select,
+		)
+		failures += test_case.errors + test_case.timeouts + test_case.xpassed
+
+	total = time() - start
+	counts = {
+		"total": sum(test_case.cases for test_case in test_cases),
+		"passed": sum(test_case.passed for test_case in test_cases),
+		"warnings": sum(test_case.warnings for test_case in test_cases),
+		"errors": sum(test_case.errors for test_case in test_cases),
+		"skipped": sum(test_case.skipped for test_case in test_cases),
+		"timeouts": sum(test_case.timeouts for test_case in test_cases),
+		"xfailed": sum(test_case.xfailed for test_case in test_cases),
+		"xpassed": sum(test_case.xpassed for test_case in test_cases),
+	}
+
+	if summary is not None:
+		write_summary(
+			summary,
+			{
+				"label": "session",
+				"shard": shard,
+				"total_shards": total_shards,
+				"duration": total,
+				**counts,
+			},
+		)
+
+	reporter.print_header(
+		f"{len(test_cases)} test cases runned {round(total, 2)}s", style="bold cyan"
+	)
+
+	if dry_run:
+		reporter.print_header(f"{counts['total']} cases collected", style="bold cyan")
+		reporter.flush()
+	else:
+		print_summary(counts, reporter)
+
+	if update_check is not None:
+		update_check.report()
+
+	sys.exit(exit_code)
@@ -0,0 +1,336 @@
+import fnmatch
+import importlib
+import json
+import os
+import py_compile
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyzitadelle.exceptions import CollectionError
+from pyzitadelle.test_case import TestCase, collecting
+
+DEFAULT_PATTERN = "test_*.py"
+
+IGNORED_DIRS = frozenset(
+	("__pycache__", "node_modules", "venv", "env", "build", "dist", "site-packages")
+)
+
+
+def _walk(directory: str, pattern: str) -> Iterator[str]:
+	"""
+	Walk directory tree in name order, skipping hidden and ignored directories
+
+	:param		directory:	The directory
+	:type		directory:	str
+	:param		pattern:	The file name pattern
+	:type		pattern:	str
+
+	:returns:	paths of matching files
+	:rtype:		Iterator[str]
+	"""
+	try:
+		entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+	except OSError:
+		return
+
+	for entry in entries:
+		if entry.is_dir(follow_symlinks=False):
+			if not entry.name.startswith(".") and entry.name not in IGNORED_DIRS:
+				yield from _walk(entry.path, pattern)
+		elif fnmatch.fnmatch(entry.name, pattern):
+			yield entry.path
+
+
+def discover(
+	paths: Iterable[Union[str, Path]], pattern: str = DEFAULT_PATTERN
+) -> List[str]:
+	"""
+	Discover test modules: files given explicitly are taken as they are,
+	directories are searched recursively for files matching the pattern
+
+	:param		paths:	  The files and directories
+	:type		paths:	  Iterable[Union[str, Path]]
+	:param		pattern:  The file name pattern
+	:type		pattern:  str
+
+	:returns:	absolute paths of test modules
+	:rtype:		List[str]
+	"""
+	found = []
+
+	for path in paths:
+		path = os.path.abspath(path)
+
+		if os.path.isdir(path):
+			found.extend(_walk(path, pattern))
+		else:
+			found.append(path)
+
+	return list(dict.fromkeys(found))
+
+
+def _compile(path: str) -> Optional[str]:
+	"""
+	Compile module to its cached bytecode
+
+	:param		path:  The path
+	:type		path:  str
+
+	:returns:	error message, None if module is compiled
+	:rtype:		Optional[str]
+	"""
+	try:
+		py_compile.compile(path, doraise=True)
+	except py_compile.PyCompileError as ex:
+		return ex.msg
+	except OSError as ex:
+		return str(ex)
+
+	return None
+
+
+def compile_modules(paths: Iterable[str], jobs: Optional[int] = None) -> Dict[str, str]:
+	"""
+	Compile modules in parallel processes, so importing them afterwards only
+	loads their cached bytecode, and syntax errors of all of them are found
+	at once
+
+	:param		paths:	The paths
+	:type		paths:	Iterable[str]
+	:param		jobs:	The count of processes, the count of CPUs by default
+	:type		jobs:	Optional[int]
+
+	:returns:	error messages by path
+	:rtype:		Dict[str, str]
+	"""
+	paths = list(paths)
+	jobs = min(jobs or os.cpu_count() or 1, len(paths))
+
+	if jobs <= 1:
+		errors = list(map(_compile, paths))
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as executor:
+			errors = list(
+				executor.map(
+					_compile, paths, chunksize=max(1, len(paths) // (jobs * 4))
+				)
+			)
+
+	return {path: error for path, error in zip(paths, errors) if error is not None}
+
+
+def get_module_name(path: str) -> Tuple[str, str]:
+	"""
+	Gets the import root and the dotted name of module: packages containing
+	it are walked up while they have `__init__.py`.
+
+	:param		path:  The path
+	:type		path:  str
+
+	:returns:	root directory and module name
+	:rtype:		Tuple[str, str]
+	"""
+	path = Path(path)
+	parts = [path.stem]
+	directory = path.parent
+
+	while (directory / "__init__.py").is_file():
+		parts.append(directory.name)
+		directory = directory.parent
+
+	return str(directory), ".".join(reversed(parts))
+
+
+def import_test_module(path: str) -> ModuleType:
+	"""
+	Import test module by path, its root directory is prepended to
+	`sys.path`, so pool workers can import it by name as well
+
+	:param		path:				The path
+	:type		path:				str
+
+	:returns:	module
+	:rtype:		ModuleType
+
+	:raises		CollectionError:	another file is imported with the same name
+	"""
+	root, name = get_module_name(path)
+
+	if root not in sys.path:
+		sys.path.insert(0, root)
+
+	module = sys.modules.get(name)
+
+	if module is not None:
+		module_path = getattr(module, "__file__", None)
+
+		if module_path is None or os.path.abspath(module_path) != path:
+			raise CollectionError(f"{path} conflicts with {module_path} imported as {name}")
+
+		return module
+
+	with collecting():
+		return importlib.import_module(name)
+
+
+def get_test_cases(module: ModuleType) -> List[TestCase]:
+	"""
+	Gets the test cases defined or imported in module; the ones with default
+	label are labelled by module name, so history of their tests does not mix
+	with the tests of other modules.
+
+	:param		module:	 The module
+	:type		module:	 ModuleType
+
+	:returns:	test cases
+	:rtype:		List[TestCase]
+	"""
+	test_cases = []
+
+	for value in vars(module).values():
+		if isinstance(value, TestCase) and value not in test_cases:
+			if value.label == "TestCase":
+				value.label = module.__name__
+
+			test_cases.append(value)
+
+	return test_cases
+
+
+class CollectionCache:
+	"""
+	This class describes the count of test cases found in every module,
+	saved to a JSON file with mtime and size of the module, so later runs do
+	not compile unchanged modules and do not import the ones without test
+	cases at all.
+	"""
+
+	def __init__(self, path: Union[str, Path]):
+		"""
+		Constructs a new instance.
+
+		:param		path:  The collection cache file path
+		:type		path:  Union[str, Path]
+		"""
+		self.path = Path(path)
+
+		try:
+			self.data = json.loads(self.path.read_text())
+		except (OSError, ValueError):
+			self.data = {}
+
+		if self.data.get("version") != 1 or self.data.get("python") != sys.version:
+			self.data = {"version": 1, "python": sys.version, "files": {}}
+
+	def _stat(self, path: str) -> Optional[Tuple[int, int]]:
+		try:
+			stat = os.stat(path)
+		except OSError:
+			return None
+
+		return stat.st_mtime_ns, stat.st_size
+
+	def get(self, path: str) -> Optional[int]:
+		"""
+		Gets the count of test cases in module if it has not changed since it
+		was collected.
+
+		:param		path:  The path
+		:type		path:  str
+
+		:returns:	count of test cases, None if module is changed or unknown
+		:rtype:		Optional[int]
+		"""
+		saved = self.data["files"].get(path)
+
+		if saved is None or self._stat(path) != (saved["mtime_ns"], saved["size"]):
+			return None
+
+		return saved["test_cases"]
+
+	def update(self, path: str, test_cases: int):
+		"""
+		Replace record of collected module
+
+		:param		path:		 The path
+		:type		path:		 str
+		:param		test_cases:	 The count of test cases
+		:type		test_cases:	 int
+		"""
+		stat = self._stat(path)
+
+		if stat is not None:
+			self.data["files"][path] = {
+				"mtime_ns": stat[0],
+				"size": stat[1],
+				"test_cases": test_cases,
+			}
+
+	def save(self):
+		"""
+		Write collection cache to the file.
+		"""
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+
+		temp_path = self.path.with_name(f"{self.path.name}.tmp")
+		temp_path.write_text(json.dumps(self.data, sort_keys=True))
+		os.replace(temp_path, self.path)
+
+
+def collect(
+	paths: Iterable[Union[str, Path]],
+	pattern: str = DEFAULT_PATTERN,
+	jobs: Optional[int] = None,
+	cache: Optional[CollectionCache] = None,
+) -> Tuple[List[TestCase], Dict[str, str]]:
+	"""
+	Collect test cases of test modules found in paths
+
+	Changed modules are compiled in parallel first, then modules are
+	imported one by one with run() suppressed; modules which had no test
+	cases and have not changed since are skipped.
+
+	:param		paths:	  The files and directories
+	:type		paths:	  Iterable[Union[str, Path]]
+	:param		pattern:  The file name pattern
+	:type		pattern:  str
+	:param		jobs:	  The count of processes compiling modules
+	:type		jobs:	  Optional[int]
+	:param		cache:	  The collection cache
+	:type		cache:	  Optional[CollectionCache]
+
+	:returns:	test cases and collection errors by path
+	:rtype:		Tuple[List[TestCase], Dict[str, str]]
+	"""
+	files = discover(paths, pattern)
+	counts = {path: cache.get(path) if cache is not None else None for path in files}
+	errors = compile_modules(
+		[path for path, count in counts.items() if count is None], jobs
+	)
+	test_cases = []
+
+	for path, count in counts.items():
+		if path in errors or count == 0:
+			continue
+
+		try:
+			module = import_test_module(path)
+		except (Exception, SystemExit):
+			# sys.exit() called by module must not end the whole session
+			errors[path] = traceback.format_exc()
+			continue
+
+		found = get_test_cases(module)
+
+		if cache is not None:
+			cache.update(path, len(found))
+
+		test_cases.extend(
+			test_case for test_case in found if test_case not in test_cases
+		)
+
+	return test_cases, errors
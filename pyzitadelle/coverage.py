@@ -0,0 +1,823 @@
+import dis
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import sysconfig
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import pyzitadelle
+
+# code objects executed by the current test; asyncio tasks and threads
+# started by the runner inherit it, so concurrent tests are told apart
+_recording: ContextVar[Optional[Set[Any]]] = ContextVar(
+	"pyzitadelle_recording", default=None
+)
+# lines executed by the current test, as (filename, line) pairs
+_covered: ContextVar[Optional[Set[Tuple[str, int]]]] = ContextVar(
+	"pyzitadelle_covered", default=None
+)
+
+_ignored_paths: Optional[tuple] = None
+_source_paths: Dict[str, Optional[str]] = {}
+
+
+def _get_ignored_paths() -> tuple:
+	"""
+	Gets the paths of files which are never measured: the standard library,
+	installed packages and pyzitadelle itself.
+
+	:returns:	The ignored path prefixes.
+	:rtype:		tuple
+	"""
+	global _ignored_paths
+
+	if _ignored_paths is None:
+		paths = sysconfig.get_paths()
+		prefixes = {
+			paths[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")
+		}
+		prefixes.add(os.path.dirname(os.path.abspath(pyzitadelle.__file__)))
+		_ignored_paths = tuple(os.path.join(prefix, "") for prefix in prefixes)
+
+	return _ignored_paths
+
+
+def get_source_path(filename: str) -> Optional[str]:
+	"""
+	Gets the absolute path of measured source file of code.
+
+	:param		filename:  The code filename
+	:type		filename:  str
+
+	:returns:	The absolute path, None if file is ignored or does not exist.
+	:rtype:		Optional[str]
+	"""
+	path = _source_paths.get(filename, "")
+
+	if path == "":
+		path = os.path.abspath(filename)
+
+		if path.startswith(_get_ignored_paths()) or not os.path.isfile(path):
+			path = None
+
+		_source_paths[filename] = path
+
+	return path
+
+
+def _chain_local_traces(traces: List[Any]) -> Any:
+	"""
+	Combine local trace functions of frame into one, which keeps calling
+	the ones still tracing the frame
+
+	:param		traces:	 The local trace functions
+	:type		traces:	 List[Any]
+
+	:returns:	local trace function
+	:rtype:		Any
+	"""
+
+	def trace(frame: Any, event: str, arg: Any) -> Any:
+		nonlocal traces
+		traces = [
+			local
+			for local in (previous(frame, event, arg) for previous in traces)
+			if local is not None
+		]
+
+		return trace if traces else None
+
+	return trace
+
+
+class _TraceDispatcher:
+	"""
+	This class describes the trace function shared by tracers on Python
+	versions without sys.monitoring: only one function can be set with
+	sys.settrace, so it feeds every installed tracer, and the previous trace
+	functions are restored once the last tracer is uninstalled.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.tracers: List[Any] = []
+		self._previous_trace = None
+		self._previous_thread_trace = None
+
+	def add(self, tracer: Any):
+		"""
+		Adds a tracer, setting the trace function for the first one
+
+		:param		tracer:	 The tracer
+		:type		tracer:	 Union[DependencyTracer, LineTracer]
+		"""
+		if not self.tracers:
+			self._previous_trace = sys.gettrace()
+			self._previous_thread_trace = getattr(threading, "_trace_hook", None)
+			sys.settrace(self.trace)
+			threading.settrace(self.trace)
+
+		self.tracers = self.tracers + [tracer]
+
+	def remove(self, tracer: Any):
+		"""
+		Removes a tracer, restoring the previous trace functions after the
+		last one
+
+		:param		tracer:	 The tracer
+		:type		tracer:	 Union[DependencyTracer, LineTracer]
+		"""
+		self.tracers = [added for added in self.tracers if added is not tracer]
+
+		if not self.tracers:
+			sys.settrace(self._previous_trace)
+			threading.settrace(self._previous_thread_trace)
+			self._previous_trace = None
+			self._previous_thread_trace = None
+
+	def trace(self, frame: Any, event: str, arg: Any) -> Any:
+		traces = [
+			local
+			for local in (tracer._trace(frame, event, arg) for tracer in self.tracers)
+			if local is not None
+		]
+
+		if not traces:
+			return None
+
+		return traces[0] if len(traces) == 1 else _chain_local_traces(traces)
+
+
+_dispatcher = _TraceDispatcher()
+
+
+def _acquire_tool_id(name: str) -> Optional[int]:
+	"""
+	Acquire free sys.monitoring tool identifier, the coverage one first
+
+	:param		name:  The tool name
+	:type		name:  str
+
+	:returns:	tool identifier, None if sys.monitoring is unavailable or busy
+	:rtype:		Optional[int]
+	"""
+	monitoring = getattr(sys, "monitoring", None)
+
+	if monitoring is None:
+		return None
+
+	# 3 and 4 are not reserved for any kind of tool
+	for tool_id in (monitoring.COVERAGE_ID, 3, 4):
+		if monitoring.get_tool(tool_id) is None:
+			monitoring.use_tool_id(tool_id, name)
+			return tool_id
+
+	return None
+
+
+class DependencyTracer:
+	"""
+	This class describes a tracer of source files executed by tests.
+
+	It uses sys.monitoring PY_START events when available (Python 3.12+) and
+	falls back to sys.settrace "call" events otherwise. Only function entries
+	are traced, never lines.
+	"""
+
+	def __init__(self, exclusive: bool = True):
+		"""
+		Constructs a new instance.
+
+		:param		exclusive:	Tests run one at a time, so a code object is
+								reported once per test and then disabled
+		:type		exclusive:	bool
+		"""
+		self.exclusive = exclusive
+		self.tool_id: Optional[int] = None
+
+	def install(self):
+		"""
+		Start tracing the process.
+		"""
+		self.tool_id = _acquire_tool_id("pyzitadelle")
+
+		if self.tool_id is not None:
+			monitoring = sys.monitoring
+			monitoring.register_callback(
+				self.tool_id, monitoring.events.PY_START, self._on_start
+			)
+			monitoring.set_events(self.tool_id, monitoring.events.PY_START)
+			return
+
+		_dispatcher.add(self)
+
+	def uninstall(self):
+		"""
+		Stop tracing the process.
+		"""
+		if self.tool_id is not None:
+			monitoring = sys.monitoring
+			monitoring.set_events(self.tool_id, 0)
+			monitoring.register_callback(
+				self.tool_id, monitoring.events.PY_START, None
+			)
+			monitoring.free_tool_id(self.tool_id)
+			self.tool_id = None
+			return
+
+		_dispatcher.remove(self)
+
+	def _on_start(self, code: Any, offset: int) -> Any:
+		recorded = _recording.get()
+
+		if recorded is None:
+			return None
+
+		recorded.add(code)
+
+		return sys.monitoring.DISABLE if self.exclusive else None
+
+	def _trace(self, frame: Any, event: str, arg: Any) -> None:
+		if event == "call":
+			recorded = _recording.get()
+
+			if recorded is not None:
+				recorded.add(frame.f_code)
+
+		return None
+
+	@contextmanager
+	def recording(self, recorded: Set[Any]) -> Iterator[Set[Any]]:
+		"""
+		Record code objects executed in the current context
+
+		:param		recorded:  The set receiving executed code objects
+		:type		recorded:  Set[Any]
+
+		:returns:	the set
+		:rtype:		Iterator[Set[Any]]
+		"""
+		if self.tool_id is not None and self.exclusive:
+			sys.monitoring.restart_events()
+
+		token = _recording.set(recorded)
+
+		try:
+			yield recorded
+		finally:
+			_recording.reset(token)
+
+	def get_files(self, recorded: Iterable[Any]) -> Set[str]:
+		"""
+		Gets the source files of recorded code objects, except ignored ones.
+
+		:param		recorded:  The recorded code objects
+		:type		recorded:  Iterable[Any]
+
+		:returns:	The absolute paths of files.
+		:rtype:		Set[str]
+		"""
+		files = set()
+
+		for code in recorded:
+			path = get_source_path(code.co_filename)
+
+			if path is not None:
+				files.add(path)
+
+		return files
+
+
+def _hash_file(path: str) -> Optional[str]:
+	"""
+	Hash file content
+
+	:param		path:  The path
+	:type		path:  str
+
+	:returns:	sha1 hex digest, None if file is unreadable
+	:rtype:		Optional[str]
+	"""
+	digest = hashlib.sha1()
+
+	try:
+		with open(path, "rb") as file:
+			for chunk in iter(lambda: file.read(65536), b""):
+				digest.update(chunk)
+	except OSError:
+		return None
+
+	return digest.hexdigest()
+
+
+class TestSelection:
+	"""
+	This class describes incremental test selection: source files executed
+	by every test, saved to a JSON file with their content hashes, so later
+	runs skip tests none of whose files have changed. Tests which failed or
+	were never recorded always run.
+
+	File hashes are cached together with mtime and size of the files, so
+	unchanged files are not read again.
+	"""
+
+	def __init__(self, path: Union[str, Path], label: str = "TestCase"):
+		"""
+		Constructs a new instance.
+
+		:param		path:	The dependencies file path
+		:type		path:	Union[str, Path]
+		:param		label:	The test case label
+		:type		label:	str
+		"""
+		self.path = Path(path)
+		self.label = label
+		self._hashes: Dict[str, Optional[str]] = {}
+
+		try:
+			self.data = json.loads(self.path.read_text())
+		except (OSError, ValueError):
+			self.data = {}
+
+		if self.data.get("version") != 1 or self.data.get("python") != sys.version:
+			self.data = {"version": 1, "python": sys.version, "files": {}, "tests": {}}
+
+	def _get_key(self, test_name: str) -> str:
+		return f"{self.label}::{test_name}"
+
+	def get_hash(self, path: str) -> Optional[str]:
+		"""
+		Gets the current content hash of file, once per run.
+
+		:param		path:  The path
+		:type		path:  str
+
+		:returns:	sha1 hex digest, None if file is missing
+		:rtype:		Optional[str]
+		"""
+		if path in self._hashes:
+			return self._hashes[path]
+
+		files = self.data["files"]
+
+		try:
+			stat = os.stat(path)
+		except OSError:
+			files.pop(path, None)
+			self._hashes[path] = None
+			return None
+
+		saved = files.get(path)
+
+		if (
+			saved is not None
+			and saved["mtime_ns"] == stat.st_mtime_ns
+			and saved["size"] == stat.st_size
+		):
+			digest = saved["sha1"]
+		else:
+			digest = _hash_file(path)
+			files[path] = {
+				"mtime_ns": stat.st_mtime_ns,
+				"size": stat.st_size,
+				"sha1": digest,
+			}
+
+		self._hashes[path] = digest
+
+		return digest
+
+	def is_unchanged(self, test_name: str) -> bool:
+		"""
+		Determines whether test passed last time and none of its files have
+		changed since.
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+
+		:returns:	True if test can be skipped, False otherwise.
+		:rtype:		bool
+		"""
+		record = self.data["tests"].get(self._get_key(test_name))
+
+		if record is None or record["failed"]:
+			return False
+
+		return all(
+			self.get_hash(path) == digest for path, digest in record["files"].items()
+		)
+
+	def update(self, test_name: str, files: Iterable[str], failed: bool):
+		"""
+		Replace recorded files of test
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		files:		The files executed by test
+		:type		files:		Iterable[str]
+		:param		failed:		The test failed
+		:type		failed:		bool
+		"""
+		self.data["tests"][self._get_key(test_name)] = {
+			"failed": failed,
+			"files": {path: self.get_hash(path) for path in sorted(files)},
+		}
+
+	def save(self):
+		"""
+		Write dependencies to the file.
+		"""
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+
+		temp_path = self.path.with_name(f"{self.path.name}.tmp")
+		temp_path.write_text(json.dumps(self.data, sort_keys=True))
+		os.replace(temp_path, self.path)
+
+
+def get_code_lines(code: Any) -> Set[int]:
+	"""
+	Gets the lines of function body, without nested functions and the
+	definition line itself.
+
+	:param		code:  The code object
+	:type		code:  CodeType
+
+	:returns:	The line numbers.
+	:rtype:		Set[int]
+	"""
+	return {
+		line
+		for _, line in dis.findlinestarts(code)
+		if line and line != code.co_firstlineno
+	}
+
+
+class LineTracer:
+	"""
+	This class describes a collector of executed lines.
+
+	On Python 3.12+ it uses sys.monitoring LINE events and disables every
+	location after its first hit, so a line costs one callback per test
+	(per run when tests run concurrently, then every line is credited to
+	the first test hitting it). Older versions fall back to sys.settrace,
+	tracing lines of measured files only and stopping as soon as all lines
+	of the frame code have been hit.
+	"""
+
+	def __init__(self, exclusive: bool = True):
+		"""
+		Constructs a new instance.
+
+		:param		exclusive:	Tests run one at a time, so lines are collected
+								again for every test
+		:type		exclusive:	bool
+		"""
+		self.exclusive = exclusive
+		self.tool_id: Optional[int] = None
+		self._code_lines: Dict[Any, frozenset] = {}
+
+	def install(self):
+		"""
+		Start collecting lines of the process.
+		"""
+		self.tool_id = _acquire_tool_id("pyzitadelle-coverage")
+
+		if self.tool_id is not None:
+			monitoring = sys.monitoring
+			monitoring.register_callback(
+				self.tool_id, monitoring.events.LINE, self._on_line
+			)
+			monitoring.set_events(self.tool_id, monitoring.events.LINE)
+			return
+
+		_dispatcher.add(self)
+
+	def uninstall(self):
+		"""
+		Stop collecting lines of the process.
+		"""
+		if self.tool_id is not None:
+			monitoring = sys.monitoring
+			monitoring.set_events(self.tool_id, 0)
+			monitoring.register_callback(self.tool_id, monitoring.events.LINE, None)
+			monitoring.free_tool_id(self.tool_id)
+			self.tool_id = None
+			return
+
+		_dispatcher.remove(self)
+
+	def _on_line(self, code: Any, line: int) -> Any:
+		covered = _covered.get()
+
+		if covered is None:
+			# lines outside of tests are disabled only in ignored files
+			if get_source_path(code.co_filename) is None:
+				return sys.monitoring.DISABLE
+
+			return None
+
+		covered.add((code.co_filename, line))
+
+		return sys.monitoring.DISABLE
+
+	def _get_code_lines(self, code: Any) -> frozenset:
+		lines = self._code_lines.get(code)
+
+		if lines is None:
+			lines = self._code_lines[code] = frozenset(
+				(code.co_filename, line) for line in get_code_lines(code)
+			)
+
+		return lines
+
+	def _trace(self, frame: Any, event: str, arg: Any) -> Any:
+		if event != "call":
+			return None
+
+		covered = _covered.get()
+		code = frame.f_code
+
+		if (
+			covered is None
+			or get_source_path(code.co_filename) is None
+			or covered.issuperset(self._get_code_lines(code))
+		):
+			return None
+
+		return self._trace_lines
+
+	def _trace_lines(self, frame: Any, event: str, arg: Any) -> Any:
+		if event == "line":
+			covered = _covered.get()
+			line = (frame.f_code.co_filename, frame.f_lineno)
+
+			if covered is not None and line not in covered:
+				covered.add(line)
+
+				if covered.issuperset(self._get_code_lines(frame.f_code)):
+					frame.f_trace_lines = False
+
+		return self._trace_lines
+
+	@contextmanager
+	def recording(
+		self, covered: Set[Tuple[str, int]]
+	) -> Iterator[Set[Tuple[str, int]]]:
+		"""
+		Collect lines executed in the current context
+
+		:param		covered:  The set receiving executed lines
+		:type		covered:  Set[Tuple[str, int]]
+
+		:returns:	the set
+		:rtype:		Iterator[Set[Tuple[str, int]]]
+		"""
+		if self.tool_id is not None and self.exclusive:
+			sys.monitoring.restart_events()
+
+		token = _covered.set(covered)
+
+		try:
+			yield covered
+		finally:
+			_covered.reset(token)
+
+	def get_lines(self, covered: Iterable[Tuple[str, int]]) -> Dict[str, Set[int]]:
+		"""
+		Gets the collected lines by measured file.
+
+		:param		covered:  The collected lines
+		:type		covered:  Iterable[Tuple[str, int]]
+
+		:returns:	The lines by absolute path of file.
+		:rtype:		Dict[str, Set[int]]
+		"""
+		lines = {}
+
+		for filename, line in covered:
+			path = get_source_path(filename)
+
+			if path is not None:
+				lines.setdefault(path, set()).add(line)
+
+		return lines
+
+
+def to_numbits(lines: Iterable[int]) -> bytes:
+	"""
+	Pack line numbers to bitmap
+
+	:param		lines:	The line numbers
+	:type		lines:	Iterable[int]
+
+	:returns:	bitmap, bit N of byte N // 8 is set for line N
+	:rtype:		bytes
+	"""
+	lines = list(lines)
+	bits = bytearray(max(lines) // 8 + 1 if lines else 0)
+
+	for line in lines:
+		bits[line // 8] |= 1 << (line % 8)
+
+	return bytes(bits)
+
+
+def from_numbits(bits: bytes) -> List[int]:
+	"""
+	Unpack line numbers from bitmap
+
+	:param		bits:  The bitmap
+	:type		bits:  bytes
+
+	:returns:	sorted line numbers
+	:rtype:		List[int]
+	"""
+	return [
+		index * 8 + bit
+		for index, byte in enumerate(bits)
+		if byte
+		for bit in range(8)
+		if byte & (1 << bit)
+	]
+
+
+def get_executable_lines(path: str) -> Set[int]:
+	"""
+	Gets the lines of functions in source file which have code. Module and
+	class bodies run on import, before any test, so they are not counted.
+
+	:param		path:  The path
+	:type		path:  str
+
+	:returns:	The line numbers, empty if file cannot be compiled.
+	:rtype:		Set[int]
+	"""
+	try:
+		with open(path, "rb") as file:
+			code = compile(file.read(), path, "exec", dont_inherit=True)
+	except (OSError, SyntaxError, ValueError):
+		return set()
+
+	lines = set()
+	codes = [code]
+
+	while codes:
+		code = codes.pop()
+
+		if code.co_flags & inspect.CO_OPTIMIZED:
+			lines.update(get_code_lines(code))
+
+		codes.extend(const for const in code.co_consts if hasattr(const, "co_code"))
+
+	return lines
+
+
+class CoverageData:
+	"""
+	This class describes lines executed by every test, saved to a SQLite
+	file as one bitmap of lines per file and test.
+	"""
+
+	def __init__(self, label: str = "TestCase"):
+		"""
+		Constructs a new instance.
+
+		:param		label:	The test case label
+		:type		label:	str
+		"""
+		self.label = label
+		self.contexts: Dict[str, Dict[str, Set[int]]] = {}
+
+	def add_lines(self, test_name: str, lines: Dict[str, Iterable[int]]):
+		"""
+		Adds lines executed by test.
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		lines:		The lines by absolute path of file
+		:type		lines:		Dict[str, Iterable[int]]
+		"""
+		context = self.contexts.setdefault(f"{self.label}::{test_name}", {})
+
+		for path, numbers in lines.items():
+			context.setdefault(path, set()).update(numbers)
+
+	def get_measured(self) -> Dict[str, Set[int]]:
+		"""
+		Gets the lines executed by any test.
+
+		:returns:	The lines by absolute path of file.
+		:rtype:		Dict[str, Set[int]]
+		"""
+		measured = {}
+
+		for context in self.contexts.values():
+			for path, numbers in context.items():
+				measured.setdefault(path, set()).update(numbers)
+
+		return measured
+
+	def get_summary(self) -> List[Tuple[str, int, int]]:
+		"""
+		Gets the count of executable and missed lines of every measured file.
+
+		:returns:	path, statements and missed statements of every file
+		:rtype:		List[Tuple[str, int, int]]
+		"""
+		summary = []
+
+		for path, numbers in sorted(self.get_measured().items()):
+			statements = get_executable_lines(path)
+			summary.append((path, len(statements), len(statements - numbers)))
+
+		return summary
+
+	def write(self, path: Union[str, Path]):
+		"""
+		Write lines to the SQLite file, replacing contexts of the test case.
+
+		:param		path:  The path
+		:type		path:  Union[str, Path]
+		"""
+		connection = sqlite3.connect(str(path))
+
+		try:
+			with connection:
+				connection.executescript(
+					"""
+					CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+					CREATE TABLE IF NOT EXISTS file (id INTEGER PRIMARY KEY, path TEXT UNIQUE);
+					CREATE TABLE IF NOT EXISTS context (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+					CREATE TABLE IF NOT EXISTS line_bits (
+						file_id INTEGER, context_id INTEGER, numbits BLOB,
+						PRIMARY KEY (file_id, context_id)
+					);
+					"""
+				)
+				connection.execute(
+					"INSERT OR REPLACE INTO meta VALUES ('version', '1')"
+				)
+
+				for name, context in self.contexts.items():
+					connection.execute(
+						"INSERT OR IGNORE INTO context (name) VALUES (?)", (name,)
+					)
+					(context_id,) = connection.execute(
+						"SELECT id FROM context WHERE name = ?", (name,)
+					).fetchone()
+					connection.execute(
+						"DELETE FROM line_bits WHERE context_id = ?", (context_id,)
+					)
+
+					for file_path, numbers in context.items():
+						connection.execute(
+							"INSERT OR IGNORE INTO file (path) VALUES (?)", (file_path,)
+						)
+						(file_id,) = connection.execute(
+							"SELECT id FROM file WHERE path = ?", (file_path,)
+						).fetchone()
+						connection.execute(
+							"INSERT INTO line_bits VALUES (?, ?, ?)",
+							(file_id, context_id, to_numbits(numbers)),
+						)
+		finally:
+			connection.close()
+
+	@classmethod
+	def read(cls, path: Union[str, Path]) -> "CoverageData":
+		"""
+		Read lines of all test cases from the SQLite file
+
+		:param		path:  The path
+		:type		path:  Union[str, Path]
+
+		:returns:	coverage data
+		:rtype:		CoverageData
+		"""
+		data = cls()
+		connection = sqlite3.connect(str(path))
+
+		try:
+			rows = connection.execute(
+				"SELECT context.name, file.path, line_bits.numbits FROM line_bits "
+				"JOIN file ON file.id = line_bits.file_id "
+				"JOIN context ON context.id = line_bits.context_id"
+			)
+
+			for name, file_path, numbits in rows:
+				data.contexts.setdefault(name, {})[file_path] = set(
+					from_numbits(numbits)
+				)
+		finally:
+			connection.close()
+
+		return data
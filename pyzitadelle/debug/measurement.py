@@ -2,7 +2,7 @@ from functools import wraps
 from time import time
 from typing import Callable
 
-from rich import print
+from pyzitadelle.reporter import print
 
 
 def async_debug_measurement(label: str = "measurement") -> Callable:
@@ -73,3 +73,25 @@ class FixtureError(TestError):
 		:rtype:		str
 		"""
 		return f"FixtureError has been raised. {self.get_explanation()}"
+
+
+class TestTimeoutError(TestError):
+	def __str__(self):
+		"""
+		Returns a string representation of the object.
+
+		:returns:	String representation of the object.
+		:rtype:		str
+		"""
+		return f"TestTimeoutError has been raised. {self.get_explanation()}"
+
+
+class CollectionError(TestError):
+	def __str__(self):
+		"""
+		Returns a string representation of the object.
+
+		:returns:	String representation of the object.
+		:rtype:		str
+		"""
+		return f"CollectionError has been raised. {self.get_explanation()}"
@@ -0,0 +1,305 @@
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pyzitadelle.exceptions import FixtureError
+from pyzitadelle.standard import Fixture
+
+FIXTURE_SCOPES = ("test", "case", "session")
+
+
+class FixtureScope:
+	"""
+	This class describes a cache of fixture values living as long as its
+	scope: a test invocation, a test case run or the whole session.
+
+	Values are keyed by fixture handler, not by name, as the session scope
+	is shared by test cases which may define fixtures with the same name.
+	"""
+
+	def __init__(self, name: str):
+		"""
+		Constructs a new instance.
+
+		:param		name:  The scope name
+		:type		name:  str
+		"""
+		self.name = name
+		self.tasks: Dict[Callable, asyncio.Future] = {}
+		self.instances: List[Fixture] = []
+
+	async def teardown(self):
+		"""
+		Finalize generator fixtures in reverse order of their setup.
+
+		A failing fixture does not stop the others from being finalized, the
+		errors of all of them are raised together once they are done.
+
+		:raises		FixtureError:  fixture teardown failed or its generator yields more than once
+		"""
+		instances, self.instances = self.instances, []
+		self.tasks.clear()
+		errors = []
+
+		for instance in reversed(instances):
+			try:
+				await self._finalize(instance)
+			except Exception as ex:
+				errors.append(ex)
+
+		if errors:
+			raise FixtureError(
+				"Teardown of fixtures failed: "
+				+ "; ".join(
+					ex.message
+					if isinstance(ex, FixtureError)
+					else f"{type(ex).__name__}: {ex}"
+					for ex in errors
+				)
+			) from errors[0]
+
+	async def _finalize(self, instance: Fixture):
+		"""
+		Finalize generator fixture
+
+		:param		instance:	   The fixture instance
+		:type		instance:	   Fixture
+
+		:raises		FixtureError:  fixture generator yields more than once
+		"""
+		name = instance.handler.__name__
+
+		if inspect.isasyncgen(instance.gen):
+			try:
+				await instance.gen.__anext__()
+			except StopAsyncIteration:
+				return
+
+			await instance.gen.aclose()
+			raise FixtureError(f"Fixture {name} yields more than once")
+		elif inspect.isgenerator(instance.gen):
+			try:
+				next(instance.gen)
+			except StopIteration:
+				return
+
+			instance.gen.close()
+			raise FixtureError(f"Fixture {name} yields more than once")
+
+
+SESSION_SCOPE = FixtureScope("session")
+
+
+class FixtureResolver:
+	"""
+	This class describes a resolver of fixtures by parameter name.
+
+	Every fixture is set up at most once per scope instance; fixtures which
+	do not depend on each other are set up concurrently.
+	"""
+
+	def __init__(self, fixtures: Dict[str, Fixture]):
+		"""
+		Constructs a new instance.
+
+		:param		fixtures:  The registered fixtures
+		:type		fixtures:  Dict[str, Fixture]
+		"""
+		self.fixtures = fixtures
+		self.case_scope = FixtureScope("case")
+		self._requests: Dict[Any, Tuple[str, ...]] = {}
+
+	def get_requested(
+		self, func: Any, args: Iterable[Any] = (), kwargs: Optional[dict] = None
+	) -> Tuple[str, ...]:
+		"""
+		Gets the names of fixtures requested by function parameters, except
+		those already passed in args and kwargs.
+
+		:param		func:	 The function
+		:type		func:	 Callable
+		:param		args:	 The arguments
+		:type		args:	 list
+		:param		kwargs:	 The keywords arguments
+		:type		kwargs:	 dictionary
+
+		:returns:	fixture names
+		:rtype:		Tuple[str, ...]
+		"""
+		if not self.fixtures:
+			return ()
+
+		parameters = self._requests.get(func)
+
+		if parameters is None:
+			try:
+				parameters = tuple(inspect.signature(func).parameters)
+			except (TypeError, ValueError):
+				parameters = ()
+
+			self._requests[func] = parameters
+
+		skipped = len(tuple(args))
+		kwargs = kwargs or {}
+
+		return tuple(
+			name
+			for name in parameters[skipped:]
+			if name in self.fixtures and name not in kwargs
+		)
+
+	def _get_scope(self, fixture: Fixture, test_scope: FixtureScope) -> FixtureScope:
+		"""
+		Gets the scope instance caching the fixture.
+
+		:param		fixture:	 The fixture
+		:type		fixture:	 Fixture
+		:param		test_scope:	 The scope of current test invocation
+		:type		test_scope:	 FixtureScope
+
+		:returns:	The scope.
+		:rtype:		FixtureScope
+		"""
+		scope = fixture.metadata.scope
+
+		if scope == "session":
+			return SESSION_SCOPE
+		elif scope == "case":
+			return self.case_scope
+
+		return test_scope
+
+	async def resolve(
+		self,
+		names: Iterable[str],
+		test_scope: FixtureScope,
+		requested_by: Tuple[str, ...] = (),
+	) -> Dict[str, Any]:
+		"""
+		Resolve fixtures by names concurrently
+
+		:param		names:		   The fixture names
+		:type		names:		   Iterable[str]
+		:param		test_scope:	   The scope of current test invocation
+		:type		test_scope:	   FixtureScope
+		:param		requested_by:  The chain of dependent fixtures
+		:type		requested_by:  Tuple[str, ...]
+
+		:returns:	fixture values by name
+		:rtype:		Dict[str, Any]
+		"""
+		names = tuple(names)
+		values = await asyncio.gather(
+			*(self._resolve(name, test_scope, requested_by) for name in names)
+		)
+
+		return dict(zip(names, values))
+
+	async def _resolve(
+		self, name: str, test_scope: FixtureScope, requested_by: Tuple[str, ...]
+	) -> Any:
+		"""
+		Resolve fixture by name, reusing the value cached in its scope
+
+		:param		name:		   The fixture name
+		:type		name:		   str
+		:param		test_scope:	   The scope of current test invocation
+		:type		test_scope:	   FixtureScope
+		:param		requested_by:  The chain of dependent fixtures
+		:type		requested_by:  Tuple[str, ...]
+
+		:returns:	fixture value
+		:rtype:		Any
+
+		:raises		FixtureError:  unknown or circular fixture
+		"""
+		if name in requested_by:
+			raise FixtureError(
+				f"Circular fixture dependency: {' -> '.join(requested_by + (name,))}"
+			)
+
+		fixture = self.fixtures.get(name)
+
+		if fixture is None:
+			raise FixtureError(f"Unknown fixture {name}")
+
+		scope = self._get_scope(fixture, test_scope)
+		task = scope.tasks.get(fixture.handler)
+
+		if task is None:
+			task = scope.tasks[fixture.handler] = asyncio.ensure_future(
+				self._setup(fixture, scope, test_scope, requested_by + (name,))
+			)
+
+		try:
+			return await task
+		except Exception:
+			# failed setup is not cached, the next test tries again
+			if scope.tasks.get(fixture.handler) is task:
+				del scope.tasks[fixture.handler]
+
+			raise
+
+	async def _setup(
+		self,
+		fixture: Fixture,
+		scope: FixtureScope,
+		test_scope: FixtureScope,
+		requested_by: Tuple[str, ...],
+	) -> Any:
+		"""
+		Set up fixture and its dependencies
+
+		:param		fixture:	   The fixture
+		:type		fixture:	   Fixture
+		:param		scope:		   The scope caching the fixture
+		:type		scope:		   FixtureScope
+		:param		test_scope:	   The scope of current test invocation
+		:type		test_scope:	   FixtureScope
+		:param		requested_by:  The chain of dependent fixtures
+		:type		requested_by:  Tuple[str, ...]
+
+		:returns:	fixture value
+		:rtype:		Any
+
+		:raises		FixtureError:  fixture setup failed
+		"""
+		handler = fixture.handler
+		requested = self.get_requested(handler)
+
+		for name in requested:
+			dependency = self.fixtures[name]
+
+			if FIXTURE_SCOPES.index(dependency.metadata.scope) < FIXTURE_SCOPES.index(
+				fixture.metadata.scope
+			):
+				raise FixtureError(
+					f"Fixture {handler.__name__} with {fixture.metadata.scope} scope "
+					f"depends on {name} with {dependency.metadata.scope} scope"
+				)
+
+		kwargs = await self.resolve(requested, test_scope, requested_by)
+		instance = Fixture(handler=handler)
+
+		try:
+			value = handler(**kwargs)
+
+			if inspect.isasyncgen(value):
+				instance.gen = value
+				value = await value.__anext__()
+			elif inspect.isgenerator(value):
+				instance.gen = value
+				value = next(value)
+			elif inspect.isawaitable(value):
+				value = await value
+		except FixtureError:
+			raise
+		except Exception as ex:
+			raise FixtureError(
+				f"Fixture {handler.__name__} failed: {ex!r}"
+			) from ex
+
+		instance.resolved_val = value
+		scope.instances.append(instance)
+
+		return value
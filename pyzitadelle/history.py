@@ -0,0 +1,179 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pyzitadelle.exceptions import TestValidationError
+from pyzitadelle.results import ResultListener
+from pyzitadelle.standard import FAILED_STATUSES, TestOutcome, TestResult
+
+ORDERS = ("registration", "failed-first", "longest-first")
+ONLY = ("last-failed",)
+
+
+class RunHistory(ResultListener):
+	"""
+	This class describes outcomes and durations of tests from previous runs,
+	saved to a JSON file when the run ends.
+
+	A test is failed if any of its cases failed the session (error, timeout
+	or unexpected pass); its duration is the total of all invocations.
+	Skipped and dry run tests keep their previous record, and so does the
+	duration of tests whose cases were not executed (cached ones).
+	"""
+
+	def __init__(self, path: Union[str, Path], label: str = "TestCase"):
+		"""
+		Constructs a new instance.
+
+		:param		path:	The history file path
+		:type		path:	Union[str, Path]
+		:param		label:	The test case label
+		:type		label:	str
+		"""
+		self.path = Path(path)
+		self.label = label
+		self.current: Dict[str, dict] = {}
+
+		try:
+			self.data = json.loads(self.path.read_text())
+		except (OSError, ValueError):
+			self.data = {}
+
+		if self.data.get("version") != 1:
+			self.data = {"version": 1, "tests": {}}
+
+	def _get_key(self, test_name: str) -> str:
+		return f"{self.label}::{test_name}"
+
+	def get_record(self, test_name: str) -> Optional[dict]:
+		"""
+		Gets the record of test from previous runs.
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+
+		:returns:	record with failed flag and duration, None if test never ran
+		:rtype:		Optional[dict]
+		"""
+		return self.data["tests"].get(self._get_key(test_name))
+
+	def is_failed(self, test_name: str) -> bool:
+		"""
+		Determines whether test failed the last time it ran.
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+
+		:returns:	True if test failed, False otherwise.
+		:rtype:		bool
+		"""
+		record = self.get_record(test_name)
+
+		return record is not None and record["failed"]
+
+	def get_duration(self, test_name: str) -> Optional[int]:
+		"""
+		Gets the duration of test the last time it ran.
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+
+		:returns:	duration in nanoseconds, None if test never ran
+		:rtype:		Optional[int]
+		"""
+		record = self.get_record(test_name)
+
+		return record["duration_ns"] if record is not None else None
+
+	def add_result(self, test_name: str, line: int, test_result: TestResult):
+		if test_result.status in ("skip", "dryrun"):
+			return
+
+		record = self.current.setdefault(
+			test_name, {"failed": False, "duration_ns": 0}
+		)
+		record["failed"] = record["failed"] or test_result.status in FAILED_STATUSES
+		record["duration_ns"] += sum(
+			invocation.duration_ns
+			for invocation in test_result.invocations
+			if invocation.outcome != TestOutcome.SKIP
+		)
+
+	def select(
+		self,
+		tests: Dict[str, Any],
+		order: Optional[str] = None,
+		only: Optional[str] = None,
+	) -> Dict[str, Any]:
+		"""
+		Select and order tests by their history
+
+		"failed-first" runs tests which failed last time before the rest,
+		"longest-first" runs tests by their last duration, the ones which never
+		ran first. Both orders are stable. "last-failed" runs only the tests
+		which failed last time, or all of them if none failed.
+
+		:param		tests:	The tests by name in registration order
+		:type		tests:	Dict[str, TestInfo]
+		:param		order:	The order: "registration" (default), "failed-first" or "longest-first"
+		:type		order:	Optional[str]
+		:param		only:	The filter: "last-failed"
+		:type		only:	Optional[str]
+
+		:returns:	selected tests by name in run order
+		:rtype:		Dict[str, TestInfo]
+
+		:raises		TestValidationError:  unknown order or filter
+		"""
+		if order is not None and order not in ORDERS:
+			raise TestValidationError(f"order must be one of {', '.join(ORDERS)}")
+
+		if only is not None and only not in ONLY:
+			raise TestValidationError(f"only must be one of {', '.join(ONLY)}")
+
+		names = list(tests)
+
+		if only == "last-failed":
+			names = [name for name in names if self.is_failed(name)] or names
+
+		if order == "failed-first":
+			names.sort(key=lambda name: not self.is_failed(name))
+		elif order == "longest-first":
+			names.sort(key=self._get_longest_key)
+
+		return {name: tests[name] for name in names}
+
+	def _get_longest_key(self, test_name: str) -> tuple:
+		duration = self.get_duration(test_name)
+
+		return (duration is not None, -(duration or 0))
+
+	def close(self):
+		"""
+		Merge results of the run into history and write it to the file.
+		"""
+		tests = self.data["tests"]
+
+		for test_name, record in self.current.items():
+			key = self._get_key(test_name)
+			previous = tests.get(key)
+
+			if not record["duration_ns"] and previous is not None:
+				record["duration_ns"] = previous["duration_ns"]
+
+			record["updated_at"] = time.time()
+			tests[key] = record
+
+		self.current = {}
+
+		try:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+
+			temp_path = self.path.with_name(f"{self.path.name}.tmp")
+			temp_path.write_text(json.dumps(self.data, sort_keys=True))
+			os.replace(temp_path, self.path)
+		except OSError:
+			# history is an optimization of the next run, it must not fail this one
+			pass
@@ -0,0 +1,149 @@
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from pyzitadelle.standard import Argument, Each, Product
+
+
+def as_argument(value: Any) -> Argument:
+	"""
+	Convert item of parametrization source to argument set: tuples are
+	positional arguments, dicts are keyword arguments, anything else is the
+	single positional argument.
+
+	:param		value:	The value
+	:type		value:	Any
+
+	:returns:	argument set
+	:rtype:		Argument
+	"""
+	if isinstance(value, Argument):
+		return value
+	elif isinstance(value, tuple):
+		return Argument(args=value)
+	elif isinstance(value, dict):
+		return Argument(kwargs=value)
+
+	return Argument(args=(value,))
+
+
+def _reiterable(axis: Any) -> Iterable[Any]:
+	"""
+	Gets the values of axis which can be iterated more than once, one-shot
+	iterators are materialized.
+
+	:param		axis:  The axis
+	:type		axis:  Union[Each, Iterable[Any]]
+
+	:returns:	values of axis
+	:rtype:		Iterable[Any]
+	"""
+	if isinstance(axis, Each):
+		axis = axis.args
+
+	return tuple(axis) if iter(axis) is axis else axis
+
+
+def _iter_product(axes: Tuple[Any, ...]) -> Iterator[Tuple[Any, ...]]:
+	"""
+	Iterate over cartesian product of axes lazily, the first axis is consumed
+	only once so it may be a generator.
+
+	:param		axes:  The axes
+	:type		axes:  Tuple[Any, ...]
+
+	:returns:	combinations of values
+	:rtype:		Iterator[Tuple[Any, ...]]
+	"""
+	if not axes:
+		yield ()
+		return
+
+	first = axes[0].args if isinstance(axes[0], Each) else axes[0]
+	rest = tuple(_reiterable(axis) for axis in axes[1:])
+
+	for value in first:
+		for values in _iter_product(rest):
+			yield (value,) + values
+
+
+def iter_arguments(source: Any) -> Iterator[Argument]:
+	"""
+	Iterate over argument sets of parametrization source lazily
+
+	The source is an iterable of argument sets (`Argument`, tuple, dict or
+	single value), an `Each` of single values, a `Product` of axes, or a
+	callable without arguments returning one of those; a callable is called
+	on every run, so its generators are not exhausted by the previous one.
+
+	:param		source:	 The parametrization source
+	:type		source:	 Any
+
+	:returns:	argument sets
+	:rtype:		Iterator[Argument]
+	"""
+	if callable(source) and not isinstance(source, (Each, Product)):
+		source = source()
+
+	if isinstance(source, Each):
+		for value in source.args:
+			yield Argument(args=(value,))
+	elif isinstance(source, Product):
+		names = tuple(source.named_axes)
+		count = len(source.axes)
+
+		for values in _iter_product(source.axes + tuple(source.named_axes.values())):
+			yield Argument(
+				args=values[:count], kwargs=dict(zip(names, values[count:]))
+			)
+	else:
+		for value in source:
+			yield as_argument(value)
+
+
+def iter_cases(source: Any) -> Iterator[Tuple[Optional[int], Optional[Argument]]]:
+	"""
+	Iterate over cases of parametrization source: every argument set with
+	its index, or a single case without arguments if the source gives no
+	argument sets. The source is never asked for its length, so generators
+	are not consumed ahead.
+
+	:param		source:	 The parametrization source, see iter_arguments
+	:type		source:	 Any
+
+	:returns:	argument index and argument set of every case
+	:rtype:		Iterator[Tuple[Optional[int], Optional[Argument]]]
+	"""
+	arguments = iter_arguments(source)
+	first = next(arguments, None)
+
+	if first is None:
+		yield None, None
+		return
+
+	yield from enumerate(chain((first,), arguments))
+
+
+def describe_argument(argument: Optional[Argument], width: Optional[int] = None) -> str:
+	"""
+	Describe argument set in one line, as it is passed to the test
+
+	:param		argument:  The argument set
+	:type		argument:  Optional[Argument]
+	:param		width:	   The maximum width, unlimited by default
+	:type		width:	   Optional[int]
+
+	:returns:	arguments as in call
+	:rtype:		str
+	"""
+	if argument is None:
+		return ""
+
+	text = ", ".join(
+		[repr(value) for value in argument.args]
+		+ [f"{name}={value!r}" for name, value in argument.kwargs.items()]
+	)
+
+	if width is None or len(text) <= width:
+		return text
+
+	return f"{text[: width - 3]}..."
@@ -0,0 +1,215 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pyzitadelle.history import RunHistory
+from pyzitadelle.parametrize import describe_argument, iter_cases
+from pyzitadelle.standard import Marker, SkipMarker, TestRecord
+
+
+def _evaluate_marker(marker: Marker) -> Tuple[bool, Optional[str]]:
+	"""
+	Evaluate marker condition, catching its error
+
+	:param		marker:	 The marker
+	:type		marker:	 Marker
+
+	:returns:	whether marker is active and the error of its condition
+	:rtype:		Tuple[bool, Optional[str]]
+	"""
+	try:
+		return marker.active, None
+	except Exception as ex:
+		return False, f"{type(ex).__name__}: {ex}"
+
+
+def evaluate_markers(
+	records: Iterable[TestRecord], threads: Optional[int] = None
+) -> Tuple[Dict[str, bool], Dict[str, str]]:
+	"""
+	Evaluate markers of tests: callable conditions run concurrently in a
+	thread pool, as they may probe services or files, the others are read
+	as they are
+
+	A condition which raises does not stop the others; the runner reports
+	its test as an error, so the test is left out of active markers and its
+	error is returned instead.
+
+	:param		records:  The test records
+	:type		records:  Iterable[TestRecord]
+	:param		threads:  The count of threads, 32 at most by default
+	:type		threads:  Optional[int]
+
+	:returns:	whether marker is active by test name (tests without marker are left out) and errors of conditions by test name
+	:rtype:		Tuple[Dict[str, bool], Dict[str, str]]
+	"""
+	active = {}
+	errors = {}
+	conditions = {}
+
+	for record in records:
+		if record.marker is None:
+			continue
+
+		if callable(record.marker.when):
+			conditions[record.name] = record.marker
+		else:
+			active[record.name] = bool(record.marker.when)
+
+	if conditions:
+		with ThreadPoolExecutor(
+			max_workers=threads or min(32, len(conditions)),
+			thread_name_prefix="pyzitadelle-plan",
+		) as executor:
+			for name, (is_active, error) in zip(
+				conditions, executor.map(_evaluate_marker, conditions.values())
+			):
+				if error is None:
+					active[name] = is_active
+				else:
+					errors[name] = error
+
+	return active, errors
+
+
+def _plan_marker(marker: Optional[Marker], active: bool) -> Optional[Dict[str, Any]]:
+	if marker is None:
+		return None
+
+	return {"name": marker.name, "reason": marker.reason, "active": active}
+
+
+def build_plan(
+	label: str,
+	tests: Dict[str, Union[Awaitable, Callable]],
+	tags: Optional[List[str]] = None,
+	history: Optional[RunHistory] = None,
+	threads: Optional[int] = None,
+) -> Dict[str, Any]:
+	"""
+	Build the plan of run without executing tests: every test with its tags,
+	marker, expanded cases and duration estimated from history
+
+	Skip reasons are decided as the runner decides them, and so are errors
+	of marker conditions, which fail their tests without running any case.
+	Tests which never ran have no duration of their own; the total estimate
+	counts them with the mean one.
+
+	:param		label:	  The test case label
+	:type		label:	  str
+	:param		tests:	  The tests by name in run order
+	:type		tests:	  Dict[str, TestInfo]
+	:param		tags:	  The tags of skipped tests
+	:type		tags:	  Optional[List[str]]
+	:param		history:  The run history
+	:type		history:  Optional[RunHistory]
+	:param		threads:  The count of threads evaluating marker conditions
+	:type		threads:  Optional[int]
+
+	:returns:	plan
+	:rtype:		Dict[str, Any]
+	"""
+	records = [TestRecord.from_test(test) for test in tests.values()]
+	active, errors = evaluate_markers(records, threads)
+	planned = []
+	known = []
+
+	for test_name, record in zip(tests, records):
+		skip = None
+		error = errors.get(record.name)
+
+		if tags and not record.tags.isdisjoint(tags):
+			skip = "tags"
+		elif isinstance(record.marker, SkipMarker) and active.get(record.name):
+			skip = record.marker.reason if record.marker.reason else "SkippedTest"
+
+		cases = []
+
+		if skip is None and error is None:
+			cases = [
+				{"index": index, "arguments": describe_argument(argument)}
+				for index, argument in iter_cases(record.arguments)
+			]
+
+		duration = history.get_duration(test_name) if history is not None else None
+
+		if skip is None and error is None and duration is not None:
+			known.append(duration)
+
+		planned.append(
+			{
+				"name": test_name,
+				"line": record.line,
+				"async": record.is_async,
+				"tags": sorted(record.tags),
+				"comment": record.comment,
+				"marker": _plan_marker(record.marker, active.get(record.name, False)),
+				"skip": skip,
+				"error": error,
+				"launches": record.count_of_launchs,
+				"timeout": record.timeout,
+				"benchmark": record.benchmark is not None,
+				"cacheable": record.cacheable,
+				"cases": cases,
+				"estimated_duration_ns": duration,
+			}
+		)
+
+	mean = sum(known) // len(known) if known else 0
+
+	return {
+		"label": label,
+		"tests": planned,
+		"total_tests": len(planned),
+		"total_cases": sum(len(test["cases"]) for test in planned),
+		"estimated_duration_ns": sum(
+			mean if test["estimated_duration_ns"] is None else test["estimated_duration_ns"]
+			for test in planned
+			if test["skip"] is None
+		),
+	}
+
+
+def merge_plans(plans: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+	"""
+	Merge plans of test cases into the plan of session
+
+	:param		plans:	The plans
+	:type		plans:	Iterable[Dict[str, Any]]
+
+	:returns:	merged plan
+	:rtype:		Dict[str, Any]
+	"""
+	plans = list(plans)
+
+	return {
+		"test_cases": plans,
+		"total_tests": sum(plan["total_tests"] for plan in plans),
+		"total_cases": sum(plan["total_cases"] for plan in plans),
+		"estimated_duration_ns": sum(plan["estimated_duration_ns"] for plan in plans),
+	}
+
+
+def write_plan(path: Optional[Union[str, Path]], plan: Dict[str, Any]):
+	"""
+	Write plan as JSON to file, or indented to stdout without path
+
+	:param		path:  The path
+	:type		path:  Optional[Union[str, Path]]
+	:param		plan:  The plan
+	:type		plan:  Dict[str, Any]
+	"""
+	if path is None:
+		sys.stdout.write(json.dumps(plan, indent=2) + "\n")
+		sys.stdout.flush()
+		return
+
+	path = Path(path)
+	path.parent.mkdir(parents=True, exist_ok=True)
+
+	temp_path = path.with_name(f"{path.name}.tmp")
+	temp_path.write_text(json.dumps(plan))
+	os.replace(temp_path, path)
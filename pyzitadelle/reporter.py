@@ -1,15 +1,217 @@
+import os
 import platform
 import shutil
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple, Union
 
-from rich import box, print
-from rich.console import Console
-from rich.table import Table
+from pyzitadelle.exceptions import TestValidationError
+
+
+def print(*objects: Any, **kwargs):
+	"""
+	Print objects with rich markup, rich is imported on first use.
+
+	:param		objects:  The objects
+	:type		objects:  list
+	:param		kwargs:	  The keywords arguments
+	:type		kwargs:	  dictionary
+	"""
+	from rich import print as rich_print
+
+	rich_print(*objects, **kwargs)
+
+
+def print_banner(version: str):
+	"""
+	Prints the pyzitadelle banner.
+
+	:param		version:  The version
+	:type		version:  str
+	"""
+	print(
+		f"""[white]
+                 _ __          __    ____
+   ___ __ _____ (_) /____ ____/ /__ / / /__
+  / _ \\/ // /_ // / __/ _ `/ _	 / -_) // -_)
+ / .__/\\_, //__/_/\\__/\\_,_/\\_,_/\\__/_/_/\\__/	  [bold]v{version}[/bold]
+/_/	  /___/[/white]
+	"""
+	)
+
+
+def _get_percent(count: int, total: int) -> int:
+	"""
+	Gets the percent of count in total, 0 for empty total.
+
+	:param		count:	The count
+	:type		count:	int
+	:param		total:	The total
+	:type		total:	int
+
+	:returns:	The percent.
+	:rtype:		int
+	"""
+	return int((count / total) * 100) if total else 0
+
+
+def _get_cover(statements: int, missed: int) -> str:
+	"""
+	Gets the covered percent of statements.
+
+	:param		statements:	 The count of statements
+	:type		statements:	 int
+	:param		missed:		 The count of missed statements
+	:type		missed:		 int
+
+	:returns:	The percent.
+	:rtype:		str
+	"""
+	if not statements:
+		return "100%"
+
+	return f"{(statements - missed) / statements * 100:.0f}%"
+
+
+def _get_results_rows(
+	total: int,
+	passed: int,
+	warnings: int,
+	errors: int,
+	skipped: int,
+	timeouts: int = 0,
+	xfailed: int = 0,
+	xpassed: int = 0,
+) -> List[Tuple[str, str, str, Optional[str]]]:
+	"""
+	Gets the rows of results table: count, label, percent and rich style;
+	timeouts, expected failures and unexpected passes only if there are any.
+
+	:returns:	The rows.
+	:rtype:		List[Tuple[str, str, str, Optional[str]]]
+	"""
+	rows = [(str(total), "Total", "100%", None)]
+
+	for count, label, style, optional in (
+		(passed, "Passed", "black bold on green", False),
+		(warnings, "Warnings", "black bold on yellow", False),
+		(errors, "Errors", "black bold on red", False),
+		(skipped, "Skipped", "black bold on blue", False),
+		(timeouts, "Timeouts", "black bold on magenta", True),
+		(xfailed, "Expected failures", "black bold on cyan", True),
+		(xpassed, "Unexpected passes", "black bold on red", True),
+	):
+		if count or not optional:
+			rows.append((str(count), label, f"{_get_percent(count, total)}%", style))
+
+	return rows
+
+
+def _get_case_name(item: Any) -> str:
+	"""
+	Gets the name of test case with its argument index.
+
+	:param		item:  The durations or benchmark of test case
+	:type		item:  Union[TestDurations, BenchmarkStats]
+
+	:returns:	The name.
+	:rtype:		str
+	"""
+	if item.argument_index is not None:
+		return f"{item.name}[{item.argument_index}]"
+
+	return item.name
+
+
+def _get_durations_rows(durations: list) -> List[Tuple[str, ...]]:
+	return [
+		(
+			_get_case_name(item),
+			str(item.launches),
+			f"{item.total_ns / 1e9:.6f}s",
+			f"{item.min_ns / 1e9:.6f}s",
+			f"{item.mean_ns / 1e9:.6f}s",
+			f"{item.max_ns / 1e9:.6f}s",
+		)
+		for item in durations
+	]
+
+
+def _get_benchmarks_rows(benchmarks: list) -> List[Tuple[str, ...]]:
+	return [
+		(
+			_get_case_name(item),
+			f"{item.rounds}x{item.iterations}",
+			f"{item.min * 1e6:.3f}us",
+			f"{item.median * 1e6:.3f}us",
+			f"{item.p95 * 1e6:.3f}us",
+			f"{item.stddev * 1e6:.3f}us",
+			f"{item.ops:,.1f}",
+		)
+		for item in benchmarks
+	]
+
+
+def _get_regressions_rows(regressions: list) -> List[Tuple[str, ...]]:
+	return [
+		(
+			item.key,
+			f"{item.baseline_median * 1e6:.3f}us",
+			f"{item.median * 1e6:.3f}us",
+			f"+{item.change * 100:.1f}%",
+		)
+		for item in regressions
+	]
+
+
+def _get_coverage_rows(summary: list) -> List[Tuple[str, ...]]:
+	"""
+	Gets the rows of coverage table, the last one is the total.
+
+	:param		summary:  The path, statements and missed statements of files
+	:type		summary:  List[Tuple[str, int, int]]
+
+	:returns:	The rows.
+	:rtype:		List[Tuple[str, ...]]
+	"""
+	rows = []
+	total_statements = total_missed = 0
+
+	for path, statements, missed in summary:
+		total_statements += statements
+		total_missed += missed
+		rows.append(
+			(
+				os.path.relpath(path),
+				str(statements),
+				str(missed),
+				_get_cover(statements, missed),
+			)
+		)
+
+	rows.append(
+		(
+			"Total",
+			str(total_statements),
+			str(total_missed),
+			_get_cover(total_statements, total_missed),
+		)
+	)
+
+	return rows
 
 
 def print_results_table(
-	total: int, passed: int, warnings: int, errors: int, skipped: int
+	total: int,
+	passed: int,
+	warnings: int,
+	errors: int,
+	skipped: int,
+	timeouts: int = 0,
+	xfailed: int = 0,
+	xpassed: int = 0,
 ):
 	"""
 	Prints a results table.
@@ -24,32 +226,139 @@ def print_results_table(
 	:type       errors:    int
 	:param      skipped:   The skipped
 	:type       skipped:   int
+	:param      timeouts:  The timeouts
+	:type       timeouts:  int
+	:param      xfailed:   The expected failures
+	:type       xfailed:   int
+	:param      xpassed:   The unexpected passes
+	:type       xpassed:   int
 	"""
+	from rich import box
+	from rich.console import Console
+	from rich.table import Table
+
 	table = Table(title="Tests Result", expand=True, box=box.ROUNDED)
 
 	table.add_column("N", style="cyan")
 	table.add_column("Tests encountered", style="cyan")
 	table.add_column("Percent", style="cyan")
 
-	passed_percent = int((passed / total) * 100)
-	warnings_percent = int((warnings / total) * 100)
-	errors_percent = int((errors / total) * 100)
-	skipped_percent = int((skipped / total) * 100)
+	for *row, style in _get_results_rows(
+		total, passed, warnings, errors, skipped, timeouts, xfailed, xpassed
+	):
+		table.add_row(*row, style=style)
 
-	table.add_row(str(total), "Total", "100%")
-	table.add_row(
-		str(passed), "Passed", f"{passed_percent}%", style="black bold on green"
-	)
-	table.add_row(
-		str(warnings), "Warnings", f"{warnings_percent}%", style="black bold on yellow"
-	)
-	table.add_row(
-		str(errors), "Errors", f"{errors_percent}%", style="black bold on red"
-	)
-	table.add_row(
-		str(skipped), "Skipped", f"{skipped_percent}%", style="black bold on blue"
+	console = Console()
+	console.print(table)
+
+
+def print_durations(durations: list):
+	"""
+	Prints a durations table of the slowest tests.
+
+	:param		durations:	The durations
+	:type		durations:	List[TestDurations]
+	"""
+	from rich import box
+	from rich.console import Console
+	from rich.table import Table
+
+	table = Table(title="Slowest tests", expand=True, box=box.ROUNDED)
+
+	table.add_column("Test", style="cyan")
+	table.add_column("Launches", justify="right")
+	table.add_column("Total", justify="right")
+	table.add_column("Min", justify="right")
+	table.add_column("Mean", justify="right")
+	table.add_column("Max", justify="right", style="bold")
+
+	for row in _get_durations_rows(durations):
+		table.add_row(*row)
+
+	console = Console()
+	console.print(table)
+
+
+def print_benchmarks(benchmarks: list):
+	"""
+	Prints a benchmarks table.
+
+	:param		benchmarks:	 The benchmarks
+	:type		benchmarks:	 List[BenchmarkStats]
+	"""
+	from rich import box
+	from rich.console import Console
+	from rich.table import Table
+
+	table = Table(title="Benchmarks", expand=True, box=box.ROUNDED)
+
+	table.add_column("Benchmark", style="cyan", overflow="fold")
+	table.add_column("Rounds", justify="right")
+	table.add_column("Min", justify="right")
+	table.add_column("Median", justify="right", style="bold")
+	table.add_column("P95", justify="right")
+	table.add_column("StdDev", justify="right")
+	table.add_column("OPS", justify="right")
+
+	for row in _get_benchmarks_rows(benchmarks):
+		table.add_row(*row)
+
+	console = Console()
+	console.print(table)
+
+
+def print_regressions(regressions: list):
+	"""
+	Prints a table of benchmarks slower than their baseline.
+
+	:param		regressions:  The regressions
+	:type		regressions:  List[Regression]
+	"""
+	from rich import box
+	from rich.console import Console
+	from rich.table import Table
+
+	table = Table(
+		title="Benchmark regressions", expand=True, box=box.ROUNDED, style="red"
 	)
 
+	table.add_column("Benchmark", style="cyan", overflow="fold")
+	table.add_column("Baseline median", justify="right")
+	table.add_column("Median", justify="right")
+	table.add_column("Change", justify="right", style="bold red")
+
+	for row in _get_regressions_rows(regressions):
+		table.add_row(*row)
+
+	console = Console()
+	console.print(table)
+
+
+def print_coverage(summary: list):
+	"""
+	Prints a table of line coverage by file.
+
+	:param		summary:  The path, statements and missed statements of files
+	:type		summary:  List[Tuple[str, int, int]]
+	"""
+	from rich import box
+	from rich.console import Console
+	from rich.table import Table
+
+	table = Table(title="Coverage", expand=True, box=box.ROUNDED)
+
+	table.add_column("File", style="cyan", overflow="fold")
+	table.add_column("Stmts", justify="right")
+	table.add_column("Miss", justify="right")
+	table.add_column("Cover", justify="right", style="bold")
+
+	*rows, total = _get_coverage_rows(summary)
+
+	for row in rows:
+		table.add_row(*row)
+
+	table.add_row(*total, style="bold")
+
 	console = Console()
 	console.print(table)
 
@@ -72,6 +381,22 @@ def print_header(label: str, plus_len: int = 0, style: str = "bold"):
 	print(f"[{style}]{line}[/{style}]")
 
 
+def get_platform_info() -> Dict[str, str]:
+	"""
+	Gets the platform information shown in the runner prelude.
+
+	:returns:	The platform information.
+	:rtype:		Dict[str, str]
+	"""
+	return {
+		"platform": platform.platform(),
+		"version": platform.version(),
+		"release": platform.release(),
+		"system": platform.system(),
+		"python": platform.python_version(),
+	}
+
+
 def print_platform(items: int):
 	"""
 	Prints a platform.
@@ -79,11 +404,9 @@ def print_platform(items: int):
 	:param      items:  The items
 	:type       items:  int
 	"""
-	print(f"[white]platform: [reset]{platform.platform()}[/white]")
-	print(f"[white]version: [reset]{platform.version()}[/white]")
-	print(f"[white]release: [reset]{platform.release()}[/white]")
-	print(f"[white]system: [reset]{platform.system()}[/white]")
-	print(f"[white]python: [reset]{platform.python_version()}[/white]")
+	for key, value in get_platform_info().items():
+		print(f"[white]{key}: [reset]{value}[/white]")
+
 	print(f"[white bold]Collected {items} items[/white bold]\n")
 
 
@@ -132,6 +455,12 @@ def print_test_result(
 		)
 		print_header(f"ERROR: {label}", style="bold red")
 		print(f"[red]{output}[/red]")
+	elif status == "timeout":
+		print(
+			f"\n[black bold on magenta]TIME[/black bold on magenta] {date} [magenta]{label.ljust(width)}[/magenta][black on blue]{postmessage}[/black on blue] [dim magenta][{str(percent).rjust(3)}%][/dim magenta]"
+		)
+		print_header(f"TIMEOUT: {label}", style="bold magenta")
+		print(f"[magenta]{output}[/magenta]")
 	elif status == "warning":
 		print(
 			f"[black bold on yellow]WARN[/black bold on yellow] {date} [yellow]{label.ljust(width)}[/yellow][black on blue]{postmessage}[/black on blue] [dim yellow][{str(percent).rjust(3)}%][/dim yellow]"
@@ -141,3 +470,441 @@ def print_test_result(
 		print(
 			f"[black bold on blue]SKIP[/black bold on blue] {date} [blue]{label.ljust(width)}[/blue][black on blue]{postmessage}[/black on blue] [dim blue][{str(percent).rjust(3)}%][/dim blue]"
 		)
+	elif status == "xfail":
+		print(
+			f"[black bold on cyan]XFL [/black bold on cyan] {date} [cyan]{label.ljust(width)}[/cyan][black on blue]{postmessage}[/black on blue] [dim cyan][{str(percent).rjust(3)}%][/dim cyan]"
+		)
+	elif status == "xpass":
+		print(
+			f"\n[black bold on red]XPS [/black bold on red] {date} [red]{label.ljust(width)}[/red][black on blue]{postmessage}[/black on blue] [dim red][{str(percent).rjust(3)}%][/dim red]"
+		)
+	elif status == "dryrun":
+		print(
+			f"[black bold on white]DRY [/black bold on white] {date} [white]{label.ljust(width)}[/white][black on blue]{postmessage}[/black on blue] [dim white][{str(percent).rjust(3)}%][/dim white]"
+		)
+
+
+class BaseReporter:
+	"""
+	This class describes a reporter interface used by runner sessions.
+	"""
+
+	def print_banner(self, version: str):
+		"""
+		Prints the pyzitadelle banner.
+
+		:param		version:  The version
+		:type		version:  str
+		"""
+		raise NotImplementedError
+
+	def print_header(self, label: str, plus_len: int = 0, style: str = "bold"):
+		"""
+		Prints a header.
+
+		:param		label:	   The label
+		:type		label:	   str
+		:param		plus_len:  The plus length
+		:type		plus_len:  int
+		:param		style:	   The style
+		:type		style:	   str
+		"""
+		raise NotImplementedError
+
+	def print_platform(self, items: int):
+		"""
+		Prints a platform.
+
+		:param		items:	The items
+		:type		items:	int
+		"""
+		raise NotImplementedError
+
+	def print_test_result(
+		self,
+		percent: str,
+		label: str,
+		status: Optional[str] = "success",
+		output: Optional[Any] = None,
+		postmessage: Optional[str] = "",
+		comment: Optional[str] = None,
+	):
+		"""
+		Prints a test result.
+
+		:param		percent:	  The percent
+		:type		percent:	  str
+		:param		label:		  The label
+		:type		label:		  str
+		:param		status:		  The status
+		:type		status:		  str
+		:param		output:		  The output
+		:type		output:		  Any
+		:param		postmessage:  The postmessage
+		:type		postmessage:  str
+		:param		comment:	  The comment
+		:type		comment:	  str
+		"""
+		raise NotImplementedError
+
+	def print_results_table(
+		self,
+		total: int,
+		passed: int,
+		warnings: int,
+		errors: int,
+		skipped: int,
+		timeouts: int = 0,
+		xfailed: int = 0,
+		xpassed: int = 0,
+	):
+		"""
+		Prints a results table.
+
+		:param		total:	   The total
+		:type		total:	   int
+		:param		passed:	   The passed
+		:type		passed:	   int
+		:param		warnings:  The warnings
+		:type		warnings:  int
+		:param		errors:	   The errors
+		:type		errors:	   int
+		:param		skipped:   The skipped
+		:type		skipped:   int
+		:param		timeouts:  The timeouts
+		:type		timeouts:  int
+		:param		xfailed:   The expected failures
+		:type		xfailed:   int
+		:param		xpassed:   The unexpected passes
+		:type		xpassed:   int
+		"""
+		print_results_table(
+			total, passed, warnings, errors, skipped, timeouts, xfailed, xpassed
+		)
+
+	def print_durations(self, durations: list):
+		"""
+		Prints a durations table of the slowest tests.
+
+		:param		durations:	The durations
+		:type		durations:	List[TestDurations]
+		"""
+		self.flush()
+
+		print_durations(durations)
+
+	def print_benchmarks(self, benchmarks: list):
+		"""
+		Prints a benchmarks table.
+
+		:param		benchmarks:	 The benchmarks
+		:type		benchmarks:	 List[BenchmarkStats]
+		"""
+		self.flush()
+
+		print_benchmarks(benchmarks)
+
+	def print_regressions(self, regressions: list):
+		"""
+		Prints a table of benchmarks slower than their baseline.
+
+		:param		regressions:  The regressions
+		:type		regressions:  List[Regression]
+		"""
+		self.flush()
+
+		print_regressions(regressions)
+
+	def print_coverage(self, summary: list):
+		"""
+		Prints a table of line coverage by file.
+
+		:param		summary:  The path, statements and missed statements of files
+		:type		summary:  List[Tuple[str, int, int]]
+		"""
+		self.flush()
+
+		print_coverage(summary)
+
+	def flush(self):
+		"""
+		Flush buffered output.
+		"""
+
+
+class RichReporter(BaseReporter):
+	"""
+	This class describes a reporter with rich markup for every line.
+
+	Every result is printed under a lock, so its lines are not interleaved
+	with the ones printed from other threads.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self._lock = threading.RLock()
+
+	def print_banner(self, version: str):
+		print_banner(version)
+
+	def print_header(self, label: str, plus_len: int = 0, style: str = "bold"):
+		with self._lock:
+			print_header(label, plus_len=plus_len, style=style)
+
+	def print_platform(self, items: int):
+		print_platform(items)
+
+	def print_test_result(
+		self,
+		percent: str,
+		label: str,
+		status: Optional[str] = "success",
+		output: Optional[Any] = None,
+		postmessage: Optional[str] = "",
+		comment: Optional[str] = None,
+	):
+		with self._lock:
+			print_test_result(
+				percent,
+				label,
+				status=status,
+				output=output,
+				postmessage=postmessage,
+				comment=comment,
+			)
+
+
+class PlainReporter(BaseReporter):
+	"""
+	This class describes a plain text reporter for large suites.
+
+	Terminal width is queried once, timestamps are formatted at most once per
+	second and lines are written to the stream in chunks; tables are plain
+	text too, so rich is never imported. Every result is written to the
+	buffer at once under a lock, so output of threads is not interleaved.
+	"""
+
+	STATUS_LABELS = {
+		"success": "PASS",
+		"error": "ERR ",
+		"warning": "WARN",
+		"skip": "SKIP",
+		"timeout": "TIME",
+		"xfail": "XFL ",
+		"xpass": "XPS ",
+		"dryrun": "DRY ",
+	}
+
+	def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = 65536):
+		"""
+		Constructs a new instance.
+
+		:param		stream:		  The output stream, stdout by default
+		:type		stream:		  TextIO
+		:param		buffer_size:  The size of output chunks in characters
+		:type		buffer_size:  int
+		"""
+		self.stream = stream if stream is not None else sys.stdout
+		self.buffer_size = buffer_size
+		self.columns = shutil.get_terminal_size().columns
+
+		self._chunks: List[str] = []
+		self._buffered = 0
+		self._second: Optional[int] = None
+		self._date = ""
+		self._lock = threading.RLock()
+
+	def _get_date(self) -> str:
+		"""
+		Gets the current date, formatted once per second.
+
+		:returns:	The date.
+		:rtype:		str
+		"""
+		now = int(time.time())
+
+		if now != self._second:
+			self._second = now
+			self._date = time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(now))
+
+		return self._date
+
+	def _write(self, text: str):
+		"""
+		Write text to the buffer
+
+		:param		text:  The text
+		:type		text:  str
+		"""
+		with self._lock:
+			self._chunks.append(text)
+			self._buffered += len(text)
+
+			if self._buffered >= self.buffer_size:
+				self.flush()
+
+	def flush(self):
+		"""
+		Flush buffered output to the stream.
+		"""
+		with self._lock:
+			if self._chunks:
+				self.stream.write("".join(self._chunks))
+				self._chunks.clear()
+				self._buffered = 0
+
+			self.stream.flush()
+
+	def _format_header(self, label: str) -> str:
+		return f" {label} ".center(self.columns - 2, "=") + "\n"
+
+	def print_banner(self, version: str):
+		self._write(f"pyzitadelle v{version}\n")
+
+	def print_header(self, label: str, plus_len: int = 0, style: str = "bold"):
+		self._write(self._format_header(label))
+
+	def print_platform(self, items: int):
+		for key, value in get_platform_info().items():
+			self._write(f"{key}: {value}\n")
+
+		self._write(f"Collected {items} items\n\n")
+
+	def print_test_result(
+		self,
+		percent: str,
+		label: str,
+		status: Optional[str] = "success",
+		output: Optional[Any] = None,
+		postmessage: Optional[str] = "",
+		comment: Optional[str] = None,
+	):
+		date = self._get_date()
+
+		if comment is not None:
+			label = f"{label} {comment}"
+
+		width = self.columns - 13 - len(date) - len(postmessage)
+		line = f"{self.STATUS_LABELS.get(status, status)} {date} {label.ljust(width)}{postmessage} [{str(percent).rjust(3)}%]\n"
+
+		if status in ("error", "timeout"):
+			self._write(
+				f"\n{line}{self._format_header(f'{status.upper()}: {label}')}{output}\n"
+			)
+		elif status == "warning":
+			self._write(f"{line} > {output}\n\n")
+		else:
+			self._write(line)
+
+	def _write_table(
+		self,
+		title: str,
+		columns: Sequence[str],
+		rows: List[Sequence[str]],
+		left: int = 1,
+	):
+		"""
+		Write table as plain text: header and rows with aligned columns
+
+		:param		title:	  The title
+		:type		title:	  str
+		:param		columns:  The column names
+		:type		columns:  Sequence[str]
+		:param		rows:	  The rows
+		:type		rows:	  List[Sequence[str]]
+		:param		left:	  The count of first columns aligned to the left, the others are aligned to the right
+		:type		left:	  int
+		"""
+		widths = [
+			max(len(row[index]) for row in (columns, *rows))
+			for index in range(len(columns))
+		]
+		lines = [self._format_header(title)]
+
+		for row in (columns, *rows):
+			cells = [
+				cell.ljust(width) if index < left else cell.rjust(width)
+				for index, (cell, width) in enumerate(zip(row, widths))
+			]
+			lines.append("  ".join(cells).rstrip() + "\n")
+
+		self._write("".join(lines))
+
+	def print_results_table(
+		self,
+		total: int,
+		passed: int,
+		warnings: int,
+		errors: int,
+		skipped: int,
+		timeouts: int = 0,
+		xfailed: int = 0,
+		xpassed: int = 0,
+	):
+		rows = _get_results_rows(
+			total, passed, warnings, errors, skipped, timeouts, xfailed, xpassed
+		)
+		self._write_table(
+			"Tests Result",
+			("Tests encountered", "N", "Percent"),
+			[(label, count, percent) for count, label, percent, _ in rows],
+		)
+
+	def print_durations(self, durations: list):
+		self._write_table(
+			"Slowest tests",
+			("Test", "Launches", "Total", "Min", "Mean", "Max"),
+			_get_durations_rows(durations),
+		)
+
+	def print_benchmarks(self, benchmarks: list):
+		self._write_table(
+			"Benchmarks",
+			("Benchmark", "Rounds", "Min", "Median", "P95", "StdDev", "OPS"),
+			_get_benchmarks_rows(benchmarks),
+		)
+
+	def print_regressions(self, regressions: list):
+		self._write_table(
+			"Benchmark regressions",
+			("Benchmark", "Baseline median", "Median", "Change"),
+			_get_regressions_rows(regressions),
+		)
+
+	def print_coverage(self, summary: list):
+		self._write_table(
+			"Coverage",
+			("File", "Stmts", "Miss", "Cover"),
+			_get_coverage_rows(summary),
+		)
+
+
+REPORTERS = {"rich": RichReporter, "plain": PlainReporter}
+
+
+def get_reporter(reporter: Union[str, BaseReporter, None] = None) -> BaseReporter:
+	"""
+	Gets the reporter by name.
+
+	:param		reporter:			  The reporter name or instance, rich by default
+	:type		reporter:			  Union[str, BaseReporter, None]
+
+	:returns:	The reporter.
+	:rtype:		BaseReporter
+
+	:raises		TestValidationError:  unknown reporter
+	"""
+	if reporter is None:
+		return RichReporter()
+
+	if isinstance(reporter, BaseReporter):
+		return reporter
+
+	try:
+		return REPORTERS[reporter]()
+	except KeyError:
+		raise TestValidationError(
+			f"Unknown reporter {reporter!r}, available: {', '.join(REPORTERS)}"
+		) from None
@@ -0,0 +1,293 @@
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from pyzitadelle.standard import TestInvocation, TestOutcome, TestResult
+
+# characters which are not allowed in XML 1.0 documents, even escaped
+_INVALID_XML_CHARS = re.compile(
+	"[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+class ResultListener:
+	"""
+	This class describes a consumer of test results, fed by the runner in
+	report order.
+	"""
+
+	def add_result(self, test_name: str, line: int, test_result: TestResult):
+		"""
+		Adds a test result.
+
+		:param		test_name:	  The test name
+		:type		test_name:	  str
+		:param		line:		  The line of test definition
+		:type		line:		  int
+		:param		test_result:  The test result
+		:type		test_result:  TestResult
+		"""
+
+	def close(self):
+		"""
+		Closes the listener.
+		"""
+
+
+@dataclass
+class TestDurations:
+	"""
+	Durations of one test (or one argument set of it) across its launches.
+	"""
+
+	name: str
+	argument_index: Optional[int] = None
+	launches: int = 0
+	total_ns: int = 0
+	min_ns: int = 0
+	max_ns: int = 0
+
+	@property
+	def mean_ns(self) -> float:
+		return self.total_ns / self.launches if self.launches else 0.0
+
+	def add(self, duration_ns: int):
+		"""
+		Adds a duration of one launch.
+
+		:param		duration_ns:  The duration in nanoseconds
+		:type		duration_ns:  int
+		"""
+		if not self.launches or duration_ns < self.min_ns:
+			self.min_ns = duration_ns
+		if duration_ns > self.max_ns:
+			self.max_ns = duration_ns
+
+		self.launches += 1
+		self.total_ns += duration_ns
+
+
+class DurationsCollector(ResultListener):
+	"""
+	This class describes a collector of per-test and per-argument durations.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.durations: Dict[Tuple[str, Optional[int]], TestDurations] = {}
+
+	def add_result(self, test_name: str, line: int, test_result: TestResult):
+		for invocation in test_result.invocations:
+			if invocation.outcome == TestOutcome.SKIP:
+				continue
+
+			key = (test_name, invocation.argument_index)
+			durations = self.durations.get(key)
+
+			if durations is None:
+				durations = self.durations[key] = TestDurations(
+					test_name, invocation.argument_index
+				)
+
+			durations.add(invocation.duration_ns)
+
+	def slowest(self, count: Optional[int] = None) -> List[TestDurations]:
+		"""
+		Gets the slowest tests by total duration.
+
+		:param		count:	The count of tests, all of them if None or 0
+		:type		count:	Optional[int]
+
+		:returns:	durations of slowest tests
+		:rtype:		List[TestDurations]
+		"""
+		slowest = sorted(
+			self.durations.values(), key=lambda item: item.total_ns, reverse=True
+		)
+
+		return slowest[:count] if count else slowest
+
+
+def invocation_record(
+	label: str, test_name: str, line: int, invocation: TestInvocation
+) -> dict:
+	"""
+	Build machine-readable record of test invocation
+
+	:param		label:		  The test case label
+	:type		label:		  str
+	:param		test_name:	  The test name
+	:type		test_name:	  str
+	:param		line:		  The line of test definition
+	:type		line:		  int
+	:param		invocation:	  The invocation
+	:type		invocation:	  TestInvocation
+
+	:returns:	record
+	:rtype:		dict
+	"""
+	return {
+		"case": label,
+		"name": test_name,
+		"line": line,
+		"outcome": invocation.outcome.name,
+		"duration": invocation.duration_ns / 1e9,
+		"launch": invocation.launch,
+		"argument_index": invocation.argument_index,
+		"traceback": invocation.traceback,
+	}
+
+
+class JsonLinesReport(ResultListener):
+	"""
+	This class describes a JSON Lines report: one record per test invocation,
+	flushed after every test so memory usage does not grow with the suite.
+	"""
+
+	def __init__(self, path: Union[str, Path], label: str = "TestCase"):
+		"""
+		Constructs a new instance.
+
+		:param		path:	The report path
+		:type		path:	Union[str, Path]
+		:param		label:	The test case label
+		:type		label:	str
+		"""
+		self.path = Path(path)
+		self.label = label
+		self.file = open(self.path, "w", encoding="utf-8")
+
+	def add_result(self, test_name: str, line: int, test_result: TestResult):
+		for invocation in test_result.invocations:
+			self.file.write(
+				json.dumps(invocation_record(self.label, test_name, line, invocation))
+			)
+			self.file.write("\n")
+
+		self.file.flush()
+
+	def close(self):
+		self.file.close()
+
+
+def read_json_lines(path: Union[str, Path]) -> Iterator[dict]:
+	"""
+	Read records of JSON Lines report one by one
+
+	:param		path:  The report path
+	:type		path:  Union[str, Path]
+
+	:returns:	records
+	:rtype:		Iterator[dict]
+	"""
+	with open(path, encoding="utf-8") as file:
+		for line in file:
+			if line.strip():
+				yield json.loads(line)
+
+
+def _strip_invalid_xml(text: str) -> str:
+	"""
+	Strip characters not allowed in XML, such as escape sequences of
+	colored output
+
+	:param		text:  The text
+	:type		text:  str
+
+	:returns:	text without invalid characters
+	:rtype:		str
+	"""
+	return _INVALID_XML_CHARS.sub("", text)
+
+
+def write_junit_xml(
+	source: Union[str, Path],
+	destination: Union[str, Path],
+	suite_name: Optional[str] = None,
+):
+	"""
+	Convert JSON Lines report to JUnit XML
+
+	The report is streamed twice: once for the suite totals and once for the
+	test cases, so the conversion also runs in constant memory. Characters
+	not allowed in XML are stripped from names and tracebacks.
+
+	:param		source:		  The JSON Lines report path
+	:type		source:		  Union[str, Path]
+	:param		destination:  The JUnit XML path
+	:type		destination:  Union[str, Path]
+	:param		suite_name:	  The suite name
+	:type		suite_name:	  Optional[str]
+	"""
+	# xml.sax imports urllib, so it is only loaded when it is needed
+	from xml.sax.saxutils import XMLGenerator
+
+	tests = failures = skipped = 0
+	duration = 0.0
+
+	for record in read_json_lines(source):
+		outcome = TestOutcome[record["outcome"]]
+		tests += 1
+		duration += record["duration"]
+
+		if outcome.will_fail_session:
+			failures += 1
+		elif outcome in (TestOutcome.SKIP, TestOutcome.DRYRUN):
+			skipped += 1
+
+		if suite_name is None:
+			suite_name = record["case"]
+
+	with open(destination, "w", encoding="utf-8") as file:
+		xml = XMLGenerator(file, encoding="utf-8", short_empty_elements=True)
+		xml.startDocument()
+		xml.startElement("testsuites", {})
+		xml.startElement(
+			"testsuite",
+			{
+				"name": _strip_invalid_xml(suite_name or "pyzitadelle"),
+				"tests": str(tests),
+				"failures": str(failures),
+				"errors": "0",
+				"skipped": str(skipped),
+				"time": f"{duration:.6f}",
+			},
+		)
+
+		for record in read_json_lines(source):
+			outcome = TestOutcome[record["outcome"]]
+			name = record["name"]
+
+			if record["argument_index"] is not None:
+				name = f"{name}[{record['argument_index']}]"
+
+			if record["launch"]:
+				name = f"{name} (launch {record['launch'] + 1})"
+
+			xml.startElement(
+				"testcase",
+				{
+					"classname": _strip_invalid_xml(record["case"]),
+					"name": _strip_invalid_xml(name),
+					"line": str(record["line"]),
+					"time": f"{record['duration']:.6f}",
+				},
+			)
+
+			if outcome.will_fail_session:
+				xml.startElement("failure", {"message": outcome.display_name})
+				xml.characters(_strip_invalid_xml(record["traceback"] or ""))
+				xml.endElement("failure")
+			elif outcome in (TestOutcome.SKIP, TestOutcome.DRYRUN):
+				xml.startElement("skipped", {})
+				xml.endElement("skipped")
+
+			xml.endElement("testcase")
+
+		xml.endElement("testsuite")
+		xml.endElement("testsuites")
+		xml.endDocument()
@@ -1,11 +1,156 @@
 import asyncio
+import atexit
+import contextvars
+import importlib
 import inspect
+import multiprocessing
+import os
+import signal
+import sys
+import threading
 import traceback
-from typing import Any, Awaitable, Callable, List, Union
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from queue import SimpleQueue
+from time import perf_counter_ns
+from typing import (
+	Any,
+	Awaitable,
+	Callable,
+	ContextManager,
+	Dict,
+	Iterable,
+	Iterator,
+	List,
+	Optional,
+	Set,
+	Tuple,
+	Union,
+)
 
-from pyzitadelle.exceptions import SkippedTestException, TestError
-from pyzitadelle.reporter import print_header, print_platform, print_test_result
-from pyzitadelle.standard import ExpectFailMarkup, SkipMarker
+from pyzitadelle.baseline import BenchmarkBaseline
+from pyzitadelle.benchmark import BenchmarkStats, run_benchmark, run_benchmark_async
+from pyzitadelle.cache import DEFAULT_CACHE_SIZE, ResultCache
+from pyzitadelle.coverage import (
+	CoverageData,
+	DependencyTracer,
+	LineTracer,
+	TestSelection,
+	from_numbits,
+	to_numbits,
+)
+from pyzitadelle.exceptions import (
+	FixtureError,
+	SkippedTestException,
+	TestError,
+	TestTimeoutError,
+)
+from pyzitadelle.fixtures import SESSION_SCOPE, FixtureResolver, FixtureScope
+from pyzitadelle.parametrize import describe_argument, iter_cases
+from pyzitadelle.reporter import BaseReporter, RichReporter
+from pyzitadelle.results import ResultListener
+from pyzitadelle.standard import (
+	FAILED_STATUSES,
+	Argument,
+	ExpectFailMarkup,
+	Marker,
+	SkipMarker,
+	TestInvocation,
+	TestOutcome,
+	TestRecord,
+	TestResult,
+)
+
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_session_loop_pid: Optional[int] = None
+
+
+def get_session_loop() -> asyncio.AbstractEventLoop:
+	"""
+	Gets the event loop shared by all runners of the process, so session
+	fixtures can outlive a single test case run.
+
+	:returns:	The session loop.
+	:rtype:		asyncio.AbstractEventLoop
+	"""
+	global _session_loop, _session_loop_pid
+
+	if (
+		_session_loop is None
+		or _session_loop.is_closed()
+		or _session_loop_pid != os.getpid()
+	):
+		_session_loop = asyncio.new_event_loop()
+		_session_loop_pid = os.getpid()
+
+	return _session_loop
+
+
+@atexit.register
+def close_session():
+	"""
+	Tear down session fixtures and close the session loop.
+	"""
+	global _session_loop
+
+	if _session_loop is None or _session_loop_pid != os.getpid():
+		return
+
+	if not _session_loop.is_closed():
+		try:
+			_session_loop.run_until_complete(SESSION_SCOPE.teardown())
+		finally:
+			_session_loop.run_until_complete(_session_loop.shutdown_asyncgens())
+			_session_loop.close()
+
+	_session_loop = None
+
+
+def _format_exception(exception: BaseException) -> str:
+	"""
+	Format exception with its traceback
+
+	:param		exception:	The exception
+	:type		exception:	BaseException
+
+	:returns:	formatted traceback
+	:rtype:		str
+	"""
+	return "".join(
+		traceback.format_exception(type(exception), exception, exception.__traceback__)
+	)
+
+
+# statuses of test case by outcomes of its invocations, the first one found
+# decides the status
+_CASE_STATUSES = (
+	(TestOutcome.TIMEOUT, "timeout"),
+	(TestOutcome.FAIL, "error"),
+	(TestOutcome.XPASS, "xpass"),
+	(TestOutcome.XFAIL, "xfail"),
+	(TestOutcome.SKIP, "skip"),
+	(TestOutcome.DRYRUN, "dryrun"),
+)
+
+
+def get_case_status(invocations: List[TestInvocation]) -> str:
+	"""
+	Gets the status of test case by outcomes of its invocations
+
+	:param		invocations:  The invocations
+	:type		invocations:  List[TestInvocation]
+
+	:returns:	status
+	:rtype:		str
+	"""
+	outcomes = {invocation.outcome for invocation in invocations}
+
+	for outcome, status in _CASE_STATUSES:
+		if outcome in outcomes:
+			return status
+
+	return "success"
 
 
 class Runner:
@@ -13,26 +158,289 @@ class Runner:
 	This class describes a runner session.
 	"""
 
-	def __init__(self, tests: int, testcase: object):
+	# sync tests which run out of time are abandoned in their thread; pool
+	# workers interrupt them with SIGALRM instead
+	interrupt_on_timeout = False
+
+	def __init__(
+		self,
+		tests: int,
+		testcase: object,
+		reporter: Optional[BaseReporter] = None,
+		listeners: Optional[List[ResultListener]] = None,
+		timeout: Optional[float] = None,
+		baseline: Optional[BenchmarkBaseline] = None,
+		case_threads: Optional[int] = None,
+		selection: Optional[TestSelection] = None,
+		coverage: Optional[CoverageData] = None,
+		cache: Optional[ResultCache] = None,
+		max_failures: Optional[int] = None,
+		dry_run: bool = False,
+		threads: Optional[int] = None,
+	):
 		"""
 		Constructs a new instance.
 
-		:param		tests:	   The tests
-		:type		tests:	   int
-		:param		testcase:  The testcase
-		:type		testcase:  TestCase
+		:param		tests:		   The tests
+		:type		tests:		   int
+		:param		testcase:	   The testcase
+		:type		testcase:	   TestCase
+		:param		reporter:	   The reporter
+		:type		reporter:	   BaseReporter
+		:param		listeners:	   The result listeners
+		:type		listeners:	   List[ResultListener]
+		:param		timeout:	   The default timeout of test invocation in seconds
+		:type		timeout:	   Optional[float]
+		:param		baseline:	   The benchmark baseline
+		:type		baseline:	   Optional[BenchmarkBaseline]
+		:param		case_threads:  The count of threads running cases of sync tests
+		:type		case_threads:  Optional[int]
+		:param		selection:	   The incremental test selection
+		:type		selection:	   Optional[TestSelection]
+		:param		coverage:	   The line coverage data
+		:type		coverage:	   Optional[CoverageData]
+		:param		cache:		   The cache of passed cacheable test cases
+		:type		cache:		   Optional[ResultCache]
+		:param		max_failures:  Stop the chain after this many failed cases
+		:type		max_failures:  Optional[int]
+		:param		dry_run:	   List test cases without executing them
+		:type		dry_run:	   bool
+		:param		threads:	   The count of threads running sync tests
+		:type		threads:	   Optional[int]
 		"""
 		self.tests = tests
 		self.tests_count = len(self.tests)
 		self.testcase = testcase
+		self.reporter = reporter if reporter is not None else RichReporter()
+		self.listeners = listeners if listeners is not None else []
+		self.fixtures = FixtureResolver(testcase.fixtures if testcase else {})
+		self.timeout = timeout
+		self.baseline = baseline
+		self.case_threads = case_threads
+		self.case_executor: Optional[ThreadPoolExecutor] = None
+		self.cases = 0
+		self.selection = selection
+		self.tracer: Optional[DependencyTracer] = None
+		self.recorded: Dict[str, Set[Any]] = {}
+		self.coverage = coverage
+		self.line_tracer: Optional[LineTracer] = None
+		self.covered: Dict[str, Set[Tuple[str, int]]] = {}
+		self.cache = cache
+		self.uncached: Dict[str, List[Tuple[str, TestResult]]] = {}
+		self.cached_files: Dict[str, Set[str]] = {}
+		self.max_failures = max_failures
+		self.failures = 0
+		self.records: Dict[Any, TestRecord] = {}
+		self.markers: Dict[Any, Optional[Marker]] = {}
+		self.dry_run = dry_run
+		self.threads = threads
+		self.test_executor: Optional[ThreadPoolExecutor] = None
+		self.thread_tests: List[Future] = []
+		self.stopping = threading.Event()
 
 	def _print_prelude(self):
 		"""
 		Prints a prelude.
 		"""
-		print_header("runner session starts")
+		self.reporter.print_header("runner session starts")
+
+		self.reporter.print_platform(self.tests_count)
+
+	def _get_loop(self) -> asyncio.AbstractEventLoop:
+		"""
+		Gets the event loop shared by all async tests of the session.
+
+		:returns:	The loop.
+		:rtype:		asyncio.AbstractEventLoop
+		"""
+		return get_session_loop()
+
+	def _finalize(self):
+		"""
+		Tear down case fixtures of the runner; a failed teardown is reported
+		as an error of the test case and fails the session.
+		"""
+		try:
+			self._get_loop().run_until_complete(self.fixtures.case_scope.teardown())
+		except FixtureError as ex:
+			self.failures += 1
+			self.testcase.errors += 1
+			self.reporter.print_header(ex.message, style="bold red")
+
+	def _get_record(self, test: Union[Callable, Awaitable]) -> TestRecord:
+		"""
+		Gets the record of test metadata, built once per run.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	test record
+		:rtype:		TestRecord
+		"""
+		record = self.records.get(test)
+
+		if record is None:
+			record = self.records[test] = TestRecord.from_test(test)
+
+		return record
+
+	def _get_active_marker(self, test: Union[Callable, Awaitable]) -> Optional[Marker]:
+		"""
+		Gets the marker of test if it is active, its condition is evaluated
+		once per run; an error of condition is raised by the first call.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	active marker, None if test has none
+		:rtype:		Optional[Marker]
+		"""
+		if test not in self.markers:
+			marker = self._get_record(test).marker
+
+			try:
+				self.markers[test] = (
+					marker if marker is not None and marker.active else None
+				)
+			except Exception:
+				# the error fails the test once, its outcome is decided without marker
+				self.markers[test] = None
+				raise
+
+		return self.markers[test]
+
+	def _get_outcome(
+		self, test: Union[Callable, Awaitable], exception: Optional[BaseException]
+	) -> TestOutcome:
+		"""
+		Gets the outcome of test invocation: failures of tests expected to
+		fail are XFAIL and their passes are XPASS
+
+		:param		test:		The test
+		:type		test:		TestInfo
+		:param		exception:	The raised exception, None if invocation passed
+		:type		exception:	Optional[BaseException]
+
+		:returns:	outcome
+		:rtype:		TestOutcome
+		"""
+		if isinstance(exception, TestTimeoutError):
+			return TestOutcome.TIMEOUT
+
+		if isinstance(exception, SkippedTestException):
+			return TestOutcome.SKIP
+
+		expected = isinstance(self._get_active_marker(test), ExpectFailMarkup)
+
+		if exception is None:
+			return TestOutcome.XPASS if expected else TestOutcome.PASS
+
+		if expected and isinstance(exception, (AssertionError, TestError)):
+			return TestOutcome.XFAIL
+
+		return TestOutcome.FAIL
+
+	def _is_async_test(self, test: Union[Callable, Awaitable]) -> bool:
+		"""
+		Determines whether the specified test is a coroutine function.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	True if the specified test is asynchronous, False otherwise.
+		:rtype:		bool
+		"""
+		return self._get_record(test).is_async
+
+	def _get_timeout(self, test: Union[Callable, Awaitable]) -> Optional[float]:
+		"""
+		Gets the timeout of test invocation.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	timeout in seconds, None if test can run forever
+		:rtype:		Optional[float]
+		"""
+		timeout = self._get_record(test).timeout
+
+		return timeout if timeout is not None else self.timeout
+
+	async def _await_with_timeout(
+		self, awaitable: Awaitable, timeout: Optional[float]
+	) -> Any:
+		"""
+		Await test, cancelling it when it runs out of time
+
+		:param		awaitable:			 The awaitable
+		:type		awaitable:			 Awaitable
+		:param		timeout:			 The timeout
+		:type		timeout:			 Optional[float]
+
+		:returns:	function result
+		:rtype:		Any
+
+		:raises		TestTimeoutError:	 test timed out
+		"""
+		if timeout is None:
+			return await awaitable
+
+		try:
+			return await asyncio.wait_for(awaitable, timeout)
+		except asyncio.TimeoutError:
+			raise TestTimeoutError(f"Test cancelled after {timeout}s") from None
+
+	def _call_with_timeout(
+		self, test: Callable, args: tuple, kwargs: dict, timeout: float
+	) -> Any:
+		"""
+		Call sync test, giving up when it runs out of time
 
-		print_platform(self.tests_count)
+		:param		test:				 The test
+		:type		test:				 Callable
+		:param		args:				 The arguments
+		:type		args:				 tuple
+		:param		kwargs:				 The keywords arguments
+		:type		kwargs:				 dict
+		:param		timeout:			 The timeout
+		:type		timeout:			 float
+
+		:returns:	function result
+		:rtype:		Any
+
+		:raises		TestTimeoutError:	 test timed out
+		"""
+		if (
+			self.interrupt_on_timeout
+			and hasattr(signal, "setitimer")
+			and threading.current_thread() is threading.main_thread()
+		):
+			return _call_with_alarm(test, args, kwargs, timeout)
+
+		outcome = {}
+
+		def target():
+			try:
+				outcome["result"] = test(*args, **kwargs)
+			except BaseException as ex:
+				outcome["error"] = ex
+
+		thread = threading.Thread(
+			target=contextvars.copy_context().run,
+			args=(target,),
+			name=f"pyzitadelle-{test.__name__}",
+			daemon=True,
+		)
+		thread.start()
+		thread.join(timeout)
+
+		if thread.is_alive():
+			raise TestTimeoutError(f"Test abandoned after {timeout}s")
+
+		if "error" in outcome:
+			raise outcome["error"]
+
+		return outcome.get("result")
 
 	def _run_testinfo(self, test: Union[Callable, Awaitable], *args, **kwargs) -> Any:
 		"""
@@ -48,144 +456,1737 @@ class Runner:
 		:returns:	function result
 		:rtype:		Any
 		"""
-		if inspect.iscoroutinefunction(test):
-			result = asyncio.run(test(*args, **kwargs))
-		else:
+		requested = self.fixtures.get_requested(test, args, kwargs)
+		timeout = self._get_timeout(test)
+
+		# without fixtures a sync test does not need the session loop, so it
+		# can run in any thread while the runner thread drives the loop
+		if not requested and timeout is not None and not self._is_async_test(test):
+			return self._call_with_timeout(test, args, kwargs, timeout)
+
+		if not requested and timeout is None:
 			result = test(*args, **kwargs)
 
+			if inspect.isawaitable(result):
+				result = self._get_loop().run_until_complete(result)
+
+			return result
+
+		loop = self._get_loop()
+		test_scope = FixtureScope("test")
+
+		try:
+			if requested:
+				kwargs.update(
+					loop.run_until_complete(self.fixtures.resolve(requested, test_scope))
+				)
+
+			if timeout is not None and not self._is_async_test(test):
+				result = self._call_with_timeout(test, args, kwargs, timeout)
+			else:
+				result = test(*args, **kwargs)
+
+			if inspect.isawaitable(result):
+				result = loop.run_until_complete(
+					self._await_with_timeout(result, timeout)
+				)
+		finally:
+			loop.run_until_complete(test_scope.teardown())
+
 		return result
 
-	def _run_test_cycle(self, test_name: str, test: Union[Awaitable, Callable]) -> Any:
+	async def _run_testinfo_async(
+		self, test: Union[Callable, Awaitable], *args, **kwargs
+	) -> Any:
 		"""
-		Run test launch cycle
+		Run test with args inside of the running event loop
 
-		:param		test_name:	The test name
-		:type		test_name:	str
-		:param		test:		The test
-		:type		test:		TestInfo
+		:param		test:	 The test
+		:type		test:	 TestInfo
+		:param		args:	 The arguments
+		:type		args:	 list
+		:param		kwargs:	 The keywords arguments
+		:type		kwargs:	 dictionary
 
 		:returns:	function result
 		:rtype:		Any
 		"""
-		for n in range(test.pztdmeta.count_of_launchs):
-			if test.pztdmeta.arguments:
-				for argument in test.pztdmeta.arguments:
-					result = self._run_testinfo(test, *argument.args, **argument.kwargs)
-			else:
-				result = self._run_testinfo(test)
+		requested = self.fixtures.get_requested(test, args, kwargs)
+		test_scope = FixtureScope("test")
+
+		try:
+			if requested:
+				kwargs.update(await self.fixtures.resolve(requested, test_scope))
+
+			result = test(*args, **kwargs)
+
+			if inspect.isawaitable(result):
+				result = await self._await_with_timeout(result, self._get_timeout(test))
+		finally:
+			await test_scope.teardown()
 
 		return result
 
-	def _check_warnings(self, result: Any, results: list, percent: int, test_name: str):
+	def _run_invocation(
+		self,
+		invocations: List[TestInvocation],
+		launch: int,
+		argument_index: Optional[int],
+		test: Union[Awaitable, Callable],
+		*args,
+		**kwargs,
+	) -> Any:
 		"""
-		Check warnings in test
+		Run and time a single test invocation
 
-		:param		result:		The result
-		:type		result:		Any
-		:param		results:	The results
-		:type		results:	list
-		:param		percent:	The percent
-		:type		percent:	int
-		:param		test_name:	The test name
-		:type		test_name:	str
+		:param		invocations:	 The invocations of the test
+		:type		invocations:	 List[TestInvocation]
+		:param		launch:			 The launch number
+		:type		launch:			 int
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		args:			 The arguments
+		:type		args:			 list
+		:param		kwargs:			 The keywords arguments
+		:type		kwargs:			 dictionary
+
+		:returns:	function result
+		:rtype:		Any
 		"""
-		if len(results) > 0 and results[-1] == result and result is not None:
-			print_test_result(
-				percent,
-				test_name,
-				status="warning",
-				output=f"Last result is equals current result ({results[-1]} == {result})",
+		start = perf_counter_ns()
+
+		try:
+			result = self._run_testinfo(test, *args, **kwargs)
+		except BaseException as ex:
+			invocations.append(
+				TestInvocation(
+					launch,
+					argument_index,
+					self._get_outcome(test, ex),
+					perf_counter_ns() - start,
+				)
 			)
-			self.testcase.warnings += 1
-			self.testcase.passed += 1
+			raise
 
-	def _processing_tests_execution(
+		invocations.append(
+			TestInvocation(
+				launch,
+				argument_index,
+				self._get_outcome(test, None),
+				perf_counter_ns() - start,
+			)
+		)
+
+		return result
+
+	async def _run_invocation_async(
 		self,
-		tags: List[str],
-		test_num: int,
+		invocations: List[TestInvocation],
+		launch: int,
+		argument_index: Optional[int],
+		test: Union[Awaitable, Callable],
+		*args,
+		**kwargs,
+	) -> Any:
+		"""
+		Run and time a single test invocation inside of the running event loop
+
+		:param		invocations:	 The invocations of the test
+		:type		invocations:	 List[TestInvocation]
+		:param		launch:			 The launch number
+		:type		launch:			 int
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		args:			 The arguments
+		:type		args:			 list
+		:param		kwargs:			 The keywords arguments
+		:type		kwargs:			 dictionary
+
+		:returns:	function result
+		:rtype:		Any
+		"""
+		start = perf_counter_ns()
+
+		try:
+			result = await self._run_testinfo_async(test, *args, **kwargs)
+		except BaseException as ex:
+			invocations.append(
+				TestInvocation(
+					launch,
+					argument_index,
+					self._get_outcome(test, ex),
+					perf_counter_ns() - start,
+				)
+			)
+			raise
+
+		invocations.append(
+			TestInvocation(
+				launch,
+				argument_index,
+				self._get_outcome(test, None),
+				perf_counter_ns() - start,
+			)
+		)
+
+		return result
+
+	def _run_benchmark(
+		self,
+		invocations: List[TestInvocation],
+		benchmarks: List[BenchmarkStats],
 		test_name: str,
+		argument_index: Optional[int],
 		test: Union[Awaitable, Callable],
+		*args,
+		**kwargs,
 	):
 		"""
-		Processing tests execution
+		Benchmark test with one argument set
+
+		:param		invocations:	 The invocations of the test
+		:type		invocations:	 List[TestInvocation]
+		:param		benchmarks:		 The benchmarks of the test
+		:type		benchmarks:		 List[BenchmarkStats]
+		:param		test_name:		 The test name
+		:type		test_name:		 str
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		args:			 The arguments
+		:type		args:			 list
+		:param		kwargs:			 The keywords arguments
+		:type		kwargs:			 dictionary
+		"""
+		record = self._get_record(test)
+		rounds = max(record.count_of_launchs, record.benchmark.min_rounds)
+		requested = self.fixtures.get_requested(test, args, kwargs)
+		loop = self._get_loop()
+		test_scope = FixtureScope("test")
+		outcome = TestOutcome.FAIL
+		start = perf_counter_ns()
+
+		try:
+			if requested:
+				kwargs.update(
+					loop.run_until_complete(self.fixtures.resolve(requested, test_scope))
+				)
+
+			if self._is_async_test(test):
+				stats = loop.run_until_complete(
+					run_benchmark_async(
+						test_name,
+						argument_index,
+						lambda: test(*args, **kwargs),
+						record.benchmark,
+						rounds,
+					)
+				)
+			else:
+				stats = run_benchmark(
+					test_name,
+					argument_index,
+					lambda: test(*args, **kwargs),
+					record.benchmark,
+					rounds,
+				)
+
+			benchmarks.append(stats)
+			self._check_baseline(stats)
+			outcome = self._get_outcome(test, None)
+		except BaseException as ex:
+			outcome = self._get_outcome(test, ex)
+			raise
+		finally:
+			invocations.append(
+				TestInvocation(0, argument_index, outcome, perf_counter_ns() - start)
+			)
+			loop.run_until_complete(test_scope.teardown())
+
+	def _check_baseline(self, stats: BenchmarkStats):
+		"""
+		Compare benchmark with its baseline
+
+		:param		stats:		 The benchmark statistics
+		:type		stats:		 BenchmarkStats
+
+		:raises		TestError:	 benchmark regressed and regressions fail tests
+		"""
+		if self.baseline is None:
+			return
+
+		regression = self.baseline.check(self.testcase.label, stats)
+
+		if regression is not None and self.baseline.fail_on_regression:
+			raise TestError(
+				f"Benchmark {regression.key} median is {regression.change * 100:.1f}% "
+				f"slower than baseline ({regression.median * 1e6:.3f}us > "
+				f"{regression.baseline_median * 1e6:.3f}us)"
+			)
+
+	def _check_skip(self, tags: List[str], test: Union[Awaitable, Callable]):
+		"""
+		Check whether test should be skipped
 
 		:param		tags:				   The tags
 		:type		tags:				   List[str]
-		:param		test_num:			   The test number
-		:type		test_num:			   int
-		:param		test_name:			   The test name
-		:type		test_name:			   str
 		:param		test:				   The test
 		:type		test:				   TestInfo
 
 		:raises		SkippedTestException:  skip test
 		"""
-		percent = int((test_num / self.tests_count) * 100)
-		results = []
+		record = self._get_record(test)
 
-		lines = inspect.getsourcelines(test)[1]
-		test_name = f"{test_name}:[line {lines}]"
+		if tags and not record.tags.isdisjoint(tags):
+			raise SkippedTestException()
+		elif isinstance(self._get_active_marker(test), SkipMarker):
+			raise SkippedTestException(
+				record.marker.reason if record.marker.reason else "SkippedTest"
+			)
 
-		try:
-			if tags and list(set(tags) & set(test.tags)):
-				raise SkippedTestException()
-			elif isinstance(test.pztdmeta.marker, SkipMarker):
-				marker = test.pztdmeta.marker
-
-				if marker.when:
-					raise SkippedTestException(
-						marker.reason if marker.reason else "SkippedTest"
-					)
-			elif isinstance(test.pztdmeta.marker, ExpectFailMarkup):
-				marker = test.pztdmeta.marker
+		if self.selection is not None and self.selection.is_unchanged(record.name):
+			raise SkippedTestException("unchanged")
 
-			result = self._run_test_cycle(test_name, test)
+	def _result_from_exception(
+		self,
+		test: Union[Awaitable, Callable],
+		exception: Exception,
+		invocations: List[TestInvocation],
+		argument_index: Optional[int] = None,
+	) -> TestResult:
+		"""
+		Build test result from raised exception
 
-			self._check_warnings(result, results, percent, test_name)
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		exception:		 The exception
+		:type		exception:		 Exception
+		:param		invocations:	 The invocations of the test case
+		:type		invocations:	 List[TestInvocation]
+		:param		argument_index:	 The argument index of the test case
+		:type		argument_index:	 Optional[int]
 
-			results.append(result)
-		except SkippedTestException as ex:
-			self.testcase.skipped += 1
-			print_test_result(
-				percent,
-				test_name,
+		:returns:	test result
+		:rtype:		TestResult
+		"""
+		if isinstance(exception, SkippedTestException):
+			return TestResult(
 				status="skip",
-				postmessage=str(ex),
-				comment=test.pztdmeta.comment,
+				postmessage=str(exception),
+				invocations=[TestInvocation(0, argument_index, TestOutcome.SKIP)],
+				argument_index=argument_index,
 			)
-		except (AssertionError, TestError):
-			self.testcase.errors += 1
 
-			if isinstance(marker, ExpectFailMarkup):
-				print_test_result(
-					percent,
-					test_name,
-					status="error",
-					output=f"{traceback.format_exc()}",
-					postmessage=marker.reason if marker.reason else "XFAIL",
-					comment=test.pztdmeta.comment,
-				)
-			else:
-				print_test_result(
-					percent,
-					test_name,
-					status="error",
-					output=f"{traceback.format_exc()}",
-					comment=test.pztdmeta.comment,
-				)
-		else:
-			self.testcase.passed += 1
+		output = _format_exception(exception)
+
+		if not invocations:
+			invocations.append(
+				TestInvocation(0, argument_index, self._get_outcome(test, exception))
+			)
+
+		for invocation in invocations:
+			if (
+				invocation.outcome not in (TestOutcome.PASS, TestOutcome.XPASS)
+				and invocation.traceback is None
+			):
+				invocation.traceback = output
+
+		test_result = self._make_result(test, invocations, argument_index, output=output)
 
-			print_test_result(percent, test_name, comment=test.pztdmeta.comment)
+		if isinstance(exception, TestTimeoutError):
+			test_result.postmessage = str(exception.message)
 
-	def launch_test_chain(self, tags: List[str]):
+		return test_result
+
+	def _make_result(
+		self,
+		test: Union[Awaitable, Callable],
+		invocations: List[TestInvocation],
+		argument_index: Optional[int] = None,
+		**kwargs,
+	) -> TestResult:
 		"""
-		Launch test chain
+		Build test result with the status decided by outcomes of its
+		invocations
 
-		:raises		SkippedTestException:  skip test
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		invocations:	 The invocations of the test case
+		:type		invocations:	 List[TestInvocation]
+		:param		argument_index:	 The argument index of the test case
+		:type		argument_index:	 Optional[int]
+		:param		kwargs:			 The other fields of result
+		:type		kwargs:			 dictionary
 
-		:param		tags:  The tags
-		:type		tags:  List[str]
+		:returns:	test result
+		:rtype:		TestResult
+		"""
+		status = get_case_status(invocations)
+
+		if status == "xfail":
+			marker = self._get_active_marker(test)
+			kwargs["postmessage"] = marker.reason if marker.reason else "XFAIL"
+		elif status == "xpass":
+			kwargs["postmessage"] = "XPASS"
+
+		return TestResult(
+			status=status,
+			invocations=invocations,
+			argument_index=argument_index,
+			**kwargs,
+		)
+
+	def _get_cached(
+		self,
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		argument_index: Optional[int],
+		argument: Optional[Argument],
+	) -> Tuple[Optional[str], Optional[TestResult]]:
+		"""
+		Gets the cached result of test case, the files executed by it are
+		remembered for the test
+
+		:param		test_name:		 The test name
+		:type		test_name:		 str
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		argument:		 The argument set
+		:type		argument:		 Optional[Argument]
+
+		:returns:	cache key (None if case is not cacheable) and cached result
+		:rtype:		Tuple[Optional[str], Optional[TestResult]]
 		"""
-		for test_num, (test_name, test) in enumerate(self.tests.items(), start=1):
-			self._processing_tests_execution(tags, test_num, test_name, test)
+		record = self._get_record(test)
+
+		if self.cache is None or not record.cacheable or record.benchmark is not None:
+			return None, None
+
+		key = self.cache.get_key(test, argument)
+
+		if key is None:
+			return None, None
+
+		cached = self.cache.get(key, argument_index)
+
+		if cached is None:
+			return key, None
+
+		test_result, files = cached
+		self.cached_files.setdefault(test_name, set()).update(files)
+
+		return key, test_result
+
+	def _add_uncached(self, test_name: str, key: Optional[str], test_result: TestResult):
+		"""
+		Remember passed test case to store it in the cache once its test ends
+
+		:param		test_name:	  The test name
+		:type		test_name:	  str
+		:param		key:		  The cache key
+		:type		key:		  Optional[str]
+		:param		test_result:  The test result
+		:type		test_result:  TestResult
+		"""
+		if key is not None and test_result.status == "success":
+			self.uncached.setdefault(test_name, []).append((key, test_result))
+
+	def _iter_cases(
+		self, test: Union[Awaitable, Callable]
+	) -> Iterator[Tuple[Optional[int], Optional[Argument]]]:
+		"""
+		Iterate over test cases: every argument set of parametrized test, or
+		the test itself without arguments
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	argument index and argument set of every case
+		:rtype:		Iterator[Tuple[Optional[int], Optional[Argument]]]
+		"""
+		return iter_cases(self._get_record(test).arguments)
+
+	def _execute_case(
+		self,
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		argument_index: Optional[int],
+		argument: Optional[Argument],
+	) -> TestResult:
+		"""
+		Execute all launches of test case, stopping at the first failed one
+
+		:param		test_name:		 The test name
+		:type		test_name:		 str
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		argument:		 The argument set
+		:type		argument:		 Optional[Argument]
+
+		:returns:	test case result
+		:rtype:		TestResult
+		"""
+		key, cached = self._get_cached(test_name, test, argument_index, argument)
+
+		if cached is not None:
+			return cached
+
+		record = self._get_record(test)
+
+		if self.dry_run:
+			return TestResult(
+				status="dryrun",
+				postmessage=describe_argument(argument, width=60),
+				invocations=[TestInvocation(0, argument_index, TestOutcome.DRYRUN)],
+				argument_index=argument_index,
+			)
+
+		args, kwargs = (argument.args, argument.kwargs) if argument else ((), {})
+		invocations = []
+		benchmarks = []
+		result = None
+
+		try:
+			if record.benchmark is not None:
+				self._run_benchmark(
+					invocations,
+					benchmarks,
+					test_name,
+					argument_index,
+					test,
+					*args,
+					**kwargs,
+				)
+			else:
+				for n in range(record.count_of_launchs):
+					result = self._run_invocation(
+						invocations, n, argument_index, test, *args, **kwargs
+					)
+		except Exception as ex:
+			return self._result_from_exception(test, ex, invocations, argument_index)
+
+		test_result = self._make_result(
+			test, invocations, argument_index, result=result, benchmarks=benchmarks
+		)
+		self._add_uncached(test_name, key, test_result)
+
+		return test_result
+
+	async def _run_launch_async(
+		self,
+		test: Union[Awaitable, Callable],
+		launch: int,
+		argument_index: Optional[int],
+		argument: Optional[Argument],
+		semaphore: asyncio.Semaphore,
+	) -> Tuple[List[TestInvocation], Any, Optional[Exception]]:
+		"""
+		Run one launch of test case inside of the running event loop
+
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		launch:			 The launch number
+		:type		launch:			 int
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		argument:		 The argument set
+		:type		argument:		 Optional[Argument]
+		:param		semaphore:		 The semaphore bounding concurrent launches
+		:type		semaphore:		 asyncio.Semaphore
+
+		:returns:	invocations, function result and raised exception
+		:rtype:		Tuple[List[TestInvocation], Any, Optional[Exception]]
+		"""
+		args, kwargs = (argument.args, argument.kwargs) if argument else ((), {})
+		invocations = []
+
+		async with semaphore:
+			try:
+				result = await self._run_invocation_async(
+					invocations, launch, argument_index, test, *args, **kwargs
+				)
+			except Exception as ex:
+				invocations[-1].traceback = _format_exception(ex)
+				return invocations, None, ex
+
+		return invocations, result, None
+
+	async def _execute_case_async(
+		self,
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		argument_index: Optional[int],
+		argument: Optional[Argument],
+		semaphore: asyncio.Semaphore,
+	) -> TestResult:
+		"""
+		Execute all launches of test case concurrently inside of the running
+		event loop; the case fails if any of its launches fails
+
+		:param		test_name:		 The test name
+		:type		test_name:		 str
+		:param		test:			 The test
+		:type		test:			 TestInfo
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		argument:		 The argument set
+		:type		argument:		 Optional[Argument]
+		:param		semaphore:		 The semaphore bounding concurrent launches
+		:type		semaphore:		 asyncio.Semaphore
+
+		:returns:	test case result
+		:rtype:		TestResult
+		"""
+		key, cached = self._get_cached(test_name, test, argument_index, argument)
+
+		if cached is not None:
+			return cached
+
+		launches = await asyncio.gather(
+			*(
+				self._run_launch_async(test, n, argument_index, argument, semaphore)
+				for n in range(self._get_record(test).count_of_launchs)
+			)
+		)
+		invocations = []
+		error = None
+		result = None
+
+		for launch_invocations, launch_result, launch_error in launches:
+			invocations.extend(launch_invocations)
+			result = launch_result
+
+			if error is None:
+				error = launch_error
+
+		if error is not None:
+			return self._result_from_exception(test, error, invocations, argument_index)
+
+		test_result = self._make_result(test, invocations, argument_index, result=result)
+		self._add_uncached(test_name, key, test_result)
+
+		return test_result
+
+	def _is_thread_safe(self, test: Union[Awaitable, Callable]) -> bool:
+		"""
+		Determines whether the test can run outside of the runner thread: the
+		event loop and fixture scopes are not shared between threads, and
+		benchmarks need the CPU to themselves.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	True if test can run in a thread pool, False otherwise.
+		:rtype:		bool
+		"""
+		return (
+			not self._is_async_test(test)
+			and not self.fixtures.get_requested(test)
+			and self._get_record(test).benchmark is None
+		)
+
+	def _can_run_in_thread(self, test: Union[Awaitable, Callable]) -> bool:
+		"""
+		Determines whether cases of the test can run in the thread pool; cases
+		of tests with timeout run one by one, as each of them already runs in
+		a thread of its own.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	True if cases can run in the thread pool, False otherwise.
+		:rtype:		bool
+		"""
+		return (
+			self.case_executor is not None
+			and self._is_thread_safe(test)
+			and self._get_timeout(test) is None
+		)
+
+	def _execute_test(
+		self, tags: List[str], test_name: str, test: Union[Awaitable, Callable]
+	) -> Iterator[TestResult]:
+		"""
+		Execute test, case by case while its argument sets are consumed
+
+		:param		tags:		The tags
+		:type		tags:		List[str]
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		test:		The test
+		:type		test:		TestInfo
+
+		:returns:	results of test cases
+		:rtype:		Iterator[TestResult]
+		"""
+		try:
+			self._check_skip(tags, test)
+		except Exception as ex:
+			# skipped test or failed marker condition, no case is executed
+			yield self._result_from_exception(test, ex, [])
+			return
+
+		if not self._can_run_in_thread(test):
+			for index, argument in self._iter_cases(test):
+				yield self._execute_case(test_name, test, index, argument)
+
+			return
+
+		# only a window of cases is submitted ahead of the reported one
+		window = deque()
+
+		for index, argument in self._iter_cases(test):
+			window.append(
+				self.case_executor.submit(
+					contextvars.copy_context().run,
+					self._execute_case,
+					test_name,
+					test,
+					index,
+					argument,
+				)
+			)
+
+			if len(window) >= self.case_threads * 2:
+				yield window.popleft().result()
+
+		while window:
+			yield window.popleft().result()
+
+	async def _produce_cases_async(
+		self,
+		tags: List[str],
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		semaphore: asyncio.Semaphore,
+		queue: asyncio.Queue,
+	):
+		"""
+		Schedule cases of async test one by one inside of the running event
+		loop; the queue is bounded, so argument sets are pulled only as fast
+		as the results are reported. None marks the end of cases.
+
+		:param		tags:		The tags
+		:type		tags:		List[str]
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		test:		The test
+		:type		test:		TestInfo
+		:param		semaphore:	The semaphore bounding concurrent launches
+		:type		semaphore:	asyncio.Semaphore
+		:param		queue:		The queue of scheduled cases
+		:type		queue:		asyncio.Queue
+		"""
+		loop = asyncio.get_running_loop()
+
+		try:
+			self._check_skip(tags, test)
+		except Exception as ex:
+			# skipped test or failed marker condition, no case is executed
+			case = loop.create_future()
+			case.set_result(self._result_from_exception(test, ex, []))
+			await queue.put(case)
+			await queue.put(None)
+			return
+
+		try:
+			for index, argument in self._iter_cases(test):
+				await queue.put(
+					asyncio.ensure_future(
+						self._execute_case_async(
+							test_name, test, index, argument, semaphore
+						)
+					)
+				)
+		except Exception as ex:
+			case = loop.create_future()
+			case.set_exception(ex)
+			await queue.put(case)
+
+		await queue.put(None)
+
+	async def _start_async_tests(
+		self, tags: List[str], concurrency: int
+	) -> Dict[str, Tuple[asyncio.Queue, asyncio.Task]]:
+		"""
+		Start all async tests concurrently
+
+		:param		tags:		  The tags
+		:type		tags:		  List[str]
+		:param		concurrency:  The maximum of simultaneously running launches
+		:type		concurrency:  int
+
+		:returns:	queues of scheduled cases and their producers by test name
+		:rtype:		Dict[str, Tuple[asyncio.Queue, asyncio.Task]]
+		"""
+		semaphore = asyncio.Semaphore(concurrency)
+		streams = {}
+
+		for name, test in self.tests.items():
+			if self._is_async_test(test) and self._get_record(test).benchmark is None:
+				queue = asyncio.Queue(maxsize=concurrency)
+
+				with self._record(name):
+					streams[name] = (
+						queue,
+						asyncio.ensure_future(
+							self._produce_cases_async(
+								tags, name, test, semaphore, queue
+							)
+						),
+					)
+
+		return streams
+
+	def _iter_async_results(self, queue: asyncio.Queue) -> Iterator[TestResult]:
+		"""
+		Iterate over results of async test cases in their order, running the
+		event loop while waiting for each of them
+
+		:param		queue:	The queue of scheduled cases
+		:type		queue:	asyncio.Queue
+
+		:returns:	results of test cases
+		:rtype:		Iterator[TestResult]
+		"""
+		loop = self._get_loop()
+
+		while True:
+			case = loop.run_until_complete(queue.get())
+
+			if case is None:
+				return
+
+			yield loop.run_until_complete(case)
+
+	def _cancel_async_tests(self, streams: Dict[str, Tuple[asyncio.Queue, asyncio.Task]]):
+		"""
+		Cancel async tests which are still scheduled
+
+		:param		streams:  The queues of scheduled cases and their producers
+		:type		streams:  Dict[str, Tuple[asyncio.Queue, asyncio.Task]]
+		"""
+		tasks = []
+
+		for queue, producer in streams.values():
+			tasks.append(producer)
+
+			while not queue.empty():
+				case = queue.get_nowait()
+
+				if case is not None:
+					tasks.append(case)
+
+		pending = [task for task in tasks if not task.done()]
+
+		for task in pending:
+			task.cancel()
+
+		if pending:
+			self._get_loop().run_until_complete(
+				asyncio.gather(*pending, return_exceptions=True)
+			)
+
+	def _produce_cases_in_thread(
+		self,
+		tags: List[str],
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		channel: SimpleQueue,
+	):
+		"""
+		Execute sync test inside of the thread pool, putting results of its
+		cases to the channel as they end. An exception raised by the test is
+		put instead of result, None marks the end of cases.
+
+		:param		tags:		The tags
+		:type		tags:		List[str]
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		test:		The test
+		:type		test:		TestInfo
+		:param		channel:	The channel of results
+		:type		channel:	SimpleQueue
+		"""
+		try:
+			for test_result in self._execute_test(tags, test_name, test):
+				if self.stopping.is_set():
+					break
+
+				channel.put(test_result)
+		except BaseException as ex:
+			channel.put(ex)
+		finally:
+			channel.put(None)
+
+	def _start_thread_tests(
+		self, tags: List[str], dispatched: Dict[str, Future]
+	) -> Dict[str, SimpleQueue]:
+		"""
+		Start sync tests in the thread pool, except the ones dispatched to
+		worker processes
+
+		:param		tags:		 The tags
+		:type		tags:		 List[str]
+		:param		dispatched:	 The tests dispatched to worker processes
+		:type		dispatched:	 Dict[str, Future]
+
+		:returns:	channels of results by test name
+		:rtype:		Dict[str, SimpleQueue]
+		"""
+		channels = {}
+
+		for name, test in self.tests.items():
+			if name in dispatched or not self._is_thread_safe(test):
+				continue
+
+			channel = SimpleQueue()
+
+			with self._record(name):
+				self.thread_tests.append(
+					self.test_executor.submit(
+						contextvars.copy_context().run,
+						self._produce_cases_in_thread,
+						tags,
+						name,
+						test,
+						channel,
+					)
+				)
+
+			channels[name] = channel
+
+		return channels
+
+	def _iter_thread_results(self, channel: SimpleQueue) -> Iterator[TestResult]:
+		"""
+		Iterate over results of test cases running in the thread pool, waiting
+		for each of them
+
+		:param		channel:  The channel of results
+		:type		channel:  SimpleQueue
+
+		:returns:	results of test cases
+		:rtype:		Iterator[TestResult]
+		"""
+		while True:
+			test_result = channel.get()
+
+			if test_result is None:
+				return
+
+			if isinstance(test_result, BaseException):
+				raise test_result
+
+			yield test_result
+
+	def _dispatch_tests(self, tags: List[str]) -> Dict[str, Future]:
+		"""
+		Send tests for execution outside of the runner process
+
+		:param		tags:  The tags
+		:type		tags:  List[str]
+
+		:returns:	pending test records by test name
+		:rtype:		Dict[str, Future]
+		"""
+		return {}
+
+	def _check_warnings(self, result: Any, results: list, percent: int, test_name: str):
+		"""
+		Check warnings in test
+
+		:param		result:		The result
+		:type		result:		Any
+		:param		results:	The results
+		:type		results:	list
+		:param		percent:	The percent
+		:type		percent:	int
+		:param		test_name:	The test name
+		:type		test_name:	str
+		"""
+		if len(results) > 0 and results[-1] == result and result is not None:
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="warning",
+				output=f"Last result is equals current result ({results[-1]} == {result})",
+			)
+			self.testcase.warnings += 1
+			self.testcase.passed += 1
+
+	def _processing_tests_execution(
+		self,
+		test_num: int,
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		test_result: TestResult,
+	):
+		"""
+		Processing tests execution result
+
+		:param		test_num:	  The test number
+		:type		test_num:	  int
+		:param		test_name:	  The test name
+		:type		test_name:	  str
+		:param		test:		  The test
+		:type		test:		  TestInfo
+		:param		test_result:  The test result
+		:type		test_result:  TestResult
+		"""
+		percent = int((test_num / self.tests_count) * 100)
+		results = []
+
+		record = self._get_record(test)
+
+		for listener in self.listeners:
+			listener.add_result(test_name, record.line, test_result)
+
+		if test_result.argument_index is not None:
+			test_name = f"{test_name}[{test_result.argument_index}]"
+
+		test_name = f"{test_name}:[line {record.line}]"
+		self.cases += 1
+
+		if any(
+			invocation.outcome.will_fail_session for invocation in test_result.invocations
+		):
+			self.failures += 1
+
+		if test_result.status == "skip":
+			self.testcase.skipped += 1
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="skip",
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+		elif test_result.status == "timeout":
+			self.testcase.timeouts += 1
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="timeout",
+				output=test_result.output,
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+		elif test_result.status == "error":
+			self.testcase.errors += 1
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="error",
+				output=test_result.output,
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+		elif test_result.status == "xfail":
+			self.testcase.xfailed += 1
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="xfail",
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+		elif test_result.status == "xpass":
+			self.testcase.xpassed += 1
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="xpass",
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+		elif test_result.status == "dryrun":
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				status="dryrun",
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+		else:
+			self._check_warnings(test_result.result, results, percent, test_name)
+
+			results.append(test_result.result)
+
+			self.testcase.passed += 1
+
+			self.reporter.print_test_result(
+				percent,
+				test_name,
+				postmessage=test_result.postmessage,
+				comment=record.comment,
+			)
+
+	def _is_stopped(self) -> bool:
+		"""
+		Determines whether the chain has to stop after too many failed cases.
+
+		:returns:	True if stopped, False otherwise.
+		:rtype:		bool
+		"""
+		return self.max_failures is not None and self.failures >= self.max_failures
+
+	def _record(self, test_name: str) -> ContextManager:
+		"""
+		Record code and lines executed by test in the current context, tasks
+		and threads started from it
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+
+		:returns:	recording context
+		:rtype:		ContextManager
+		"""
+		stack = ExitStack()
+
+		if self.tracer is not None:
+			stack.enter_context(
+				self.tracer.recording(self.recorded.setdefault(test_name, set()))
+			)
+
+		if self.line_tracer is not None:
+			stack.enter_context(
+				self.line_tracer.recording(self.covered.setdefault(test_name, set()))
+			)
+
+		return stack
+
+	def _get_files(
+		self,
+		test_name: str,
+		test: Union[Awaitable, Callable],
+		files: Iterable[str] = (),
+	) -> Set[str]:
+		"""
+		Gets the files executed by test: recorded ones, the ones of its cached
+		cases and the file of test itself
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		test:		The test
+		:type		test:		TestInfo
+		:param		files:		The files recorded in worker process
+		:type		files:		Iterable[str]
+
+		:returns:	paths of files
+		:rtype:		Set[str]
+		"""
+		recorded = self.recorded.pop(test_name, ())
+		files = set(files) | self.cached_files.pop(test_name, set())
+
+		if self.tracer is not None:
+			files |= self.tracer.get_files(recorded)
+
+		files.add(os.path.abspath(inspect.unwrap(test).__code__.co_filename))
+
+		return files
+
+	def _update_selection(self, test_name: str, statuses: Set[str], files: Set[str]):
+		"""
+		Save files executed by test for incremental selection
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		statuses:	The statuses of test cases
+		:type		statuses:	Set[str]
+		:param		files:		The files executed by test
+		:type		files:		Set[str]
+		"""
+		if self.selection is None or statuses <= {"skip", "dryrun"}:
+			return
+
+		self.selection.update(test_name, files, failed=bool(statuses & FAILED_STATUSES))
+
+	def _update_cache(self, test_name: str, files: Set[str]):
+		"""
+		Store passed cases of test in the cache
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		files:		The files executed by test
+		:type		files:		Set[str]
+		"""
+		for key, test_result in self.uncached.pop(test_name, ()):
+			self.cache.put(key, test_result, files)
+
+	def _needs_recording(self, test: Union[Awaitable, Callable]) -> bool:
+		"""
+		Determines whether files executed by test have to be recorded.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	True if files have to be recorded, False otherwise.
+		:rtype:		bool
+		"""
+		return self.selection is not None or (
+			self.cache is not None and self._get_record(test).cacheable
+		)
+
+	def _update_coverage(self, test_name: str, lines: Dict[str, bytes]):
+		"""
+		Save lines executed by test
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		lines:		The line bitmaps by file collected in worker process
+		:type		lines:		Dict[str, bytes]
+		"""
+		covered = self.covered.pop(test_name, ())
+
+		if self.coverage is None:
+			return
+
+		self.coverage.add_lines(test_name, self.line_tracer.get_lines(covered))
+		self.coverage.add_lines(
+			test_name, {path: from_numbits(bits) for path, bits in lines.items()}
+		)
+
+	def launch_test_chain(self, tags: List[str], concurrency: Optional[int] = None):
+		"""
+		Launch test chain
+
+		With concurrency all async tests are started up front on the shared
+		event loop, every argument set and launch of them as a separate task, at
+		most `concurrency` at a time; the event loop runs while the runner waits
+		for their results, which are still reported in registration order, one
+		line per argument set.
+
+		With threads all sync tests are started up front in a pool of
+		`threads` threads (one test per thread, so blocking I/O overlaps, and
+		free-threaded builds of Python run them in parallel); their results
+		are passed back through a channel of every test, and are reported
+		and counted by the runner thread alone, in registration order.
+
+		Benchmarks run alone in the runner thread: before the first of them
+		the runner waits until the tests in thread and process pools end,
+		their results are reported later as usual.
+
+		With `max_failures` the chain stops once that many cases failed: the
+		scheduled async cases and the queued cases of thread and process pools
+		are cancelled, the running ones are awaited but not reported.
+
+		:param		tags:		  The tags
+		:type		tags:		  List[str]
+		:param		concurrency:  The maximum of simultaneously running async launches
+		:type		concurrency:  int
+		"""
+		if self.case_threads:
+			self.case_executor = ThreadPoolExecutor(
+				max_workers=self.case_threads, thread_name_prefix="pyzitadelle-case"
+			)
+
+		if self.threads:
+			self.test_executor = ThreadPoolExecutor(
+				max_workers=self.threads, thread_name_prefix="pyzitadelle-test"
+			)
+
+		exclusive = not concurrency and not self.case_threads and not self.threads
+
+		if any(map(self._needs_recording, self.tests.values())):
+			self.tracer = DependencyTracer(exclusive=exclusive)
+			self.tracer.install()
+
+		if self.coverage is not None:
+			self.line_tracer = LineTracer(exclusive=exclusive)
+			self.line_tracer.install()
+
+		streams = {}
+		pending = {}
+		channels = {}
+
+		try:
+			pending = self._dispatch_tests(tags)
+
+			if self.test_executor is not None:
+				channels = self._start_thread_tests(tags, pending)
+
+			if concurrency:
+				streams = self._get_loop().run_until_complete(
+					self._start_async_tests(tags, concurrency)
+				)
+
+			for test_num, (test_name, test) in enumerate(self.tests.items(), start=1):
+				statuses = set()
+				files = ()
+				lines = {}
+
+				with self._record(test_name):
+					if test_name in pending:
+						records, files, lines = pending[test_name].result()
+						test_results = map(_unpack_result, records)
+					elif test_name in streams:
+						test_results = self._iter_async_results(streams[test_name][0])
+					elif test_name in channels:
+						test_results = self._iter_thread_results(channels[test_name])
+					else:
+						if self._get_record(test).benchmark is not None:
+							wait([*self.thread_tests, *pending.values()])
+
+						test_results = self._execute_test(tags, test_name, test)
+
+					for test_result in test_results:
+						statuses.add(test_result.status)
+						self._processing_tests_execution(
+							test_num, test_name, test, test_result
+						)
+
+						if self._is_stopped():
+							break
+
+				if self.tracer is not None:
+					files = self._get_files(test_name, test, files)
+					self._update_selection(test_name, statuses, files)
+					self._update_cache(test_name, files)
+
+				self._update_coverage(test_name, lines)
+
+				if self._is_stopped():
+					self.reporter.print_header(
+						f"stopped after {self.failures} failures", style="bold red"
+					)
+					break
+		finally:
+			self._cancel_async_tests(streams)
+			self.stopping.set()
+
+			if self.test_executor is not None:
+				self.test_executor.shutdown(cancel_futures=True)
+				self.test_executor = None
+				self.thread_tests = []
+
+			for future in pending.values():
+				future.cancel()
+
+			if self.case_executor is not None:
+				self.case_executor.shutdown(cancel_futures=True)
+				self.case_executor = None
+
+			# in reverse order of install
+			if self.line_tracer is not None:
+				self.line_tracer.uninstall()
+				self.line_tracer = None
+
+			if self.tracer is not None:
+				self.tracer.uninstall()
+				self.tracer = None
+
+			self._finalize()
+			self.reporter.flush()
+
+
+def _init_worker():
+	"""
+	Initialize pool worker: test modules imported by it must not start
+	sessions of their own.
+	"""
+	# imported here, test_case imports this module
+	from pyzitadelle import test_case
+
+	test_case._collecting = True
+
+
+def _resolve_test(module_name: str, qualname: str) -> Union[Awaitable, Callable]:
+	"""
+	Resolve test function by module-qualified name
+
+	:param		module_name:  The module name
+	:type		module_name:  str
+	:param		qualname:	  The qualified name
+	:type		qualname:	  str
+
+	:returns:	test function
+	:rtype:		TestInfo
+	"""
+	test = sys.modules.get(module_name)
+
+	if test is None:
+		test = importlib.import_module(module_name)
+
+	for part in qualname.split("."):
+		test = getattr(test, part)
+
+	return test
+
+
+def _pack_result(test_result: TestResult) -> tuple:
+	"""
+	Pack test result to compact picklable record, the return value of test
+	is dropped
+
+	:param		test_result:  The test result
+	:type		test_result:  TestResult
+
+	:returns:	record
+	:rtype:		tuple
+	"""
+	return (
+		test_result.status,
+		test_result.output,
+		test_result.postmessage,
+		test_result.argument_index,
+		[
+			(
+				invocation.launch,
+				invocation.argument_index,
+				invocation.outcome.value,
+				invocation.duration_ns,
+				invocation.traceback,
+			)
+			for invocation in test_result.invocations
+		],
+	)
+
+
+def _unpack_result(record: tuple) -> TestResult:
+	"""
+	Unpack test result from compact record
+
+	:param		record:	 The record
+	:type		record:	 tuple
+
+	:returns:	test result
+	:rtype:		TestResult
+	"""
+	status, output, postmessage, argument_index, invocations = record
+
+	return TestResult(
+		status=status,
+		output=output,
+		postmessage=postmessage,
+		argument_index=argument_index,
+		invocations=[
+			TestInvocation(launch, index, TestOutcome(outcome), duration, tb)
+			for launch, index, outcome, duration, tb in invocations
+		],
+	)
+
+
+def _call_with_alarm(test: Callable, args: tuple, kwargs: dict, timeout: float) -> Any:
+	"""
+	Call sync test, interrupting it with SIGALRM when it runs out of time
+
+	:param		test:				 The test
+	:type		test:				 Callable
+	:param		args:				 The arguments
+	:type		args:				 tuple
+	:param		kwargs:				 The keywords arguments
+	:type		kwargs:				 dict
+	:param		timeout:			 The timeout
+	:type		timeout:			 float
+
+	:returns:	function result
+	:rtype:		Any
+
+	:raises		TestTimeoutError:	 test timed out
+	"""
+
+	def interrupt(signum, frame):
+		raise TestTimeoutError(f"Test killed after {timeout}s")
+
+	previous = signal.signal(signal.SIGALRM, interrupt)
+	signal.setitimer(signal.ITIMER_REAL, timeout)
+
+	try:
+		return test(*args, **kwargs)
+	finally:
+		signal.setitimer(signal.ITIMER_REAL, 0)
+		signal.signal(signal.SIGALRM, previous)
+
+
+def _execute_in_worker(
+	module_name: str,
+	qualname: str,
+	tags: List[str],
+	timeout: Optional[float],
+	record: bool = False,
+	coverage: bool = False,
+	cache_directory: Optional[str] = None,
+	cache_size: int = DEFAULT_CACHE_SIZE,
+	case_threads: Optional[int] = None,
+	max_failures: Optional[int] = None,
+) -> Tuple[List[tuple], List[str], Dict[str, bytes]]:
+	"""
+	Execute test inside of the pool worker process
+
+	The worker does not know about failures of other tests, so it stops
+	after `max_failures` failed cases of this test; the runner stops the
+	whole chain.
+
+	:param		module_name:	  The module name
+	:type		module_name:	  str
+	:param		qualname:		  The qualified name
+	:type		qualname:		  str
+	:param		tags:			  The tags
+	:type		tags:			  List[str]
+	:param		timeout:		  The default timeout
+	:type		timeout:		  Optional[float]
+	:param		record:			  Record files executed by test
+	:type		record:			  bool
+	:param		coverage:		  Collect lines executed by test
+	:type		coverage:		  bool
+	:param		cache_directory:  The directory of result cache
+	:type		cache_directory:  Optional[str]
+	:param		cache_size:		  The maximum size of result cache
+	:type		cache_size:		  int
+	:param		case_threads:	  The count of threads running cases of test
+	:type		case_threads:	  Optional[int]
+	:param		max_failures:	  Stop after this many failed cases
+	:type		max_failures:	  Optional[int]
+
+	:returns:	compact records of test cases, files and line bitmaps by file
+				executed by test
+	:rtype:		Tuple[List[tuple], List[str], Dict[str, bytes]]
+	"""
+	test = _resolve_test(module_name, qualname)
+	runner = Runner({}, None, timeout=timeout, case_threads=case_threads)
+	runner.interrupt_on_timeout = True
+
+	if case_threads:
+		runner.case_executor = ThreadPoolExecutor(
+			max_workers=case_threads, thread_name_prefix="pyzitadelle-case"
+		)
+
+	if cache_directory is not None:
+		runner.cache = ResultCache(cache_directory, cache_size)
+	files = []
+	lines = {}
+
+	if record:
+		runner.tracer = DependencyTracer()
+		runner.tracer.install()
+
+	if coverage:
+		runner.line_tracer = LineTracer()
+		runner.line_tracer.install()
+
+	records = []
+	failures = 0
+
+	try:
+		with runner._record(qualname):
+			for test_result in runner._execute_test(tags, qualname, test):
+				records.append(_pack_result(test_result))
+
+				if any(
+					invocation.outcome.will_fail_session
+					for invocation in test_result.invocations
+				):
+					failures += 1
+
+					if max_failures is not None and failures >= max_failures:
+						break
+	finally:
+		if runner.case_executor is not None:
+			runner.case_executor.shutdown(cancel_futures=True)
+
+		runner._finalize()
+
+		if coverage:
+			runner.line_tracer.uninstall()
+
+		if record:
+			runner.tracer.uninstall()
+
+	if record:
+		files = runner._get_files(qualname, test)
+		runner._update_cache(qualname, files)
+		files = sorted(files)
+
+	if coverage:
+		lines = {
+			path: to_numbits(numbers)
+			for path, numbers in runner.line_tracer.get_lines(
+				runner.covered.pop(qualname)
+			).items()
+		}
+
+	return records, files, lines
+
+
+class ProcessPoolRunner(Runner):
+	"""
+	This class describes a runner session which executes sync tests in a pool
+	of worker processes.
+
+	Tests are sent to workers by module-qualified name, so only tests defined
+	at module level can be dispatched; the rest (and all async tests,
+	benchmarks and tests requesting fixtures) run in the runner process.
+	Under the "spawn" start method the test module is imported again in
+	every worker, so `run()` must be guarded with
+	`if __name__ == "__main__"` there.
+	"""
+
+	def __init__(
+		self,
+		tests: int,
+		testcase: object,
+		workers: int,
+		reporter: Optional[BaseReporter] = None,
+		listeners: Optional[List[ResultListener]] = None,
+		timeout: Optional[float] = None,
+		baseline: Optional[BenchmarkBaseline] = None,
+		case_threads: Optional[int] = None,
+		selection: Optional[TestSelection] = None,
+		coverage: Optional[CoverageData] = None,
+		cache: Optional[ResultCache] = None,
+		max_failures: Optional[int] = None,
+		threads: Optional[int] = None,
+	):
+		"""
+		Constructs a new instance.
+
+		:param		tests:		   The tests
+		:type		tests:		   int
+		:param		testcase:	   The testcase
+		:type		testcase:	   TestCase
+		:param		workers:	   The count of worker processes
+		:type		workers:	   int
+		:param		reporter:	   The reporter
+		:type		reporter:	   BaseReporter
+		:param		listeners:	   The result listeners
+		:type		listeners:	   List[ResultListener]
+		:param		timeout:	   The default timeout of test invocation in seconds
+		:type		timeout:	   Optional[float]
+		:param		baseline:	   The benchmark baseline
+		:type		baseline:	   Optional[BenchmarkBaseline]
+		:param		case_threads:  The count of threads running cases of sync tests
+		:type		case_threads:  Optional[int]
+		:param		selection:	   The incremental test selection
+		:type		selection:	   Optional[TestSelection]
+		:param		coverage:	   The line coverage data
+		:type		coverage:	   Optional[CoverageData]
+		:param		cache:		   The cache of passed cacheable test cases
+		:type		cache:		   Optional[ResultCache]
+		:param		max_failures:  Stop the chain after this many failed cases
+		:type		max_failures:  Optional[int]
+		:param		threads:	   The count of threads running sync tests
+		:type		threads:	   Optional[int]
+		"""
+		super().__init__(
+			tests,
+			testcase,
+			reporter=reporter,
+			listeners=listeners,
+			timeout=timeout,
+			baseline=baseline,
+			case_threads=case_threads,
+			selection=selection,
+			coverage=coverage,
+			cache=cache,
+			max_failures=max_failures,
+			threads=threads,
+		)
+		self.workers = workers
+		self.executor: Optional[ProcessPoolExecutor] = None
+
+	def _get_test_address(
+		self, test: Union[Awaitable, Callable]
+	) -> Optional[Tuple[str, str]]:
+		"""
+		Gets the module-qualified name of test if a worker can resolve it.
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	module name and qualified name, None otherwise
+		:rtype:		Optional[Tuple[str, str]]
+		"""
+		module_name = getattr(test, "__module__", None)
+		qualname = getattr(test, "__qualname__", None)
+
+		if module_name is None or qualname is None or "<locals>" in qualname:
+			return None
+
+		try:
+			resolved = _resolve_test(module_name, qualname)
+		except (ImportError, AttributeError):
+			return None
+
+		if inspect.unwrap(resolved) is not inspect.unwrap(test):
+			return None
+
+		return module_name, qualname
+
+	def _dispatch_tests(self, tags: List[str]) -> Dict[str, Future]:
+		"""
+		Send sync tests to the worker processes
+
+		:param		tags:  The tags
+		:type		tags:  List[str]
+
+		:returns:	pending test records by test name
+		:rtype:		Dict[str, Future]
+		"""
+		pending = {}
+
+		for test_name, test in self.tests.items():
+			record = self._get_record(test)
+			cache = self.cache if record.cacheable else None
+
+			if (
+				record.is_async
+				or self.fixtures.get_requested(test)
+				or record.benchmark is not None
+				or (
+					self.selection is not None
+					and self.selection.is_unchanged(test_name)
+				)
+			):
+				continue
+
+			address = self._get_test_address(test)
+
+			if address is not None:
+				pending[test_name] = self.executor.submit(
+					_execute_in_worker,
+					*address,
+					tags,
+					self.timeout,
+					self._needs_recording(test),
+					self.coverage is not None,
+					str(cache.directory) if cache is not None else None,
+					cache.max_size if cache is not None else DEFAULT_CACHE_SIZE,
+					self.case_threads,
+					self.max_failures,
+				)
+
+		return pending
+
+	def launch_test_chain(self, tags: List[str], concurrency: Optional[int] = None):
+		"""
+		Launch test chain
+
+		:param		tags:		  The tags
+		:type		tags:		  List[str]
+		:param		concurrency:  The maximum of simultaneously running async tests
+		:type		concurrency:  int
+		"""
+		if "fork" in multiprocessing.get_all_start_methods():
+			context = multiprocessing.get_context("fork")
+		else:
+			context = multiprocessing.get_context()
+
+		with ProcessPoolExecutor(
+			max_workers=self.workers, mp_context=context, initializer=_init_worker
+		) as executor:
+			self.executor = executor
+
+			try:
+				super().launch_test_chain(tags, concurrency)
+			finally:
+				self.executor = None
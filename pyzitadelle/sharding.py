@@ -0,0 +1,234 @@
+import hashlib
+import heapq
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from pyzitadelle.exceptions import TestValidationError
+from pyzitadelle.history import RunHistory
+from pyzitadelle.reporter import BaseReporter, get_reporter
+
+SUMMARY_COUNTS = (
+	"total",
+	"passed",
+	"warnings",
+	"errors",
+	"skipped",
+	"timeouts",
+	"xfailed",
+	"xpassed",
+)
+
+
+def validate_shard(shard: Optional[int], total_shards: Optional[int]):
+	"""
+	Validate shard options
+
+	:param		shard:				  The shard index
+	:type		shard:				  Optional[int]
+	:param		total_shards:		  The count of shards
+	:type		total_shards:		  Optional[int]
+
+	:raises		TestValidationError:  only one of options is given or they are out of range
+	"""
+	if shard is None and total_shards is None:
+		return
+
+	if shard is None or total_shards is None:
+		raise TestValidationError("shard and total_shards must be given together")
+
+	if not isinstance(total_shards, int) or total_shards < 1:
+		raise TestValidationError("total_shards must be a positive integer")
+
+	if not isinstance(shard, int) or not 0 <= shard < total_shards:
+		raise TestValidationError(f"shard must be in range 0..{total_shards - 1}")
+
+
+def _get_hash_shard(test_name: str, total_shards: int) -> int:
+	digest = hashlib.sha1(test_name.encode()).digest()
+
+	return int.from_bytes(digest[:8], "big") % total_shards
+
+
+def split_tests(
+	test_names: Iterable[str],
+	total_shards: int,
+	durations: Optional[Dict[str, int]] = None,
+) -> List[List[str]]:
+	"""
+	Split tests into shards
+
+	Without durations every test goes to the shard chosen by hash of its
+	name. With durations the split is greedy longest-processing-time: the
+	longest test goes to the least loaded shard, tests without duration are
+	counted with the mean one. Both splits only depend on their input, so
+	every node computes the same one.
+
+	:param		test_names:	   The test names
+	:type		test_names:	   Iterable[str]
+	:param		total_shards:  The count of shards
+	:type		total_shards:  int
+	:param		durations:	   The known durations of tests in nanoseconds
+	:type		durations:	   Optional[Dict[str, int]]
+
+	:returns:	test names of every shard in their original order
+	:rtype:		List[List[str]]
+	"""
+	test_names = list(test_names)
+	shards: List[List[str]] = [[] for _ in range(total_shards)]
+
+	if not durations:
+		for test_name in test_names:
+			shards[_get_hash_shard(test_name, total_shards)].append(test_name)
+
+		return shards
+
+	mean = sum(durations.values()) // len(durations)
+	positions = {test_name: n for n, test_name in enumerate(test_names)}
+	loads = [(0, index) for index in range(total_shards)]
+
+	for test_name in sorted(
+		test_names, key=lambda name: (-durations.get(name, mean), name)
+	):
+		load, index = heapq.heappop(loads)
+		shards[index].append(test_name)
+		heapq.heappush(loads, (load + durations.get(test_name, mean), index))
+
+	for shard in shards:
+		shard.sort(key=positions.__getitem__)
+
+	return shards
+
+
+def select_shard(
+	tests: Dict[str, Any],
+	shard: int,
+	total_shards: int,
+	history: Optional[RunHistory] = None,
+) -> Dict[str, Any]:
+	"""
+	Select tests of shard, balanced by durations from history when any are
+	known
+
+	Every node has to compute the same split, so the history has to be the
+	same file on all of them (see merge_histories), not the local history of
+	node, which only knows durations of tests of its own shard.
+
+	:param		tests:		   The tests by name
+	:type		tests:		   Dict[str, TestInfo]
+	:param		shard:		   The shard index
+	:type		shard:		   int
+	:param		total_shards:  The count of shards
+	:type		total_shards:  int
+	:param		history:	   The history shared by all nodes
+	:type		history:	   Optional[RunHistory]
+
+	:returns:	tests of shard by name
+	:rtype:		Dict[str, TestInfo]
+	"""
+	durations = {}
+
+	if history is not None:
+		for test_name in tests:
+			duration = history.get_duration(test_name)
+
+			if duration is not None:
+				durations[test_name] = duration
+
+	names = split_tests(tests, total_shards, durations)[shard]
+
+	return {test_name: tests[test_name] for test_name in names}
+
+
+def merge_histories(paths: Iterable[Union[str, Path]], path: Union[str, Path]):
+	"""
+	Merge run histories of nodes into the history shared by shards of the
+	next run; the latest record of every test wins
+
+	:param		paths:	The paths of node histories
+	:type		paths:	Iterable[Union[str, Path]]
+	:param		path:	The path of merged history
+	:type		path:	Union[str, Path]
+	"""
+	tests: Dict[str, Any] = {}
+
+	for node_path in paths:
+		data = json.loads(Path(node_path).read_text())
+
+		for key, record in data.get("tests", {}).items():
+			previous = tests.get(key)
+
+			if previous is None or record.get("updated_at", 0) >= previous.get(
+				"updated_at", 0
+			):
+				tests[key] = record
+
+	path = Path(path)
+	path.parent.mkdir(parents=True, exist_ok=True)
+
+	temp_path = path.with_name(f"{path.name}.tmp")
+	temp_path.write_text(json.dumps({"version": 1, "tests": tests}, sort_keys=True))
+	os.replace(temp_path, path)
+
+
+def write_summary(path: Union[str, Path], summary: Dict[str, Any]):
+	"""
+	Write results summary of run to JSON file
+
+	:param		path:	  The path
+	:type		path:	  Union[str, Path]
+	:param		summary:  The summary
+	:type		summary:  Dict[str, Any]
+	"""
+	path = Path(path)
+	path.parent.mkdir(parents=True, exist_ok=True)
+
+	temp_path = path.with_name(f"{path.name}.tmp")
+	temp_path.write_text(json.dumps(summary, indent=2, sort_keys=True))
+	os.replace(temp_path, path)
+
+
+def merge_summaries(paths: Iterable[Union[str, Path]]) -> Dict[str, Any]:
+	"""
+	Merge results summaries of shards into one, as if the suite ran once;
+	its duration is the one of the slowest shard
+
+	:param		paths:	The paths of shard summaries
+	:type		paths:	Iterable[Union[str, Path]]
+
+	:returns:	merged summary
+	:rtype:		Dict[str, Any]
+	"""
+	merged: Dict[str, Any] = {count: 0 for count in SUMMARY_COUNTS}
+	merged["tests"] = 0
+	merged["duration"] = 0.0
+	merged["shards"] = []
+
+	for path in paths:
+		summary = json.loads(Path(path).read_text())
+
+		for count in SUMMARY_COUNTS:
+			merged[count] += summary.get(count, 0)
+
+		merged["tests"] += summary.get("tests", 0)
+		merged["duration"] = max(merged["duration"], summary.get("duration", 0.0))
+		merged["shards"].append(summary.get("shard"))
+
+	return merged
+
+
+def print_summary(
+	summary: Dict[str, Any], reporter: Union[str, BaseReporter, None] = None
+):
+	"""
+	Prints the results table of summary.
+
+	:param		summary:   The summary
+	:type		summary:   Dict[str, Any]
+	:param		reporter:  The reporter: "rich" (default), "plain" or instance
+	:type		reporter:  Union[str, BaseReporter]
+	"""
+	reporter = get_reporter(reporter)
+	reporter.print_results_table(*(summary[count] for count in SUMMARY_COUNTS))
+	reporter.flush()
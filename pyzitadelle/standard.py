@@ -1,3 +1,4 @@
+import inspect
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import (
@@ -5,8 +6,16 @@ from typing import (
 	AsyncGenerator,
 	Awaitable,
 	Callable,
+	Dict,
+	FrozenSet,
 	Generator,
+	Iterable,
+	Iterator,
+	List,
+	NamedTuple,
 	Optional,
+	Sequence,
+	Sized,
 	Tuple,
 	Union,
 )
@@ -23,6 +32,7 @@ class TestOutcome(Enum):
 																	XFAIL: The test was expected to fail, and it did fail.
 																	XPASS: The test was expected to fail, however it unexpectedly passed.
 																	DRYRUN: The test was not executed because the test session was a dry-run.
+																	TIMEOUT: The test did not finish in time and was cancelled or abandoned.
 	"""
 
 	PASS = auto()
@@ -31,6 +41,7 @@ class TestOutcome(Enum):
 	XFAIL = auto()	# expected fail
 	XPASS = auto()	# unexpected pass
 	DRYRUN = auto()	 # tests arent executed during dryruns
+	TIMEOUT = auto()
 
 	@property
 	def display_char(self):
@@ -41,6 +52,7 @@ class TestOutcome(Enum):
 			TestOutcome.XPASS: "U",
 			TestOutcome.XFAIL: "x",
 			TestOutcome.DRYRUN: ".",
+			TestOutcome.TIMEOUT: "T",
 		}
 		assert len(display_chars) == len(TestOutcome)
 		return display_chars[self]
@@ -54,13 +66,14 @@ class TestOutcome(Enum):
 			TestOutcome.XPASS: "Unexpected Passes",
 			TestOutcome.XFAIL: "Expected Failures",
 			TestOutcome.DRYRUN: "Dry-runs",
+			TestOutcome.TIMEOUT: "Timeouts",
 		}
 		assert len(display_names) == len(TestOutcome)
 		return display_names[self]
 
 	@property
 	def will_fail_session(self) -> bool:
-		return self in {TestOutcome.FAIL, TestOutcome.XPASS}
+		return self in {TestOutcome.FAIL, TestOutcome.XPASS, TestOutcome.TIMEOUT}
 
 	@property
 	def wont_fail_session(self) -> bool:
@@ -75,15 +88,40 @@ class Argument:
 
 @dataclass
 class Each:
-	args: Tuple[Any]
+	"""
+	Single values of parameter, each one is an argument set; the values may
+	be a generator, which is consumed lazily.
+	"""
+
+	args: Iterable[Any]
+
+	def __iter__(self) -> Iterator[Any]:
+		return iter(self.args)
 
 	def __getitem__(self, args):
+		if not isinstance(self.args, Sequence):
+			raise TypeError(f"Values of {type(self.args).__name__} can not be indexed")
+
 		return self.args[args]
 
 	def __len__(self):
+		if not isinstance(self.args, Sized):
+			raise TypeError(f"Values of {type(self.args).__name__} have no length")
+
 		return len(self.args)
 
 
+@dataclass
+class Product:
+	"""
+	Cartesian product of parameter axes, expanded lazily: positional axes
+	give the positional arguments and named axes the keyword ones.
+	"""
+
+	axes: Tuple[Any, ...] = ()
+	named_axes: Dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class Marker:
 	name: str
@@ -91,11 +129,8 @@ class Marker:
 	when: Union[bool, Callable] = True
 
 	@property
-	def active(self):
-		try:
-			return self.when()
-		except TypeError:
-			return self.when
+	def active(self) -> bool:
+		return bool(self.when() if callable(self.when) else self.when)
 
 
 @dataclass
@@ -116,6 +151,19 @@ class ExpectFailMarkup(Marker):
 	name: str = "XFAIL"
 
 
+@dataclass
+class BenchmarkOptions:
+	"""
+	Options of benchmark test: warmup calls, total measured time (split into
+	rounds of auto-calibrated iterations) and garbage collector switch.
+	"""
+
+	warmup: int = 1
+	target_time: float = 1.0
+	min_rounds: int = 10
+	disable_gc: bool = False
+
+
 @dataclass
 class CollectionMetadata:
 	"""
@@ -128,6 +176,58 @@ class CollectionMetadata:
 	arguments: list = field(default_factory=list)
 	count_of_launchs: int = 1
 	is_fixture: bool = False
+	scope: str = "test"
+	timeout: Optional[float] = None
+	benchmark: Optional[BenchmarkOptions] = None
+	cacheable: bool = False
+
+
+class TestRecord(NamedTuple):
+	"""
+	Metadata of test computed once per run into a compact record, so the
+	runner neither reads the source file nor walks the metadata per case.
+	"""
+
+	name: str
+	line: int
+	is_async: bool
+	tags: FrozenSet[str]
+	marker: Optional[Marker]
+	comment: Optional[str]
+	arguments: Any
+	count_of_launchs: int
+	timeout: Optional[float]
+	benchmark: Optional[BenchmarkOptions]
+	cacheable: bool
+
+	@classmethod
+	def from_test(cls, test: Union[Awaitable, Callable]) -> "TestRecord":
+		"""
+		Build record of test from its collection metadata
+
+		:param		test:  The test
+		:type		test:  TestInfo
+
+		:returns:	test record
+		:rtype:		TestRecord
+		"""
+		meta = test.pztdmeta
+		func = inspect.unwrap(test)
+		code = getattr(func, "__code__", None)
+
+		return cls(
+			name=test.__name__,
+			line=code.co_firstlineno if code is not None else 0,
+			is_async=inspect.iscoroutinefunction(func),
+			tags=frozenset(meta.tags),
+			marker=meta.marker,
+			comment=meta.comment,
+			arguments=meta.arguments,
+			count_of_launchs=meta.count_of_launchs,
+			timeout=meta.timeout,
+			benchmark=meta.benchmark,
+			cacheable=meta.cacheable,
+		)
 
 
 @dataclass
@@ -139,3 +239,36 @@ class Fixture:
 	@property
 	def metadata(self):
 		return self.handler.pztdmeta
+
+
+@dataclass
+class TestInvocation:
+	"""
+	A single call of a test function: one launch with one argument set.
+	"""
+
+	launch: int
+	argument_index: Optional[int]
+	outcome: TestOutcome
+	duration_ns: int = 0
+	traceback: Optional[str] = None
+
+
+# statuses of test cases which fail the session
+FAILED_STATUSES = frozenset(("error", "timeout", "xpass"))
+
+
+@dataclass
+class TestResult:
+	"""
+	Outcome of a single test case (one argument set of test, with all of its
+	launches), collected before it gets reported.
+	"""
+
+	status: str = "success"
+	output: Optional[str] = None
+	postmessage: Optional[str] = ""
+	result: Any = None
+	invocations: List[TestInvocation] = field(default_factory=list)
+	benchmarks: list = field(default_factory=list)
+	argument_index: Optional[int] = None
@@ -0,0 +1,264 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+from pyzitadelle.results import ResultListener
+from pyzitadelle.standard import TestOutcome, TestResult
+
+_MAGIC = b"PZRS"
+_VERSION = 1
+# magic, version, byte order, rows, size of names and tracebacks blocks
+_HEADER = struct.Struct("<4sHH3Q")
+
+# columns with their array type codes, widest first so every column of the
+# file stays aligned
+_COLUMNS = (
+	("durations", "q"),
+	("test_ids", "I"),
+	("argument_indexes", "i"),
+	("outcomes", "B"),
+)
+
+_BYTE_ORDERS = {"little": 0, "big": 1}
+
+
+class StoredInvocation(NamedTuple):
+	"""
+	Row of result store.
+	"""
+
+	test_name: str
+	outcome: TestOutcome
+	duration_ns: int
+	argument_index: Optional[int]
+	traceback: Optional[str]
+
+
+class ResultStore(ResultListener):
+	"""
+	This class describes a columnar store of test invocations: parallel
+	arrays of test id, outcome code, duration and argument index (-1 without
+	arguments), test names interned into a table and tracebacks kept apart
+	by row, so a million invocations take about 17 MB.
+
+	The store can be written to a file and loaded back with its columns
+	memory-mapped; a loaded store is read-only.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.names: List[str] = []
+		self.tracebacks: Dict[int, str] = {}
+		self.durations = array("q")
+		self.test_ids = array("I")
+		self.argument_indexes = array("i")
+		self.outcomes = array("B")
+		self._name_ids: Dict[str, int] = {}
+		self._mmap: Optional[mmap.mmap] = None
+
+	def __len__(self) -> int:
+		return len(self.outcomes)
+
+	def intern(self, name: str) -> int:
+		"""
+		Gets the id of test name, adding it to the table
+
+		:param		name:  The test name
+		:type		name:  str
+
+		:returns:	test id
+		:rtype:		int
+		"""
+		test_id = self._name_ids.get(name)
+
+		if test_id is None:
+			test_id = self._name_ids[name] = len(self.names)
+			self.names.append(name)
+
+		return test_id
+
+	def add(
+		self,
+		test_name: str,
+		outcome: TestOutcome,
+		duration_ns: int = 0,
+		argument_index: Optional[int] = None,
+		traceback: Optional[str] = None,
+	):
+		"""
+		Adds an invocation.
+
+		:param		test_name:		 The test name
+		:type		test_name:		 str
+		:param		outcome:		 The outcome
+		:type		outcome:		 TestOutcome
+		:param		duration_ns:	 The duration in nanoseconds
+		:type		duration_ns:	 int
+		:param		argument_index:	 The argument index
+		:type		argument_index:	 Optional[int]
+		:param		traceback:		 The traceback
+		:type		traceback:		 Optional[str]
+		"""
+		if traceback is not None:
+			self.tracebacks[len(self)] = traceback
+
+		self.durations.append(duration_ns)
+		self.test_ids.append(self.intern(test_name))
+		self.argument_indexes.append(-1 if argument_index is None else argument_index)
+		self.outcomes.append(outcome.value)
+
+	def add_result(self, test_name: str, line: int, test_result: TestResult):
+		for invocation in test_result.invocations:
+			self.add(
+				test_name,
+				invocation.outcome,
+				invocation.duration_ns,
+				invocation.argument_index,
+				invocation.traceback,
+			)
+
+	def get(self, row: int) -> StoredInvocation:
+		"""
+		Gets the invocation stored in row.
+
+		:param		row:  The row
+		:type		row:  int
+
+		:returns:	invocation
+		:rtype:		StoredInvocation
+		"""
+		argument_index = self.argument_indexes[row]
+
+		return StoredInvocation(
+			self.names[self.test_ids[row]],
+			TestOutcome(self.outcomes[row]),
+			self.durations[row],
+			argument_index if argument_index >= 0 else None,
+			self.tracebacks.get(row),
+		)
+
+	def __iter__(self) -> Iterator[StoredInvocation]:
+		for row in range(len(self)):
+			yield self.get(row)
+
+	def count_outcomes(self) -> Dict[TestOutcome, int]:
+		"""
+		Count invocations by outcome
+
+		:returns:	counts by outcome
+		:rtype:		Dict[TestOutcome, int]
+		"""
+		return {
+			TestOutcome(code): count for code, count in Counter(self.outcomes).items()
+		}
+
+	def get_total_durations(self) -> Dict[str, int]:
+		"""
+		Gets the total duration of every test
+
+		:returns:	durations in nanoseconds by test name
+		:rtype:		Dict[str, int]
+		"""
+		totals = [0] * len(self.names)
+
+		for test_id, duration in zip(self.test_ids, self.durations):
+			totals[test_id] += duration
+
+		return dict(zip(self.names, totals))
+
+	def write(self, path: Union[str, Path]):
+		"""
+		Write store to a binary file: header, columns and JSON blocks of
+		names and tracebacks.
+
+		:param		path:  The path
+		:type		path:  Union[str, Path]
+		"""
+		path = Path(path)
+		names = json.dumps(self.names).encode()
+		tracebacks = json.dumps(self.tracebacks).encode()
+
+		path.parent.mkdir(parents=True, exist_ok=True)
+		temp_path = path.with_name(f"{path.name}.tmp")
+
+		with open(temp_path, "wb") as file:
+			file.write(
+				_HEADER.pack(
+					_MAGIC,
+					_VERSION,
+					_BYTE_ORDERS[sys.byteorder],
+					len(self),
+					len(names),
+					len(tracebacks),
+				)
+			)
+
+			for name, _ in _COLUMNS:
+				getattr(self, name).tofile(file)
+
+			file.write(names)
+			file.write(tracebacks)
+
+		os.replace(temp_path, path)
+
+	@classmethod
+	def load(cls, path: Union[str, Path]) -> "ResultStore":
+		"""
+		Load store from file with its columns memory-mapped
+
+		:param		path:		 The path
+		:type		path:		 Union[str, Path]
+
+		:returns:	read-only result store
+		:rtype:		ResultStore
+
+		:raises		ValueError:	 file is not a result store
+		"""
+		store = cls()
+
+		with open(path, "rb") as file:
+			store._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+		view = memoryview(store._mmap)
+
+		if len(view) < _HEADER.size:
+			raise ValueError(f"{path} is not a result store")
+
+		magic, version, byte_order, rows, names_size, tracebacks_size = (
+			_HEADER.unpack_from(view)
+		)
+
+		if magic != _MAGIC or version != _VERSION:
+			raise ValueError(f"{path} is not a result store")
+
+		offset = _HEADER.size
+
+		for name, typecode in _COLUMNS:
+			size = rows * array(typecode).itemsize
+			column = view[offset : offset + size].cast(typecode)
+
+			if byte_order != _BYTE_ORDERS[sys.byteorder]:
+				column = array(typecode, column)
+				column.byteswap()
+
+			setattr(store, name, column)
+			offset += size
+
+		store.names = json.loads(bytes(view[offset : offset + names_size]))
+		offset += names_size
+		store.tracebacks = {
+			int(row): text
+			for row, text in json.loads(
+				bytes(view[offset : offset + tracebacks_size])
+			).items()
+		}
+
+		return store
@@ -0,0 +1,177 @@
+import ast
+import re
+from functools import lru_cache
+from typing import AbstractSet, Callable, Dict, FrozenSet, Iterable, Iterator, List, Set
+
+from pyzitadelle.exceptions import TestValidationError
+
+_TOKEN = re.compile(r"\(|\)|[^\s()]+")
+_KEYWORDS = frozenset(("and", "or", "not"))
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class TagIndex:
+	"""
+	This class describes an inverted index of tags: test names by tag, kept
+	up to date while tests are registered, so selecting tests by tags is a
+	set operation instead of a scan of all tests.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.names: Set[str] = set()
+		self.tests_by_tag: Dict[str, Set[str]] = {}
+		self.tags_by_test: Dict[str, FrozenSet[str]] = {}
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self.tests_by_tag)
+
+	def __len__(self) -> int:
+		return len(self.tests_by_tag)
+
+	def add(self, test_name: str, tags: Iterable[str]):
+		"""
+		Adds a test, replacing tags of the previous test with the same name.
+
+		:param		test_name:	The test name
+		:type		test_name:	str
+		:param		tags:		The tags
+		:type		tags:		Iterable[str]
+		"""
+		tags = frozenset(tags)
+
+		for tag in self.tags_by_test.get(test_name, _EMPTY) - tags:
+			names = self.tests_by_tag[tag]
+			names.discard(test_name)
+
+			if not names:
+				del self.tests_by_tag[tag]
+
+		for tag in tags:
+			self.tests_by_tag.setdefault(tag, set()).add(test_name)
+
+		self.names.add(test_name)
+		self.tags_by_test[test_name] = tags
+
+	def get(self, tag: str) -> AbstractSet[str]:
+		"""
+		Gets the names of tests with tag.
+
+		:param		tag:  The tag
+		:type		tag:  str
+
+		:returns:	test names
+		:rtype:		AbstractSet[str]
+		"""
+		return self.tests_by_tag.get(tag, _EMPTY)
+
+	def select(self, expression: str) -> AbstractSet[str]:
+		"""
+		Select tests by tag expression, see compile_expression
+
+		:param		expression:			  The expression
+		:type		expression:			  str
+
+		:returns:	test names
+		:rtype:		AbstractSet[str]
+
+		:raises		TestValidationError:  invalid expression
+		"""
+		return compile_expression(expression)(self)
+
+
+Selector = Callable[[TagIndex], AbstractSet[str]]
+
+
+def _compile_node(node: ast.AST, tags: List[str], expression: str) -> Selector:
+	"""
+	Compile node of parsed expression to a function of tag index
+
+	:param		node:				  The node
+	:type		node:				  ast.AST
+	:param		tags:				  The tags by placeholder number
+	:type		tags:				  List[str]
+	:param		expression:			  The source expression
+	:type		expression:			  str
+
+	:returns:	selector
+	:rtype:		Selector
+
+	:raises		TestValidationError:  node is not a tag, and, or, not
+	"""
+	if isinstance(node, ast.Name):
+		tag = tags[int(node.id[1:])]
+
+		return lambda index: index.get(tag)
+
+	if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+		operand = _compile_node(node.operand, tags, expression)
+
+		return lambda index: index.names - operand(index)
+
+	if isinstance(node, ast.BoolOp):
+		first, *rest = [_compile_node(value, tags, expression) for value in node.values]
+
+		if isinstance(node.op, ast.And):
+
+			def select(index: TagIndex) -> AbstractSet[str]:
+				names = first(index)
+
+				for operand in rest:
+					if not names:
+						break
+
+					names = names & operand(index)
+
+				return names
+
+		else:
+
+			def select(index: TagIndex) -> AbstractSet[str]:
+				names = set(first(index))
+
+				for operand in rest:
+					names |= operand(index)
+
+				return names
+
+		return select
+
+	raise TestValidationError(f"Invalid tag expression: {expression!r}")
+
+
+@lru_cache(maxsize=128)
+def compile_expression(expression: str) -> Selector:
+	"""
+	Compile tag expression to a function selecting test names from tag index
+
+	The expression combines tags with `and`, `or`, `not` and parentheses,
+	e.g. "db and not slow"; a tag is any word without spaces and
+	parentheses. Compiled expressions are cached.
+
+	:param		expression:			  The expression
+	:type		expression:			  str
+
+	:returns:	selector
+	:rtype:		Selector
+
+	:raises		TestValidationError:  invalid expression
+	"""
+	tags: List[str] = []
+	tokens = []
+
+	for token in _TOKEN.findall(expression):
+		if token in _KEYWORDS or token in "()":
+			tokens.append(token)
+		else:
+			tokens.append(f"_{len(tags)}")
+			tags.append(token)
+
+	try:
+		tree = ast.parse(" ".join(tokens), mode="eval")
+	except SyntaxError:
+		raise TestValidationError(f"Invalid tag expression: {expression!r}") from None
+
+	return _compile_node(tree.body, tags, expression)
@@ -1,18 +1,79 @@
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
 from functools import partial, wraps
 from time import time
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+	Any,
+	Awaitable,
+	Callable,
+	Dict,
+	Iterable,
+	Iterator,
+	List,
+	Optional,
+	Union,
+)
 
-from pyzitadelle.exceptions import TestError
-from pyzitadelle.reporter import print_header, print_results_table
-from pyzitadelle.sessions import Runner
+from pyzitadelle import __version__
+from pyzitadelle.baseline import BenchmarkBaseline
+from pyzitadelle.benchmark import BenchmarkCollector
+from pyzitadelle.cache import DEFAULT_CACHE_SIZE, ResultCache
+from pyzitadelle.coverage import CoverageData, TestSelection
+from pyzitadelle.exceptions import TestError, TestValidationError
+from pyzitadelle.fixtures import FIXTURE_SCOPES
+from pyzitadelle.history import RunHistory
+from pyzitadelle.planning import build_plan, write_plan
+from pyzitadelle.reporter import BaseReporter, get_reporter
+from pyzitadelle.results import (
+	DurationsCollector,
+	JsonLinesReport,
+	write_junit_xml,
+)
+from pyzitadelle.sessions import ProcessPoolRunner, Runner
+from pyzitadelle.sharding import select_shard, validate_shard, write_summary
 from pyzitadelle.standard import (
-	Argument,
+	BenchmarkOptions,
 	CollectionMetadata,
 	Each,
 	ExpectFailMarkup,
 	Fixture,
+	Product,
 	SkipMarker,
 )
+from pyzitadelle.store import ResultStore
+from pyzitadelle.tagging import TagIndex
+from pyzitadelle.utils import (
+	UpdateCheck,
+	get_project_cache_dir,
+	is_update_check_enabled,
+	validate_positive_int,
+	validate_positive_number,
+)
+
+# set while test modules are imported by the command line or by a pool
+# worker, so a run() at the bottom of a module does not start a session
+_collecting = False
+
+
+@contextmanager
+def collecting() -> Iterator[None]:
+	"""
+	Suppress run() of test cases while test modules are imported
+
+	:returns:	collecting context
+	:rtype:		Iterator[None]
+	"""
+	global _collecting
+
+	previous = _collecting
+	_collecting = True
+
+	try:
+		yield
+	finally:
+		_collecting = previous
 
 
 def skip(
@@ -34,7 +95,7 @@ def skip(
 
 	marker = SkipMarker(reason=reason, when=when)
 
-	if hasattr(func, "ward_meta"):
+	if hasattr(func, "pztdmeta"):
 		func.pztdmeta.marker = marker  # type: ignore[attr-defined]
 	else:
 		func.pztdmeta = CollectionMetadata(marker=marker)  # type: ignore[attr-defined]
@@ -88,14 +149,30 @@ class BaseTestCase:
 		self.label: str = label
 
 		self.warnings: int = 0
-		self.tags: List[str] = []
-		self.fixtures: Dict[str, Fixture] = []
+		self.tag_index = TagIndex()
+		self.fixtures: Dict[str, Fixture] = {}
 		self.skipped: int = 0
 		self.errors: int = 0
 		self.passed: int = 0
+		self.timeouts: int = 0
+		self.xfailed: int = 0
+		self.xpassed: int = 0
+		self.cases: int = 0
+		# invocations of the last run, kept only when they are written out
+		self.results: Optional[ResultStore] = None
 
 		self.tests: Dict[str, Union[Callable, Awaitable]] = {}
 
+	@property
+	def tags(self) -> List[str]:
+		"""
+		Gets the tags of all tests.
+
+		:returns:	tags
+		:rtype:		List[str]
+		"""
+		return list(self.tag_index)
+
 
 class TestCase(BaseTestCase):
 	"""
@@ -111,20 +188,47 @@ class TestCase(BaseTestCase):
 		"""
 		super().__init__(label)
 
-	def fixture(self):
-		def wrapper(
-			func: Union[Awaitable, Callable], *args, **kwargs
-		) -> Union[Awaitable, Callable]:
+	def fixture(self, scope: str = "test") -> Callable:
+		"""
+		Add fixture to environment
+
+		Tests (and other fixtures) request fixtures by parameter name. A
+		fixture can return its value, be a coroutine function or yield the
+		value once from a generator or async generator, code after yield is
+		run on teardown.
+
+		:param		scope:				  The scope: "test", "case" or "session"
+		:type		scope:				  str
+
+		:returns:	wrapper
+		:rtype:		Callable
+
+		:raises		TestValidationError:  unknown scope
+		"""
+		if scope not in FIXTURE_SCOPES:
+			raise TestValidationError(
+				f"Unknown fixture scope {scope!r}, available: {', '.join(FIXTURE_SCOPES)}"
+			)
+
+		def wrapper(func: Union[Awaitable, Callable]) -> Union[Awaitable, Callable]:
+			"""
+			Wrapper for @fixture decorator
+
+			:param		func:	 The function
+			:type		func:	 Union[Awaitable, Callable]
+
+			:returns:	function
+			:rtype:		Union[Awaitable, Callable]
+			"""
 			if not hasattr(func, "pztdmeta"):
-				func.pztdmeta = CollectionMetadata(is_fixture=True)
+				func.pztdmeta = CollectionMetadata(is_fixture=True, scope=scope)
 			else:
 				func.pztdmeta.is_fixture = True
+				func.pztdmeta.scope = scope
 
 			self.fixtures[func.__name__] = Fixture(handler=func)
 
-			print("\nFixtures in DEV\n")
-
-			return func(*args, **kwargs)
+			return func
 
 		return wrapper
 
@@ -133,7 +237,10 @@ class TestCase(BaseTestCase):
 		comment: str = None,
 		tags: List[str] = [],
 		count_of_launchs: int = 1,
-		arguments: Tuple[Argument] = (),
+		arguments: Union[Iterable[Any], Callable[[], Iterable[Any]]] = (),
+		timeout: Optional[float] = None,
+		benchmark: Union[bool, BenchmarkOptions] = False,
+		cacheable: bool = False,
 	) -> Callable:
 		"""
 		Add test to environment
@@ -146,8 +253,14 @@ class TestCase(BaseTestCase):
 		:type		count_of_launchs:  int
 		:param		skip_test:		   The skip test
 		:type		skip_test:		   bool
-		:param		arguments:		   The arguments
-		:type		arguments:		   Tuple[Argument]
+		:param		arguments:		   The argument sets: iterable, generator, `each` or `product`, expanded lazily
+		:type		arguments:		   Union[Iterable[Any], Callable[[], Iterable[Any]]]
+		:param		timeout:		   The timeout of every invocation in seconds
+		:type		timeout:		   float
+		:param		benchmark:		   Benchmark the test (with default or given options)
+		:type		benchmark:		   Union[bool, BenchmarkOptions]
+		:param		cacheable:		   The test is deterministic, reuse its passed cases until their code or sources change
+		:type		cacheable:		   bool
 
 		:returns:	wrapper
 		:rtype:		Callable
@@ -169,12 +282,19 @@ class TestCase(BaseTestCase):
 			:returns:	function
 			:rtype:		Union[Awaitable, Callable]
 			"""
+			benchmark_options = (
+				BenchmarkOptions() if benchmark is True else benchmark or None
+			)
+
 			if not hasattr(func, "pztdmeta"):
 				func.pztdmeta = CollectionMetadata(
 					comment=comment.format(**kwargs) if comment is not None else None,
 					tags=tags,
 					arguments=arguments,
 					count_of_launchs=count_of_launchs,
+					timeout=timeout,
+					benchmark=benchmark_options,
+					cacheable=cacheable,
 				)
 			else:
 				func.pztdmeta.comment = (
@@ -183,35 +303,515 @@ class TestCase(BaseTestCase):
 				func.pztdmeta.tags = tags
 				func.pztdmeta.arguments = arguments
 				func.pztdmeta.count_of_launchs = count_of_launchs
+				func.pztdmeta.timeout = timeout
+				func.pztdmeta.benchmark = benchmark_options
+				func.pztdmeta.cacheable = cacheable
 
-			self.tags = list(set(self.tags + tags))
+			self.tag_index.add(func.__name__, tags)
 
 			self.tests[func.__name__] = func
 			return func
 
 		return wrapper
 
-	def run(self, tags: Optional[List[str]] = []):
+	def benchmark(
+		self,
+		comment: str = None,
+		tags: List[str] = [],
+		count_of_launchs: int = 1,
+		arguments: Union[Iterable[Any], Callable[[], Iterable[Any]]] = (),
+		warmup: int = 1,
+		target_time: float = 1.0,
+		min_rounds: int = 10,
+		disable_gc: bool = False,
+	) -> Callable:
+		"""
+		Add benchmark test to environment
+
+		Every argument set is called `warmup` times, then measured in at least
+		`min_rounds` (or `count_of_launchs`) rounds, which together take about
+		`target_time` seconds.
+
+		:param		comment:		   The comment
+		:type		comment:		   str
+		:param		tags:			   The tags
+		:type		tags:			   Array
+		:param		count_of_launchs:  The count of rounds
+		:type		count_of_launchs:  int
+		:param		arguments:		   The argument sets: iterable, generator, `each` or `product`, expanded lazily
+		:type		arguments:		   Union[Iterable[Any], Callable[[], Iterable[Any]]]
+		:param		warmup:			   The count of warmup calls
+		:type		warmup:			   int
+		:param		target_time:	   The total measured time in seconds
+		:type		target_time:	   float
+		:param		min_rounds:		   The minimal count of rounds
+		:type		min_rounds:		   int
+		:param		disable_gc:		   Disable garbage collector while measuring
+		:type		disable_gc:		   bool
+
+		:returns:	wrapper
+		:rtype:		Callable
+		"""
+		return self.test(
+			comment=comment,
+			tags=tags,
+			count_of_launchs=count_of_launchs,
+			arguments=arguments,
+			benchmark=BenchmarkOptions(
+				warmup=warmup,
+				target_time=target_time,
+				min_rounds=min_rounds,
+				disable_gc=disable_gc,
+			),
+		)
+
+	def _select_tests(
+		self,
+		history: RunHistory,
+		order: Optional[str] = None,
+		only: Optional[str] = None,
+		shard: Optional[int] = None,
+		total_shards: Optional[int] = None,
+		select: Optional[str] = None,
+		shard_history: Optional[str] = None,
+	) -> Dict[str, Union[Callable, Awaitable]]:
+		"""
+		Select tests matching tag expression and shard, and order them by
+		history
+
+		:param		history:	   The run history
+		:type		history:	   RunHistory
+		:param		order:		   The order of tests
+		:type		order:		   str
+		:param		only:		   The filter of tests
+		:type		only:		   str
+		:param		shard:		   The shard index
+		:type		shard:		   int
+		:param		total_shards:  The count of shards
+		:type		total_shards:  int
+		:param		select:		   The tag expression
+		:type		select:		   str
+		:param		shard_history:  The history file shared by all shards
+		:type		shard_history:  str
+
+		:returns:	selected tests by name in run order
+		:rtype:		Dict[str, TestInfo]
+		"""
+		tests = self.tests
+
+		if select is not None:
+			names = self.tag_index.select(select)
+			tests = {name: test for name, test in tests.items() if name in names}
+
+		if shard is not None:
+			tests = select_shard(
+				tests,
+				shard,
+				total_shards,
+				RunHistory(shard_history, label=self.label) if shard_history else None,
+			)
+
+		return history.select(tests, order=order, only=only)
+
+	def plan(
+		self,
+		tags: Optional[List[str]] = [],
+		order: Optional[str] = None,
+		only: Optional[str] = None,
+		shard: Optional[int] = None,
+		total_shards: Optional[int] = None,
+		threads: Optional[int] = None,
+		select: Optional[str] = None,
+		shard_history: Optional[str] = None,
+	) -> Dict[str, Any]:
+		"""
+		Build the plan of run without executing tests, see build_plan
+
+		:param		tags:				  The tags of skipped tests
+		:type		tags:				  List[str]
+		:param		order:				  The order of tests, as in run()
+		:type		order:				  str
+		:param		only:				  The filter of tests, as in run()
+		:type		only:				  str
+		:param		shard:				  The shard index, as in run()
+		:type		shard:				  int
+		:param		total_shards:		  The count of shards, as in run()
+		:type		total_shards:		  int
+		:param		threads:			  The count of threads evaluating marker conditions
+		:type		threads:			  int
+		:param		select:				  The tag expression, as in run()
+		:type		select:				  str
+		:param		shard_history:		  The history shared by shards, as in run()
+		:type		shard_history:		  str
+
+		:returns:	plan
+		:rtype:		Dict[str, Any]
+
+		:raises		TestValidationError:  invalid threads, shard, order, only or tag expression
+		"""
+		validate_positive_int(threads, "threads")
+		validate_shard(shard, total_shards)
+
+		history = RunHistory(get_project_cache_dir() / "history.json", label=self.label)
+		tests = self._select_tests(
+			history, order, only, shard, total_shards, select, shard_history
+		)
+		plan = build_plan(self.label, tests, tags, history, threads)
+		plan["shard"] = shard
+		plan["total_shards"] = total_shards
+
+		return plan
+
+	def run(
+		self,
+		tags: Optional[List[str]] = [],
+		concurrency: Optional[int] = None,
+		workers: Optional[int] = None,
+		check_updates: Optional[bool] = None,
+		reporter: Union[str, BaseReporter, None] = None,
+		report: Optional[str] = None,
+		junit_xml: Optional[str] = None,
+		durations: Optional[int] = None,
+		timeout: Optional[float] = None,
+		baseline: Optional[str] = None,
+		save_baseline: bool = False,
+		regression_threshold: float = 0.1,
+		fail_on_regression: bool = False,
+		case_threads: Optional[int] = None,
+		incremental: bool = False,
+		coverage: Optional[str] = None,
+		use_cache: bool = True,
+		cache_size: int = DEFAULT_CACHE_SIZE,
+		order: Optional[str] = None,
+		only: Optional[str] = None,
+		fail_fast: bool = False,
+		max_failures: Optional[int] = None,
+		shard: Optional[int] = None,
+		total_shards: Optional[int] = None,
+		summary: Optional[str] = None,
+		standalone: bool = True,
+		result_store: Optional[str] = None,
+		dry_run: bool = False,
+		collect_only: bool = False,
+		plan: Optional[str] = None,
+		select: Optional[str] = None,
+		threads: Optional[int] = None,
+		shard_history: Optional[str] = None,
+	) -> int:
 		"""
 		Run testing
+
+		Every test case ends with the status decided by outcomes of its
+		invocations; the run fails if any of them will fail the session: a
+		failure, a timeout or a pass of test expected to fail.
+
+		:param		tags:				  The tags of skipped tests
+		:type		tags:				  List[str]
+		:param		concurrency:		  Run async tests, their argument sets and launches concurrently on one event loop, at most `concurrency` at a time
+		:type		concurrency:		  int
+		:param		workers:			  Run sync tests in a pool of `workers` processes
+		:type		workers:			  int
+		:param		check_updates:		  Check pypi for a new version in background (PYZITADELLE_CHECK_UPDATES by default)
+		:type		check_updates:		  bool
+		:param		reporter:			  The reporter: "rich" (default), "plain" or instance
+		:type		reporter:			  Union[str, BaseReporter]
+		:param		report:				  Stream JSON Lines records of every test invocation to this path
+		:type		report:				  str
+		:param		junit_xml:			  Write JUnit XML converted from the JSON Lines stream (a temporary one without report) to this path
+		:type		junit_xml:			  str
+		:param		durations:			  Show `durations` slowest tests (0 for all of them)
+		:type		durations:			  int
+		:param		timeout:			  The default timeout of every test invocation in seconds
+		:type		timeout:			  float
+		:param		baseline:			  Compare benchmarks with baseline saved in this JSON file
+		:type		baseline:			  str
+		:param		save_baseline:		  Save benchmark results as the new baseline
+		:type		save_baseline:		  bool
+		:param		regression_threshold: The allowed relative slowdown of benchmark median
+		:type		regression_threshold: float
+		:param		fail_on_regression:	  Fail benchmarks slower than allowed instead of flagging them
+		:type		fail_on_regression:	  bool
+		:param		case_threads:		  Run argument sets of sync tests in a pool of `case_threads` threads
+		:type		case_threads:		  int
+		:param		incremental:		  Skip tests which passed last time and none of whose source files have changed since
+		:type		incremental:		  bool
+		:param		coverage:			  Collect lines executed by every test to this SQLite file
+		:type		coverage:			  str
+		:param		use_cache:			  Reuse cached results of passed cacheable tests (ignored with coverage)
+		:type		use_cache:			  bool
+		:param		cache_size:			  The maximum size of result cache in bytes
+		:type		cache_size:			  int
+		:param		order:				  The order of tests: "registration" (default), "failed-first" or "longest-first" by the previous runs
+		:type		order:				  str
+		:param		only:				  Run only "last-failed" tests (all of them if none failed)
+		:type		only:				  str
+		:param		fail_fast:			  Stop after the first failed case (same as max_failures=1)
+		:type		fail_fast:			  bool
+		:param		max_failures:		  Stop after this many failed cases, cancelling the pending ones
+		:type		max_failures:		  int
+		:param		shard:				  Run only the tests of this shard (from 0), split by hash of test names or balanced by durations from shard_history
+		:type		shard:				  int
+		:param		total_shards:		  The count of shards the suite is split into
+		:type		total_shards:		  int
+		:param		summary:			  Write results counts to this JSON file, to merge them with the other shards
+		:type		summary:			  str
+		:param		standalone:			  Print the banner, update notice and results table, False when the run is a part of a larger session
+		:type		standalone:			  bool
+		:param		result_store:		  Write every test invocation to this binary file, see ResultStore.load
+		:type		result_store:		  str
+		:param		dry_run:			  List test cases with their expanded arguments without executing them (no pools, cache or coverage)
+		:type		dry_run:			  bool
+		:param		collect_only:		  Only write the plan of run as JSON, see plan(); nothing else is printed
+		:type		collect_only:		  bool
+		:param		plan:				  Write the plan to this path instead of stdout
+		:type		plan:				  str
+		:param		select:				  Run only tests matching this tag expression, e.g. "db and not slow"; the others are not reported
+		:type		select:				  str
+		:param		threads:			  Run sync tests in a pool of `threads` threads, for tests blocking on I/O (in parallel on free-threaded builds)
+		:type		threads:			  int
+		:param		shard_history:		  Balance shards by durations from this history file, the same one on all nodes (see merge_histories)
+		:type		shard_history:		  str
+
+		:returns:	exit code: 1 if any test case failed the session, 0 otherwise
+		:rtype:		int
+
+		:raises		TestValidationError:  invalid concurrency, workers, threads, timeout, case threads, cache size, max failures, shard, order, only, tag expression or reporter
 		"""
-		runner = Runner(self.tests, self)
+		if _collecting or sys.modules["__main__"].__name__ == "__mp_main__":
+			# test script is being collected or re-imported inside of a spawned
+			# pool worker
+			return 0
+
+		validate_positive_int(concurrency, "concurrency")
+		validate_positive_int(workers, "workers")
+		validate_positive_int(threads, "threads")
+		validate_positive_number(timeout, "timeout")
+		validate_positive_int(case_threads, "case_threads")
+		validate_positive_int(cache_size, "cache_size")
+		validate_positive_int(max_failures, "max_failures")
+		validate_shard(shard, total_shards)
+
+		if collect_only:
+			write_plan(
+				plan,
+				self.plan(
+					tags,
+					order=order,
+					only=only,
+					shard=shard,
+					total_shards=total_shards,
+					select=select,
+					shard_history=shard_history,
+				),
+			)
+			return 0
+
+		reporter = get_reporter(reporter)
+
+		if dry_run:
+			# nothing is executed, so there is nothing to spread or measure
+			concurrency = workers = threads = case_threads = coverage = None
+			use_cache = False
+
+		history = RunHistory(get_project_cache_dir() / "history.json", label=self.label)
+		tests = self._select_tests(
+			history, order, only, shard, total_shards, select, shard_history
+		)
+
+		update_check = None
+
+		if standalone:
+			if is_update_check_enabled(check_updates):
+				update_check = UpdateCheck().start()
+
+			reporter.print_banner(__version__)
+
+		listeners = [history]
+		self.results = ResultStore() if result_store is not None else None
+
+		if self.results is not None:
+			listeners.append(self.results)
+
+		benchmark_baseline = None
+
+		if baseline is not None:
+			benchmark_baseline = BenchmarkBaseline(
+				baseline,
+				threshold=regression_threshold,
+				fail_on_regression=fail_on_regression,
+			)
+
+		temporary_report = None
+
+		# without report the JSON Lines stream is only the source of JUnit XML
+		if report is None and junit_xml is not None:
+			descriptor, temporary_report = tempfile.mkstemp(
+				prefix="pyzitadelle-", suffix=".jsonl"
+			)
+			os.close(descriptor)
+			report = temporary_report
+
+		if report is not None:
+			listeners.append(JsonLinesReport(report, label=self.label))
+
+		benchmark_collector = BenchmarkCollector()
+		listeners.append(benchmark_collector)
+
+		selection = None
+
+		if incremental:
+			selection = TestSelection(
+				get_project_cache_dir() / "dependencies.json", label=self.label
+			)
+
+		coverage_data = None
+
+		if coverage is not None:
+			coverage_data = CoverageData(label=self.label)
+
+		result_cache = None
+
+		# cached tests are not executed, so their lines cannot be measured
+		if (
+			use_cache
+			and coverage is None
+			and any(test.pztdmeta.cacheable for test in tests.values())
+		):
+			result_cache = ResultCache(
+				get_project_cache_dir() / "results", max_size=cache_size
+			)
+
+		durations_collector = None
+
+		if durations is not None:
+			durations_collector = DurationsCollector()
+			listeners.append(durations_collector)
+
+		if workers:
+			runner = ProcessPoolRunner(
+				tests,
+				self,
+				workers,
+				reporter=reporter,
+				listeners=listeners,
+				timeout=timeout,
+				baseline=benchmark_baseline,
+				case_threads=case_threads,
+				selection=selection,
+				coverage=coverage_data,
+				cache=result_cache,
+				max_failures=1 if fail_fast else max_failures,
+				threads=threads,
+			)
+		else:
+			runner = Runner(
+				tests,
+				self,
+				reporter=reporter,
+				listeners=listeners,
+				timeout=timeout,
+				baseline=benchmark_baseline,
+				case_threads=case_threads,
+				selection=selection,
+				coverage=coverage_data,
+				cache=result_cache,
+				max_failures=1 if fail_fast else max_failures,
+				dry_run=dry_run,
+				threads=threads,
+			)
 
 		start = time()
 
-		runner.launch_test_chain(tags=tags)
+		try:
+			runner.launch_test_chain(tags=tags, concurrency=concurrency)
+		finally:
+			end = time()
+
+			for listener in listeners:
+				listener.close()
+
+			try:
+				if junit_xml is not None:
+					write_junit_xml(report, junit_xml, suite_name=self.label)
+			finally:
+				if temporary_report is not None:
+					os.remove(temporary_report)
+
+		self.cases += runner.cases
+
+		if selection is not None:
+			selection.save()
+
+		if coverage_data is not None:
+			coverage_data.write(coverage)
 
-		end = time()
 		total = end - start
 
-		print_header(
-			f"[cyan]{len(self.tests)} tests runned {round(total, 2)}s[/cyan]",
-			plus_len=15,
+		if result_store is not None:
+			self.results.write(result_store)
+
+		if summary is not None:
+			write_summary(
+				summary,
+				{
+					"label": self.label,
+					"shard": shard,
+					"total_shards": total_shards,
+					"tests": len(tests),
+					"duration": total,
+					"total": self.cases,
+					"passed": self.passed,
+					"warnings": self.warnings,
+					"errors": self.errors,
+					"skipped": self.skipped,
+					"timeouts": self.timeouts,
+					"xfailed": self.xfailed,
+					"xpassed": self.xpassed,
+				},
+			)
+
+		reporter.print_header(
+			f"{len(tests)} tests runned {round(total, 2)}s", style="bold cyan"
 		)
 
-		print_results_table(
-			len(self.tests), self.passed, self.warnings, self.errors, self.skipped
-		)
+		if dry_run:
+			reporter.print_header(f"{runner.cases} cases collected", style="bold cyan")
+			reporter.flush()
+		elif standalone:
+			reporter.print_results_table(
+				self.cases,
+				self.passed,
+				self.warnings,
+				self.errors,
+				self.skipped,
+				self.timeouts,
+				self.xfailed,
+				self.xpassed,
+			)
+
+		if durations_collector is not None:
+			reporter.print_durations(durations_collector.slowest(durations))
+
+		if coverage_data is not None:
+			reporter.print_coverage(coverage_data.get_summary())
+
+		if benchmark_collector.benchmarks:
+			reporter.print_benchmarks(benchmark_collector.benchmarks)
+
+		if benchmark_baseline is not None:
+			if benchmark_baseline.regressions:
+				reporter.print_regressions(benchmark_baseline.regressions)
+
+			if save_baseline:
+				benchmark_baseline.update(self.label, benchmark_collector.benchmarks)
+				benchmark_baseline.save()
+
+		reporter.flush()
+
+		if update_check is not None:
+			update_check.report()
+
+		return 1 if runner.failures else 0
 
 
 def expect(lhs: Any, rhs: Any, message: str) -> bool:
@@ -238,3 +838,18 @@ def expect(lhs: Any, rhs: Any, message: str) -> bool:
 
 def each(*args):
 	return Each(args)
+
+
+def product(*axes, **named_axes) -> Product:
+	"""
+	Cartesian product of parameter axes, for `arguments` of test
+
+	:param		axes:		 The axes of positional arguments: `each` or iterables
+	:type		axes:		 list
+	:param		named_axes:	 The axes of keyword arguments
+	:type		named_axes:	 dictionary
+
+	:returns:	product, expanded lazily while the runner consumes it
+	:rtype:		Product
+	"""
+	return Product(axes, named_axes)
@@ -0,0 +1,236 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from pyzitadelle.exceptions import TestValidationError
+
+PYPI_URL = "https://pypi.org/pypi/pyzitadelle/json"
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60
+UPDATE_CHECK_TIMEOUT = 3
+
+
+def validate_positive_int(value: Any, name: str):
+	"""
+	Validate optional positive integer option
+
+	:param		value:				  The value
+	:type		value:				  Any
+	:param		name:				  The option name
+	:type		name:				  str
+
+	:raises		TestValidationError:  value is not a positive integer
+	"""
+	if value is not None and (not isinstance(value, int) or value < 1):
+		raise TestValidationError(f"{name} must be a positive integer")
+
+
+def validate_positive_number(value: Any, name: str):
+	"""
+	Validate optional positive number option
+
+	:param		value:				  The value
+	:type		value:				  Any
+	:param		name:				  The option name
+	:type		name:				  str
+
+	:raises		TestValidationError:  value is not a positive number
+	"""
+	if value is not None and (
+		isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0
+	):
+		raise TestValidationError(f"{name} must be a positive number")
+
+
+def get_user_cache_dir() -> Path:
+	"""
+	Gets the per-user cache directory of pyzitadelle.
+
+	:returns:	The user cache directory.
+	:rtype:		Path
+	"""
+	base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+		os.path.expanduser("~"), ".cache"
+	)
+
+	return Path(base) / "pyzitadelle"
+
+
+def get_project_cache_dir() -> Path:
+	"""
+	Gets the cache directory of project tests: PYZITADELLE_CACHE_DIR or
+	.pyzitadelle in the working directory.
+
+	:returns:	The project cache directory.
+	:rtype:		Path
+	"""
+	return Path(os.environ.get("PYZITADELLE_CACHE_DIR") or ".pyzitadelle")
+
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+	"""
+	Convert version string to comparable tuple
+
+	:param		version:  The version
+	:type		version:  str
+
+	:returns:	version digits
+	:rtype:		Tuple[int, ...]
+	"""
+	return tuple(int(n) for n in version.split(".") if n.isdigit())
+
+
+def _fetch_latest_version() -> Optional[str]:
+	"""
+	Fetch latest released version from pypi
+
+	:returns:	latest version, None if not available
+	:rtype:		Optional[str]
+	"""
+	import requests
+
+	try:
+		response = requests.get(PYPI_URL, timeout=UPDATE_CHECK_TIMEOUT).json()
+
+		return response["info"]["version"]
+	except (requests.RequestException, KeyError, ValueError):
+		return None
+
+
+def get_latest_version(cache_file: Optional[Path] = None) -> Optional[str]:
+	"""
+	Gets the latest released version, asking pypi at most once per day.
+
+	:param		cache_file:	 The cache file
+	:type		cache_file:	 Optional[Path]
+
+	:returns:	latest version, None if not available
+	:rtype:		Optional[str]
+	"""
+	if cache_file is None:
+		cache_file = get_user_cache_dir() / "update-check.json"
+
+	try:
+		cached = json.loads(cache_file.read_text())
+
+		if time.time() - cached["checked_at"] < UPDATE_CHECK_INTERVAL:
+			return cached["version"]
+	except (OSError, ValueError, KeyError, TypeError):
+		pass
+
+	latest_version = _fetch_latest_version()
+
+	if latest_version is not None:
+		try:
+			cache_file.parent.mkdir(parents=True, exist_ok=True)
+			cache_file.write_text(
+				json.dumps({"checked_at": time.time(), "version": latest_version})
+			)
+		except OSError:
+			pass
+
+	return latest_version
+
+
+def print_update_message(latest_version: Optional[str]):
+	"""
+	Prints the update message.
+
+	:param		latest_version:	 The latest version
+	:type		latest_version:	 Optional[str]
+	"""
+	from rich import print
+
+	from pyzitadelle import __version__
+
+	if latest_version is None:
+		print(
+			f"[dim]Version updates information not available. Your version: {__version__}[/dim]"
+		)
+		return
+
+	latest_digits = _version_tuple(latest_version)
+	current_digits = _version_tuple(__version__)
+
+	if latest_digits > current_digits:
+		message = f"New version of library pyzitadelle available: {latest_version}"
+
+		print(
+			f"[red]{'#' * (len(message) + 4)}\n#[/red][bold yellow] {message} [/bold yellow][red]#\n{'#' * (len(message) + 4)}[/red]\n"
+		)
+	elif latest_digits < current_digits:
+		print(
+			f"[yellow]You use [bold]UNSTABLE[/bold] branch of pyzitadelle. Stable version: {latest_version}, your version: {__version__}[/yellow]\n"
+		)
+
+
+def check_for_update():
+	"""
+	Check for update in pypi
+	"""
+	print_update_message(get_latest_version())
+
+
+class UpdateCheck:
+	"""
+	This class describes an update check running in a background thread.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new instance.
+		"""
+		self.latest_version: Optional[str] = None
+		self._thread = threading.Thread(
+			target=self._check, name="pyzitadelle-update-check", daemon=True
+		)
+
+	def _check(self):
+		"""
+		Ask for the latest version
+		"""
+		self.latest_version = get_latest_version()
+
+	def start(self) -> "UpdateCheck":
+		"""
+		Starts the check.
+
+		:returns:	The update check.
+		:rtype:		UpdateCheck
+		"""
+		self._thread.start()
+
+		return self
+
+	def report(self):
+		"""
+		Prints the update message if the check has already finished, never
+		waits for the network.
+		"""
+		if self._thread.is_alive():
+			return
+
+		print_update_message(self.latest_version)
+
+
+def is_update_check_enabled(check_updates: Optional[bool] = None) -> bool:
+	"""
+	Determines whether the update check is enabled, either explicitly or via
+	the PYZITADELLE_CHECK_UPDATES environment variable.
+
+	:param		check_updates:	The explicit choice
+	:type		check_updates:	Optional[bool]
+
+	:returns:	True if update check is enabled, False otherwise.
+	:rtype:		bool
+	"""
+	if check_updates is not None:
+		return check_updates
+
+	return os.environ.get("PYZITADELLE_CHECK_UPDATES", "").lower() in {
+		"1",
+		"true",
+		"yes",
+	}
@@ -0,0 +1,50 @@
+import importlib
+import io
+import sys
+import textwrap
+
+import pytest
+
+from pyzitadelle.reporter import PlainReporter
+
+
+@pytest.fixture(autouse=True)
+def project_cache(tmp_path, monkeypatch):
+	"""
+	Keep history, caches and selection of every test in its own directory.
+	"""
+	cache = tmp_path / ".pyzitadelle"
+	monkeypatch.setenv("PYZITADELLE_CACHE_DIR", str(cache))
+	monkeypatch.delenv("PYZITADELLE_CHECK_UPDATES", raising=False)
+
+	return cache
+
+
+@pytest.fixture
+def run_case():
+	"""
+	Run test case with the plain reporter, returning exit code and output.
+	"""
+
+	def run(case, **kwargs):
+		output = io.StringIO()
+		code = case.run(reporter=PlainReporter(output), check_updates=False, **kwargs)
+
+		return code, output.getvalue()
+
+	return run
+
+
+@pytest.fixture
+def import_module(tmp_path, monkeypatch):
+	"""Import test module written from source, so pool workers can import it too."""
+	monkeypatch.syspath_prepend(str(tmp_path))
+	# rewritten modules must not be loaded from bytecode of the previous source
+	monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+	def load(name, source):
+		(tmp_path / f"{name}.py").write_text(textwrap.dedent(source))
+		monkeypatch.delitem(sys.modules, name, raising=False)
+		return importlib.import_module(name)
+
+	return load
@@ -0,0 +1,81 @@
+import io
+import json
+
+from pyzitadelle import test_case
+from pyzitadelle.baseline import BenchmarkBaseline, get_benchmark_key
+from pyzitadelle.benchmark import compute_stats
+from pyzitadelle.reporter import PlainReporter
+
+
+class RegressionsReporter(PlainReporter):
+	def __init__(self):
+		super().__init__(io.StringIO())
+		self.regressions = None
+
+	def print_regressions(self, regressions):
+		self.regressions = regressions
+
+
+def test_baseline_detects_slower_medians(tmp_path):
+	path = tmp_path / "baseline.json"
+	baseline = BenchmarkBaseline(path, threshold=0.5)
+	baseline.update("suite", [compute_stats("test", 0, 1, [1.0, 1.0, 1.0])])
+	baseline.save()
+
+	baseline = BenchmarkBaseline(path, threshold=0.5)
+
+	assert get_benchmark_key("suite", compute_stats("test", 0, 1, [1.0])) == "suite::test[0]"
+	assert baseline.check("suite", compute_stats("test", 0, 1, [1.4])) is None
+	assert baseline.check("suite", compute_stats("other", None, 1, [9.0])) is None
+
+	regression = baseline.check("suite", compute_stats("test", 0, 1, [2.0]))
+
+	assert regression.key == "suite::test[0]"
+	assert regression.change == 1.0
+	assert baseline.regressions == [regression]
+
+
+def test_run_saves_baseline_and_reports_regressions(tmp_path):
+	path = tmp_path / "baseline.json"
+
+	def make_case():
+		case = test_case.TestCase("baseline")
+
+		@case.benchmark(target_time=0.01, min_rounds=3)
+		def busy():
+			sum(range(100))
+
+		return case
+
+	code = make_case().run(
+		baseline=str(path), save_baseline=True, reporter="plain", check_updates=False
+	)
+
+	assert code == 0
+
+	data = json.loads(path.read_text())
+	(machine,) = data["machines"].values()
+	saved = machine["benchmarks"]["baseline::busy"]
+	saved["median"] /= 1000
+	path.write_text(json.dumps(data))
+
+	reporter = RegressionsReporter()
+	case = make_case()
+
+	assert case.run(baseline=str(path), reporter=reporter, check_updates=False) == 0
+	assert [regression.key for regression in reporter.regressions] == ["baseline::busy"]
+
+	reporter = RegressionsReporter()
+	case = make_case()
+
+	assert (
+		case.run(
+			baseline=str(path),
+			fail_on_regression=True,
+			reporter=reporter,
+			check_updates=False,
+		)
+		== 1
+	)
+	assert case.errors == 1
+	assert "slower than baseline" in reporter.stream.getvalue()
@@ -0,0 +1,61 @@
+import gc
+import io
+
+import pytest
+
+from pyzitadelle import test_case
+from pyzitadelle.benchmark import compute_stats, run_benchmark
+from pyzitadelle.reporter import PlainReporter
+from pyzitadelle.standard import BenchmarkOptions
+
+
+class BenchmarkReporter(PlainReporter):
+	def __init__(self):
+		super().__init__(io.StringIO())
+		self.benchmarks = None
+
+	def print_benchmarks(self, benchmarks):
+		self.benchmarks = benchmarks
+
+
+def test_compute_stats():
+	stats = compute_stats("test", 1, 100, [float(n) for n in range(20, 0, -1)])
+
+	assert (stats.rounds, stats.iterations, stats.argument_index) == (20, 100, 1)
+	assert (stats.min, stats.median, stats.p95, stats.mean) == (1.0, 10.5, 19.0, 10.5)
+	assert stats.stddev == pytest.approx(5.916, abs=1e-3)
+	assert stats.ops == pytest.approx(1 / 10.5)
+
+
+def test_run_benchmark_warms_up_and_restores_gc():
+	calls = []
+	options = BenchmarkOptions(warmup=3, target_time=0.01, disable_gc=True)
+
+	stats = run_benchmark("test", None, lambda: calls.append(None), options, rounds=5)
+
+	assert gc.isenabled()
+	assert stats.rounds == 5
+	assert stats.iterations >= 1
+	assert len(calls) > 3 + 5 * stats.iterations
+	assert 0 < stats.min <= stats.median <= stats.p95
+
+
+def test_benchmarks_of_sync_and_async_tests(run_case):
+	case = test_case.TestCase("benchmarks")
+
+	@case.benchmark(arguments=test_case.each(10, 100), target_time=0.01, min_rounds=3)
+	def sums(count):
+		sum(range(count))
+
+	@case.benchmark(count_of_launchs=4, target_time=0.01, min_rounds=3)
+	async def awaits():
+		pass
+
+	reporter = BenchmarkReporter()
+	code = case.run(reporter=reporter, check_updates=False)
+
+	assert code == 0
+	assert case.passed == 3
+	assert [
+		(stats.name, stats.argument_index, stats.rounds) for stats in reporter.benchmarks
+	] == [("sums", 0, 3), ("sums", 1, 3), ("awaits", None, 4)]
@@ -0,0 +1,79 @@
+import threading
+
+from pyzitadelle import standard
+from pyzitadelle.cache import ResultCache, get_test_fingerprint
+
+MODULE = """
+from pyzitadelle.test_case import TestCase
+
+import zitadelle_cache_helper
+
+case = TestCase("cache")
+calls = []
+
+
+@case.test(cacheable=True, arguments=[1, 2, 3])
+def deterministic(value):
+	calls.append(value)
+	assert zitadelle_cache_helper.limit() > value
+"""
+
+
+def test_passed_cases_are_reused_until_sources_change(run_case, import_module):
+	import_module("zitadelle_cache_helper", "def limit():\n\treturn 3\n")
+
+	def run(**kwargs):
+		module = import_module("zitadelle_cache", MODULE)
+		code, output = run_case(module.case, **kwargs)
+		return code, output, module.calls
+
+	code, output, calls = run()
+
+	assert code == 1
+	assert calls == [1, 2, 3]
+
+	code, output, calls = run()
+
+	assert code == 1
+	assert calls == [3]
+	assert output.count("cached") == 2
+
+	code, output, calls = run(use_cache=False)
+
+	assert calls == [1, 2, 3]
+	assert "cached" not in output
+
+	import_module("zitadelle_cache_helper", "def limit():\n\treturn 4\n")
+	code, output, calls = run()
+
+	assert code == 0
+	assert calls == [1, 2, 3]
+
+
+def _make_test(value):
+	def test():
+		return value
+
+	test.pztdmeta = standard.CollectionMetadata()
+
+	return test
+
+
+def test_fingerprint_covers_closure_and_unhashable_values():
+	assert get_test_fingerprint(_make_test(1)) == get_test_fingerprint(_make_test(1))
+	assert get_test_fingerprint(_make_test(1)) != get_test_fingerprint(_make_test(2))
+	assert get_test_fingerprint(_make_test(threading.Lock())) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+	cache = ResultCache(tmp_path / "results", max_size=200)
+	result = standard.TestResult(
+		invocations=[standard.TestInvocation(0, None, standard.TestOutcome.PASS, 10)]
+	)
+
+	for n in range(10):
+		cache.put(f"key{n}", result, [])
+
+	assert 0 < len(list((tmp_path / "results").iterdir())) < 10
+	assert cache.get("key9", None) is not None
+	assert cache.get("key0", None) is None
@@ -0,0 +1,51 @@
+import threading
+
+from pyzitadelle import test_case
+
+
+def test_case_threads_run_argument_sets_concurrently(run_case):
+	case = test_case.TestCase("case_threads")
+	started = threading.Barrier(4, timeout=5)
+
+	@case.test(arguments=range(4))
+	def blocking(n):
+		started.wait()
+
+	code, output = run_case(case, case_threads=4)
+
+	assert code == 0
+	assert case.passed == 4
+	assert [line.split()[3] for line in output.splitlines() if line.startswith("PASS")] == [
+		f"blocking[{n}]:[line" for n in range(4)
+	]
+
+
+def test_case_threads_with_timeout(run_case):
+	case = test_case.TestCase("case_threads_timeout")
+
+	@case.test(arguments=range(400))
+	def timed(n):
+		assert n != 13
+
+	code, _ = run_case(case, case_threads=8, timeout=2)
+
+	assert code == 1
+	assert case.passed == 399
+	assert case.errors == 1
+
+
+def test_case_threads_with_async_tests(run_case):
+	case = test_case.TestCase("case_threads_async")
+
+	@case.test(arguments=range(3))
+	async def coroutine(n):
+		return n
+
+	@case.test(arguments=range(50), timeout=2)
+	def timed(n):
+		return n
+
+	code, _ = run_case(case, case_threads=8, concurrency=4)
+
+	assert code == 0
+	assert case.passed == 53
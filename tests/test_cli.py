@@ -0,0 +1,149 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pyzitadelle
+from pyzitadelle.collection import discover
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(pyzitadelle.__file__)))
+
+PASSING = """
+from pyzitadelle.test_case import TestCase
+
+case = TestCase("passing")
+
+
+@case.test(tags=["fast"])
+def passes():
+	pass
+
+
+@case.test(tags=["slow"])
+def passes_slowly():
+	pass
+
+
+case.run()
+"""
+
+FAILING = """
+from pyzitadelle.test_case import TestCase
+
+case = TestCase("failing")
+
+
+@case.test(tags=["slow"])
+def fails():
+	assert False
+"""
+
+
+def _write(path, source):
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(textwrap.dedent(source))
+
+
+def _run_cli(directory, *args):
+	return subprocess.run(
+		[sys.executable, "-c", "from pyzitadelle.cli import main; main()", *args],
+		cwd=directory,
+		env={**os.environ, "PYTHONPATH": ROOT, "PYTHONDONTWRITEBYTECODE": "1"},
+		capture_output=True,
+		text=True,
+	)
+
+
+def test_discover_skips_hidden_and_ignored_directories(tmp_path):
+	for name in (
+		"test_a.py",
+		"sub/test_b.py",
+		".hidden/test_c.py",
+		"venv/test_d.py",
+		"sub/helper.py",
+	):
+		_write(tmp_path / name, "")
+
+	assert discover([tmp_path]) == [
+		str(tmp_path / "sub" / "test_b.py"),
+		str(tmp_path / "test_a.py"),
+	]
+	assert discover([tmp_path / "sub" / "helper.py", tmp_path / "sub"], "*.py") == [
+		str(tmp_path / "sub" / "helper.py"),
+		str(tmp_path / "sub" / "test_b.py"),
+	]
+
+
+def test_cli_runs_discovered_modules(tmp_path):
+	_write(tmp_path / "tests" / "test_passing.py", PASSING)
+	_write(tmp_path / "tests" / "test_failing.py", FAILING)
+
+	process = _run_cli(tmp_path, "--reporter", "plain", "--no-check-updates")
+
+	assert process.returncode == 1
+	assert [
+		line.split()[3].split(":")[0]
+		for line in process.stdout.splitlines()
+		if line[:4] in ("PASS", "ERR ")
+	] == ["fails", "passes", "passes_slowly"]
+
+	process = _run_cli(
+		tmp_path, "tests", "-m", "not slow", "--reporter", "plain", "--no-check-updates"
+	)
+
+	assert process.returncode == 0
+	assert process.stdout.count("PASS") == 1
+
+
+def test_cli_collect_only_writes_plan(tmp_path):
+	_write(tmp_path / "test_passing.py", PASSING)
+	_write(tmp_path / "test_failing.py", FAILING)
+
+	process = _run_cli(tmp_path, "--collect-only")
+	plan = json.loads(process.stdout)
+
+	assert process.returncode == 0
+	assert plan["total_tests"] == 3
+	assert [case["label"] for case in plan["test_cases"]] == ["failing", "passing"]
+
+
+def test_cli_reports_collection_errors(tmp_path):
+	_write(tmp_path / "test_passing.py", PASSING)
+	_write(tmp_path / "test_broken.py", "def broken(:\n")
+
+	process = _run_cli(tmp_path, "--reporter", "plain", "--no-check-updates")
+
+	assert process.returncode == 2
+	assert "ERROR collecting" in process.stdout
+	assert "test_broken.py" in process.stdout
+	assert "PASS" not in process.stdout
+
+
+def test_cli_reports_module_exiting_on_import(tmp_path):
+	_write(tmp_path / "test_passing.py", PASSING)
+	_write(
+		tmp_path / "test_exiting.py",
+		"""
+		import sys
+
+		from pyzitadelle.test_case import TestCase
+
+		case = TestCase("exiting")
+
+
+		@case.test()
+		def passes():
+			pass
+
+
+		sys.exit(case.run())
+		""",
+	)
+
+	process = _run_cli(tmp_path, "--reporter", "plain", "--no-check-updates")
+
+	assert process.returncode == 2
+	assert "ERROR collecting" in process.stdout
+	assert "test_exiting.py" in process.stdout
+	assert "SystemExit" in process.stderr
@@ -0,0 +1,75 @@
+import sys
+import textwrap
+
+from pyzitadelle import standard, test_case
+from pyzitadelle.collection import CollectionCache, collect
+
+WITH_CASE = """
+from pyzitadelle.test_case import TestCase
+
+case = TestCase()
+
+
+@case.test()
+def passes():
+	pass
+"""
+
+WITHOUT_CASE = """
+from pathlib import Path
+
+IMPORTS = Path(__file__).with_name("imports.txt")
+IMPORTS.write_text(IMPORTS.read_text() + "imported\\n" if IMPORTS.exists() else "imported\\n")
+"""
+
+
+def test_collection_cache_skips_modules_without_test_cases(tmp_path, monkeypatch):
+	monkeypatch.setattr(sys, "path", list(sys.path))
+	monkeypatch.setattr(sys, "dont_write_bytecode", True)
+	(tmp_path / "test_zitadelle_with.py").write_text(textwrap.dedent(WITH_CASE))
+	(tmp_path / "test_zitadelle_without.py").write_text(textwrap.dedent(WITHOUT_CASE))
+	imports = tmp_path / "imports.txt"
+
+	def run():
+		for name in ("test_zitadelle_with", "test_zitadelle_without"):
+			monkeypatch.delitem(sys.modules, name, raising=False)
+
+		cache = CollectionCache(tmp_path / "collection.json")
+		test_cases, errors = collect([tmp_path], cache=cache)
+		cache.save()
+
+		assert errors == {}
+
+		return test_cases
+
+	(case,) = run()
+
+	assert case.label == "test_zitadelle_with"
+	assert imports.read_text() == "imported\n"
+
+	assert len(run()) == 1
+	assert imports.read_text() == "imported\n"
+
+	(tmp_path / "test_zitadelle_without.py").write_text(
+		textwrap.dedent(WITHOUT_CASE) + "\n# changed\n"
+	)
+
+	assert len(run()) == 1
+	assert imports.read_text() == "imported\nimported\n"
+
+
+def test_test_record_is_built_from_metadata():
+	case = test_case.TestCase("records")
+
+	@case.test(tags=["db"], comment="note", count_of_launchs=3, timeout=1.5)
+	async def tagged():
+		pass
+
+	record = standard.TestRecord.from_test(tagged)
+
+	assert record.name == "tagged"
+	assert record.line == tagged.__code__.co_firstlineno
+	assert record.is_async
+	assert record.tags == frozenset({"db"})
+	assert (record.comment, record.count_of_launchs, record.timeout) == ("note", 3, 1.5)
+	assert not record.cacheable
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from pyzitadelle import exceptions, test_case
+from pyzitadelle.sessions import get_session_loop
+
+
+def test_async_tests_run_concurrently_on_session_loop(run_case):
+	case = test_case.TestCase("concurrency")
+	started = []
+	loops = set()
+
+	for n in range(4):
+
+		async def waits_for_others():
+			loops.add(asyncio.get_running_loop())
+			started.append(True)
+
+			while len(started) < 4:
+				await asyncio.sleep(0.001)
+
+		waits_for_others.__name__ = f"waits_{n}"
+		case.test(timeout=5)(waits_for_others)
+
+	code, output = run_case(case, concurrency=4)
+
+	assert code == 0
+	assert case.passed == 4
+	assert loops == {get_session_loop()}
+	assert [line.split()[3] for line in output.splitlines() if line.startswith("PASS")] == [
+		f"waits_{n}:[line" for n in range(4)
+	]
+
+
+def test_concurrency_bounds_running_launches(run_case):
+	case = test_case.TestCase("concurrency_bound")
+	running = []
+	peak = []
+
+	@case.test(count_of_launchs=6)
+	async def bounded():
+		running.append(True)
+		peak.append(len(running))
+		await asyncio.sleep(0.005)
+		running.pop()
+
+	code, _ = run_case(case, concurrency=2)
+
+	assert code == 0
+	assert len(peak) == 6
+	assert max(peak) == 2
+
+
+@pytest.mark.parametrize("concurrency", [0, -2, 1.5])
+def test_invalid_concurrency(run_case, concurrency):
+	case = test_case.TestCase("concurrency_invalid")
+
+	with pytest.raises(exceptions.TestValidationError):
+		run_case(case, concurrency=concurrency)
@@ -0,0 +1,102 @@
+import sqlite3
+import sys
+import time
+
+from pyzitadelle import coverage, test_case
+
+
+def _write_helper(path, value):
+	path.write_text(f"def value():\n\treturn {value}\n")
+	# make sure the changed file is told apart by its stat
+	time.sleep(0.01)
+
+
+def test_incremental_with_coverage_records_helper_module(
+	run_case, tmp_path, monkeypatch
+):
+	helper = tmp_path / "zitadelle_helper.py"
+	_write_helper(helper, 1)
+	monkeypatch.syspath_prepend(str(tmp_path))
+	monkeypatch.delitem(sys.modules, "zitadelle_helper", raising=False)
+	trace = sys.gettrace()
+
+	def make_case():
+		case = test_case.TestCase("incremental_coverage")
+
+		@case.test()
+		def uses_helper():
+			import zitadelle_helper
+
+			assert zitadelle_helper.value() > 0
+
+		return case
+
+	database = tmp_path / "coverage.sqlite"
+
+	code, output = run_case(make_case(), incremental=True, coverage=str(database))
+
+	assert code == 0
+	assert "PASS" in output
+	assert sys.gettrace() is trace
+
+	with sqlite3.connect(database) as connection:
+		filenames = {row[0] for row in connection.execute("SELECT path FROM file")}
+
+	assert str(helper) in filenames
+
+	code, output = run_case(make_case(), incremental=True, coverage=str(database))
+
+	assert code == 0
+	assert "unchanged" in output
+
+	_write_helper(helper, 2)
+	code, output = run_case(make_case(), incremental=True, coverage=str(database))
+
+	assert code == 0
+	assert "unchanged" not in output
+	assert "PASS" in output
+	assert sys.gettrace() is trace
+
+
+HELPER = """
+def branchy(flag):
+	if flag:
+		return "yes"
+	return "no"
+
+
+def other():
+	return 1
+"""
+
+
+def test_coverage_records_lines_per_test(run_case, import_module, tmp_path):
+	helper = import_module("zitadelle_cov_helper", HELPER)
+	case = test_case.TestCase("cov")
+
+	@case.test()
+	async def takes_branch():
+		assert helper.branchy(True) == "yes"
+
+	@case.test()
+	async def calls_other():
+		assert helper.other() == 1
+
+	database = tmp_path / "lines.sqlite"
+	code, _ = run_case(case, coverage=str(database), concurrency=2)
+
+	assert code == 0
+
+	data = coverage.CoverageData.read(database)
+	path = str(tmp_path / "zitadelle_cov_helper.py")
+
+	assert data.contexts["cov::takes_branch"][path] == {3, 4}
+	assert data.contexts["cov::calls_other"][path] == {9}
+	assert (path, 4, 1) in data.get_summary()
+
+
+def test_numbits_round_trip():
+	lines = [1, 2, 9, 64, 1000]
+
+	assert coverage.from_numbits(coverage.to_numbits(lines)) == lines
+	assert coverage.from_numbits(coverage.to_numbits([])) == []
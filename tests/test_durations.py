@@ -0,0 +1,79 @@
+import io
+import time
+
+from pyzitadelle import results, standard, test_case
+from pyzitadelle.reporter import PlainReporter
+
+
+class DurationsReporter(PlainReporter):
+	def __init__(self):
+		super().__init__(io.StringIO())
+		self.durations = None
+
+	def print_durations(self, durations):
+		self.durations = durations
+
+
+def test_durations_of_launches():
+	durations = results.TestDurations("test")
+
+	for duration_ns in (30, 10, 20):
+		durations.add(duration_ns)
+
+	assert (durations.launches, durations.total_ns) == (3, 60)
+	assert (durations.min_ns, durations.max_ns) == (10, 30)
+	assert durations.mean_ns == 20
+
+
+def test_collector_groups_by_argument_set_and_skips_skipped():
+	collector = results.DurationsCollector()
+	collector.add_result(
+		"parametrized",
+		1,
+		standard.TestResult(
+			invocations=[
+				standard.TestInvocation(0, 0, standard.TestOutcome.PASS, 5),
+				standard.TestInvocation(1, 0, standard.TestOutcome.PASS, 7),
+			],
+			argument_index=0,
+		),
+	)
+	collector.add_result(
+		"parametrized",
+		1,
+		standard.TestResult(
+			invocations=[standard.TestInvocation(0, 1, standard.TestOutcome.FAIL, 20)],
+			argument_index=1,
+		),
+	)
+	collector.add_result(
+		"skipped",
+		2,
+		standard.TestResult(
+			status="skip",
+			invocations=[standard.TestInvocation(0, None, standard.TestOutcome.SKIP)],
+		),
+	)
+
+	assert [
+		(item.name, item.argument_index, item.total_ns) for item in collector.slowest()
+	] == [("parametrized", 1, 20), ("parametrized", 0, 12)]
+	assert len(collector.slowest(1)) == 1
+
+
+def test_run_reports_slowest_tests():
+	case = test_case.TestCase("durations")
+
+	@case.test()
+	def fast():
+		pass
+
+	@case.test(count_of_launchs=2)
+	def slow():
+		time.sleep(0.01)
+
+	reporter = DurationsReporter()
+	case.run(reporter=reporter, check_updates=False, durations=1)
+
+	assert [(item.name, item.launches) for item in reporter.durations] == [("slow", 2)]
+	assert reporter.durations[0].min_ns >= 10_000_000
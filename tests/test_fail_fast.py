@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from pyzitadelle import exceptions, test_case
+
+
+def _make_case(calls):
+	case = test_case.TestCase("fail_fast")
+
+	@case.test(arguments=range(5))
+	def parametrized(value):
+		calls.append(value)
+		assert value % 2 == 0
+
+	@case.test()
+	def after():
+		calls.append("after")
+
+	return case
+
+
+def test_fail_fast_stops_after_first_failure(run_case):
+	calls = []
+	code, output = run_case(_make_case(calls), fail_fast=True)
+
+	assert code == 1
+	assert calls == [0, 1]
+	assert "stopped after 1 failures" in output
+
+
+def test_max_failures_stops_after_that_many_failures(run_case):
+	calls = []
+	code, _ = run_case(_make_case(calls), max_failures=2)
+
+	assert code == 1
+	assert calls == [0, 1, 2, 3]
+
+	calls = []
+	run_case(_make_case(calls), max_failures=3)
+
+	assert calls == [0, 1, 2, 3, 4, "after"]
+
+
+def test_max_failures_cancels_scheduled_async_cases(run_case):
+	case = test_case.TestCase("fail_fast_async")
+	finished = []
+
+	@case.test(arguments=range(20))
+	async def parametrized(value):
+		await asyncio.sleep(0.001 * value)
+		finished.append(value)
+		assert value > 0
+
+	code, output = run_case(case, concurrency=2, max_failures=1)
+
+	assert code == 1
+	assert len(finished) < 20
+	assert case.errors == 1
+
+
+@pytest.mark.parametrize("max_failures", [0, -1])
+def test_invalid_max_failures(run_case, max_failures):
+	with pytest.raises(exceptions.TestValidationError):
+		run_case(_make_case([]), max_failures=max_failures)
@@ -0,0 +1,236 @@
+import asyncio
+
+import pytest
+
+from pyzitadelle import exceptions, test_case
+
+
+def test_failing_teardown_errors_test_and_finalizes_others(run_case):
+	case = test_case.TestCase("fixture_teardown")
+	finalized = []
+
+	@case.fixture()
+	def first():
+		yield 1
+		finalized.append("first")
+
+	@case.fixture()
+	def broken():
+		yield 2
+		raise RuntimeError("teardown boom")
+
+	@case.fixture()
+	def twice():
+		yield 3
+		yield 4
+
+	@case.test()
+	def uses_fixtures(first, broken, twice):
+		assert first + broken + twice == 6
+
+	@case.test()
+	def runs_after():
+		pass
+
+	code, output = run_case(case)
+
+	assert code == 1
+	assert finalized == ["first"]
+	assert case.errors == 1
+	assert case.passed == 1
+	assert "teardown boom" in output
+	assert "Fixture twice yields more than once" in output
+
+
+def test_failing_case_fixture_teardown_is_reported(run_case):
+	case = test_case.TestCase("case_fixture_teardown")
+
+	@case.fixture(scope="case")
+	def resource():
+		yield "value"
+		raise RuntimeError("case teardown boom")
+
+	@case.test()
+	def uses_resource(resource):
+		assert resource == "value"
+
+	code, output = run_case(case)
+
+	assert code == 1
+	assert case.passed == 1
+	assert case.errors == 1
+	assert "case teardown boom" in output
+
+
+def test_fixtures_are_cached_per_scope(run_case):
+	calls = {"test": 0, "case": 0, "session": 0}
+
+	def per_session_of_scopes_test():
+		calls["session"] += 1
+		return calls["session"]
+
+	def make_case():
+		case = test_case.TestCase("fixture_scopes")
+
+		@case.fixture()
+		def per_test():
+			calls["test"] += 1
+			return calls["test"]
+
+		@case.fixture(scope="case")
+		def per_case():
+			calls["case"] += 1
+			return calls["case"]
+
+		# both cases run the same session fixture
+		case.fixture(scope="session")(per_session_of_scopes_test)
+
+		@case.test(count_of_launchs=2)
+		def first(per_test, per_case, per_session_of_scopes_test):
+			pass
+
+		@case.test()
+		def second(per_test, per_case, per_session_of_scopes_test):
+			pass
+
+		return case
+
+	assert run_case(make_case())[0] == 0
+	assert run_case(make_case())[0] == 0
+	assert calls == {"test": 6, "case": 2, "session": 1}
+
+
+def test_session_fixtures_of_cases_with_same_name_are_separate(run_case):
+	received = []
+
+	def make_case(label):
+		case = test_case.TestCase(label)
+
+		@case.fixture(scope="session")
+		def db():
+			return f"{label}-db"
+
+		@case.test()
+		def uses_db(db):
+			received.append(db)
+
+		return case
+
+	assert run_case(make_case("A"))[0] == 0
+	assert run_case(make_case("B"))[0] == 0
+	assert received == ["A-db", "B-db"]
+
+
+@pytest.mark.parametrize("scope", ["case", "session"])
+def test_failed_fixture_setup_is_not_cached(run_case, scope):
+	attempts = []
+	case = test_case.TestCase(f"fixture_retry_{scope}")
+
+	@case.fixture(scope=scope)
+	def flaky():
+		attempts.append(len(attempts))
+
+		if len(attempts) == 1:
+			raise OSError("not ready")
+
+		return "ready"
+
+	@case.test()
+	def first(flaky):
+		pass
+
+	@case.test()
+	def second(flaky):
+		assert flaky == "ready"
+
+	@case.test()
+	def third(flaky):
+		assert flaky == "ready"
+
+	code, output = run_case(case)
+
+	assert code == 1
+	assert attempts == [0, 1]
+	assert (case.errors, case.passed) == (1, 2)
+	assert "not ready" in output
+
+
+def test_async_fixtures_with_dependencies_are_set_up_concurrently(run_case):
+	case = test_case.TestCase("fixture_async")
+	events = []
+
+	@case.fixture()
+	async def ready():
+		return asyncio.Event()
+
+	@case.fixture()
+	async def waiter(ready):
+		await asyncio.wait_for(ready.wait(), 2)
+		yield "waited"
+		events.append("waiter closed")
+
+	@case.fixture()
+	async def setter(ready):
+		ready.set()
+		return "set"
+
+	@case.test()
+	async def uses_both(waiter, setter):
+		assert (waiter, setter) == ("waited", "set")
+
+	code, _ = run_case(case)
+
+	assert code == 0
+	assert case.passed == 1
+	assert events == ["waiter closed"]
+
+
+def test_fixture_errors_fail_requesting_tests(run_case):
+	case = test_case.TestCase("fixture_errors")
+
+	@case.fixture()
+	def first(second):
+		return 1
+
+	@case.fixture()
+	def second(first):
+		return 2
+
+	@case.fixture()
+	def short_lived():
+		return 3
+
+	@case.fixture(scope="case")
+	def long_lived(short_lived):
+		return 4
+
+	@case.fixture()
+	def broken():
+		raise OSError("no database")
+
+	@case.test()
+	def circular(first):
+		pass
+
+	@case.test()
+	def wider_scope(long_lived):
+		pass
+
+	@case.test()
+	def failed_setup(broken):
+		pass
+
+	code, output = run_case(case)
+
+	assert code == 1
+	assert case.errors == 3
+	assert "Circular fixture dependency: first -> second -> first" in output
+	assert "Fixture long_lived with case scope depends on short_lived with test scope" in output
+	assert "Fixture broken failed: OSError('no database')" in output
+
+
+def test_unknown_fixture_scope():
+	case = test_case.TestCase("fixture_invalid")
+
+	with pytest.raises(exceptions.TestValidationError, match="Unknown fixture scope"):
+		case.fixture(scope="module")
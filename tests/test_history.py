@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from pyzitadelle import exceptions, test_case
+
+
+def _make_case(failing):
+	case = test_case.TestCase("history")
+
+	@case.test()
+	def quick():
+		assert "quick" not in failing
+
+	@case.test()
+	def slow():
+		time.sleep(0.02)
+		assert "slow" not in failing
+
+	@case.test()
+	def medium():
+		time.sleep(0.01)
+		assert "medium" not in failing
+
+	return case
+
+
+def _order(output):
+	return [
+		line.split()[3].split(":")[0]
+		for line in output.splitlines()
+		if line[:4] in ("PASS", "ERR ")
+	]
+
+
+def test_tests_are_ordered_by_history(run_case):
+	code, output = run_case(_make_case({"medium"}))
+
+	assert code == 1
+	assert _order(output) == ["quick", "slow", "medium"]
+
+	_, output = run_case(_make_case({"medium"}), order="failed-first")
+
+	assert _order(output) == ["medium", "quick", "slow"]
+
+	_, output = run_case(_make_case(set()), order="longest-first")
+
+	assert _order(output) == ["slow", "medium", "quick"]
+
+
+def test_last_failed_runs_only_failed_tests(run_case):
+	run_case(_make_case({"quick", "slow"}))
+	_, output = run_case(_make_case({"slow"}), only="last-failed")
+
+	assert _order(output) == ["quick", "slow"]
+
+	_, output = run_case(_make_case(set()), only="last-failed")
+
+	assert _order(output) == ["slow"]
+
+	_, output = run_case(_make_case(set()), only="last-failed")
+
+	assert _order(output) == ["quick", "slow", "medium"]
+
+
+@pytest.mark.parametrize("options", [{"order": "random"}, {"only": "first-failed"}])
+def test_unknown_order_and_filter(run_case, options):
+	with pytest.raises(exceptions.TestValidationError):
+		run_case(_make_case(set()), **options)
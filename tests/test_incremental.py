@@ -0,0 +1,80 @@
+from pyzitadelle import coverage
+
+MODULE = """
+from pyzitadelle.test_case import TestCase
+
+import zitadelle_incremental_helper
+
+case = TestCase("incremental")
+
+
+@case.test()
+def uses_helper():
+	assert zitadelle_incremental_helper.value() == 1
+
+
+@case.test()
+def standalone():
+	assert True
+
+
+@case.test()
+def fails():
+	assert {expected}
+"""
+
+
+def _passed(output):
+	return sorted(
+		line.split()[3].split(":")[0]
+		for line in output.splitlines()
+		if line.startswith("PASS")
+	)
+
+
+def test_incremental_runs_only_affected_tests(run_case, import_module, tmp_path):
+	helper = tmp_path / "zitadelle_incremental_helper.py"
+	helper.write_text("def value():\n\treturn 1\n")
+
+	def run():
+		module = import_module("zitadelle_incremental", MODULE.format(expected="False"))
+		return run_case(module.case, incremental=True)
+
+	code, output = run()
+
+	assert code == 1
+	assert _passed(output) == ["standalone", "uses_helper"]
+
+	code, output = run()
+
+	assert code == 1
+	assert _passed(output) == []
+	assert output.count("unchanged") == 2
+	assert "fails:[line" in output
+
+	helper.write_text("def value():\n\treturn 1  # changed\n")
+	code, output = run()
+
+	assert _passed(output) == ["uses_helper"]
+	assert output.count("unchanged") == 1
+
+
+def test_selection_hashes_files_once(tmp_path, monkeypatch):
+	source = tmp_path / "source.py"
+	source.write_text("x = 1\n")
+	selection = coverage.TestSelection(tmp_path / "dependencies.json", label="suite")
+	selection.update("test", [str(source)], failed=False)
+	selection.save()
+
+	hashed = []
+	monkeypatch.setattr(coverage, "_hash_file", lambda path: hashed.append(path))
+	selection = coverage.TestSelection(tmp_path / "dependencies.json", label="suite")
+
+	assert selection.is_unchanged("test")
+	assert hashed == []
+	assert not selection.is_unchanged("unknown")
+
+	source.unlink()
+	selection = coverage.TestSelection(tmp_path / "dependencies.json", label="suite")
+
+	assert not selection.is_unchanged("test")
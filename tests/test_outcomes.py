@@ -0,0 +1,162 @@
+import pytest
+
+from pyzitadelle import standard, test_case
+from pyzitadelle.history import RunHistory
+from pyzitadelle.sessions import get_case_status
+
+
+def _add_failing_tests(case):
+	@case.test()
+	def raises_value_error():
+		raise ValueError("bad value")
+
+	@case.test()
+	def passes():
+		pass
+
+
+@pytest.mark.parametrize(
+	"options",
+	[{}, {"threads": 2}, {"case_threads": 2}],
+	ids=["sequential", "threads", "case_threads"],
+)
+def test_unexpected_exception_fails_test(run_case, options):
+	case = test_case.TestCase("unexpected")
+	_add_failing_tests(case)
+
+	code, output = run_case(case, **options)
+
+	assert code == 1
+	assert case.errors == 1
+	assert case.passed == 1
+	assert "ValueError: bad value" in output
+
+
+def test_unexpected_exception_fails_async_test(run_case):
+	case = test_case.TestCase("unexpected_async")
+
+	@case.test(count_of_launchs=2)
+	async def raises_key_error():
+		raise KeyError("missing")
+
+	@case.test()
+	async def passes():
+		pass
+
+	code, output = run_case(case, concurrency=4)
+
+	assert code == 1
+	assert case.errors == 1
+	assert case.passed == 1
+	assert "KeyError: 'missing'" in output
+
+
+def test_unexpected_exception_fails_test_in_worker(run_case, import_module):
+	module = import_module(
+		"zitadelle_unexpected",
+		"""
+		from pyzitadelle.test_case import TestCase
+
+		case = TestCase("unexpected_worker")
+
+
+		@case.test()
+		def raises_value_error():
+			raise ValueError("bad value")
+
+
+		@case.test()
+		def passes():
+			pass
+		""",
+	)
+
+	code, output = run_case(module.case, workers=2)
+
+	assert code == 1
+	assert module.case.errors == 1
+	assert module.case.passed == 1
+	assert "ValueError: bad value" in output
+
+
+@pytest.mark.parametrize(
+	"outcomes, status",
+	[
+		([], "success"),
+		(["PASS", "PASS"], "success"),
+		(["PASS", "SKIP"], "skip"),
+		(["XFAIL", "SKIP"], "xfail"),
+		(["XFAIL", "XPASS"], "xpass"),
+		(["XPASS", "FAIL"], "error"),
+		(["FAIL", "TIMEOUT", "PASS"], "timeout"),
+		(["DRYRUN"], "dryrun"),
+	],
+)
+def test_case_status_follows_outcome_precedence(outcomes, status):
+	invocations = [
+		standard.TestInvocation(0, None, standard.TestOutcome[outcome])
+		for outcome in outcomes
+	]
+
+	assert get_case_status(invocations) == status
+
+
+def _make_expected_failures(fixed):
+	case = test_case.TestCase("expected")
+
+	@case.test()
+	@test_case.expectfail("known bug")
+	def known_bug():
+		assert "known_bug" in fixed
+
+	@case.test()
+	@test_case.expectfail(when=lambda: False)
+	def not_expected():
+		pass
+
+	return case
+
+
+def test_expected_failure_is_xfail(run_case):
+	case = _make_expected_failures(set())
+	code, output = run_case(case)
+
+	assert code == 0
+	assert (case.xfailed, case.xpassed, case.passed, case.errors) == (1, 0, 1, 0)
+	assert any(line.startswith("XFL ") for line in output.splitlines())
+
+
+def test_unexpected_pass_fails_session(run_case):
+	case = _make_expected_failures({"known_bug"})
+	code, output = run_case(case)
+
+	assert code == 1
+	assert (case.xfailed, case.xpassed, case.passed) == (0, 1, 1)
+	assert any(line.startswith("XPS ") for line in output.splitlines())
+
+
+def test_dry_run_executes_nothing(run_case, project_cache):
+	calls = []
+	case = test_case.TestCase("dry")
+
+	@case.test(arguments=standard.Each([1, 2]))
+	def parametrized(number):
+		calls.append(number)
+
+	@case.test()
+	@test_case.skip("not today")
+	def skipped():
+		calls.append("skipped")
+
+	code, output = run_case(case, dry_run=True, workers=2)
+	lines = output.splitlines()
+
+	assert code == 0
+	assert calls == []
+	assert sum(line.startswith("DRY ") for line in lines) == 2
+	assert any(line.startswith("SKIP") for line in lines)
+	assert "3 cases collected" in output
+
+	history = RunHistory(project_cache / "history.json", label="dry")
+
+	assert history.get_record("parametrized") is None
@@ -0,0 +1,117 @@
+import pytest
+
+from pyzitadelle import test_case
+from pyzitadelle.parametrize import iter_arguments, iter_cases
+from pyzitadelle.standard import Argument, Each
+
+
+def test_iter_cases_of_generator_is_lazy():
+	consumed = []
+
+	def values():
+		for value in range(3):
+			consumed.append(value)
+			yield value
+
+	cases = iter_cases(Each(values()))
+
+	assert next(cases) == (0, Argument(args=(0,)))
+	assert consumed == [0]
+	assert list(cases) == [(1, Argument(args=(1,))), (2, Argument(args=(2,)))]
+
+
+@pytest.mark.parametrize("source", [(), [], Each(()), Each(iter(()))])
+def test_iter_cases_of_empty_source(source):
+	assert list(iter_cases(source)) == [(None, None)]
+
+
+def test_each_of_generator_has_no_length():
+	each = Each(value for value in range(3))
+
+	with pytest.raises(TypeError, match="generator"):
+		len(each)
+
+	with pytest.raises(TypeError, match="generator"):
+		each[0]
+
+	assert list(each) == [0, 1, 2]
+	assert len(Each((1, 2))) == 2
+	assert Each((1, 2))[1] == 2
+
+
+def test_each_of_generator_runs_every_case(run_case):
+	case = test_case.TestCase("each_generator")
+	seen = []
+
+	@case.test(arguments=test_case.each(*range(2)))
+	def from_tuple(value):
+		seen.append(value)
+
+	@case.test(arguments=Each(value for value in range(3)))
+	def from_generator(value):
+		seen.append(value)
+
+	code, output = run_case(case)
+
+	assert code == 0
+	assert case.passed == 5
+	assert seen == [0, 1, 0, 1, 2]
+	assert "from_generator[2]" in output
+
+
+def test_plan_of_each_of_generator(run_case):
+	case = test_case.TestCase("each_plan")
+
+	@case.test(arguments=lambda: Each(value for value in range(2)))
+	def parametrized(value):
+		pass
+
+	@case.test()
+	def plain():
+		pass
+
+	plan = case.plan()
+
+	assert [len(test["cases"]) for test in plan["tests"]] == [2, 1]
+	assert plan["tests"][1]["cases"] == [{"index": None, "arguments": ""}]
+
+
+def test_product_expands_axes_lazily():
+	def first_axis():
+		yield from (1, 2)
+
+	source = test_case.product(first_axis(), Each(iter("ab")), flag=[True, False])
+
+	assert [(argument.args, argument.kwargs) for argument in iter_arguments(source)] == [
+		((1, "a"), {"flag": True}),
+		((1, "a"), {"flag": False}),
+		((1, "b"), {"flag": True}),
+		((1, "b"), {"flag": False}),
+		((2, "a"), {"flag": True}),
+		((2, "a"), {"flag": False}),
+		((2, "b"), {"flag": True}),
+		((2, "b"), {"flag": False}),
+	]
+
+
+def test_callable_source_is_called_on_every_run(run_case):
+	case = test_case.TestCase("callable_source")
+	seen = []
+
+	@case.test(arguments=lambda: (value for value in range(2)))
+	def generated(value):
+		seen.append(value)
+
+	run_case(case)
+	run_case(case)
+
+	assert seen == [0, 1, 0, 1]
+
+
+def test_argument_sets_of_tuples_and_dicts():
+	assert list(iter_arguments([(1, 2), {"x": 3}, Argument(args=(4,)), 5])) == [
+		Argument(args=(1, 2)),
+		Argument(kwargs={"x": 3}),
+		Argument(args=(4,)),
+		Argument(args=(5,)),
+	]
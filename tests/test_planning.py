@@ -0,0 +1,170 @@
+import json
+import threading
+
+import pytest
+
+from pyzitadelle import standard, test_case
+from pyzitadelle.planning import evaluate_markers, merge_plans
+
+
+def _record(name, marker=None):
+	return standard.TestRecord(
+		name, 1, False, frozenset(), marker, None, (), 1, None, None, False
+	)
+
+
+def test_marker_conditions_are_evaluated_concurrently():
+	# every condition waits for the others, so they cannot run one by one
+	barrier = threading.Barrier(3, timeout=5)
+
+	def condition():
+		barrier.wait()
+		return True
+
+	records = [
+		_record("first", standard.SkipMarker(when=condition)),
+		_record("second", standard.SkipMarker(when=condition)),
+		_record("third", standard.ExpectFailMarkup(when=condition)),
+		_record("inactive", standard.SkipMarker(when=False)),
+		_record("unmarked"),
+		_record("broken", standard.SkipMarker(when=lambda: {}["service"])),
+	]
+
+	assert evaluate_markers(records) == (
+		{"first": True, "second": True, "third": True, "inactive": False},
+		{"broken": "KeyError: 'service'"},
+	)
+
+
+def _make_case(calls):
+	case = test_case.TestCase("plan")
+
+	@case.test(arguments=standard.Each(["a", "b"]))
+	def parametrized(letter):
+		calls.append(letter)
+
+	@case.test(tags=["slow"])
+	def tagged():
+		calls.append("tagged")
+
+	@case.test()
+	@test_case.skip("broken", when=lambda: True)
+	def skipped():
+		calls.append("skipped")
+
+	return case
+
+
+def test_plan_lists_cases_and_skips():
+	calls = []
+	plan = _make_case(calls).plan(tags=["slow"])
+	tests = {test["name"]: test for test in plan["tests"]}
+
+	assert calls == []
+	assert plan["total_tests"] == 3
+	assert plan["total_cases"] == 2
+	assert [case["index"] for case in tests["parametrized"]["cases"]] == [0, 1]
+	assert tests["tagged"]["skip"] == "tags"
+	assert tests["tagged"]["cases"] == []
+	assert tests["skipped"]["skip"] == "broken"
+	assert tests["skipped"]["marker"] == {
+		"name": "SKIP",
+		"reason": "broken",
+		"active": True,
+	}
+	assert plan["estimated_duration_ns"] == 0
+
+
+def test_plan_estimates_durations_from_history(run_case):
+	case = _make_case([])
+	run_case(case)
+
+	@case.test()
+	def new():
+		pass
+
+	plan = case.plan()
+	tests = {test["name"]: test for test in plan["tests"]}
+	known = [
+		tests[name]["estimated_duration_ns"] for name in ("parametrized", "tagged")
+	]
+
+	assert all(duration > 0 for duration in known)
+	assert tests["new"]["estimated_duration_ns"] is None
+	# new test is counted with the mean duration, the skipped one not at all
+	assert plan["estimated_duration_ns"] == sum(known) + sum(known) // len(known)
+
+
+@pytest.mark.parametrize(
+	"options", [{}, {"concurrency": 2, "threads": 2}], ids=["sequential", "pools"]
+)
+def test_plan_records_errors_of_marker_conditions(run_case, options):
+	case = test_case.TestCase("plan_errors")
+
+	def probe():
+		raise ConnectionError("service is down")
+
+	@case.test()
+	@test_case.skip("no service", when=probe)
+	def needs_service():
+		pass
+
+	@case.test()
+	@test_case.expectfail(when=probe)
+	async def needs_service_async():
+		pass
+
+	@case.test()
+	def passes():
+		pass
+
+	plan = case.plan()
+	tests = {test["name"]: test for test in plan["tests"]}
+
+	assert tests["needs_service"]["error"] == "ConnectionError: service is down"
+	assert tests["needs_service"]["skip"] is None
+	assert tests["needs_service"]["cases"] == []
+	assert tests["needs_service"]["marker"]["active"] is False
+	assert tests["needs_service_async"]["error"] == "ConnectionError: service is down"
+	assert tests["passes"]["error"] is None
+	assert plan["total_cases"] == 1
+
+	# the runner fails the tests the same way
+	code, output = run_case(case, **options)
+
+	assert code == 1
+	assert (case.errors, case.passed) == (2, 1)
+	assert "service is down" in output
+
+
+def test_collect_only_writes_plan(tmp_path, run_case, capsys):
+	calls = []
+	path = tmp_path / "plans" / "plan.json"
+	code, output = run_case(_make_case(calls), collect_only=True, plan=str(path))
+	plan = json.loads(path.read_text())
+
+	assert code == 0
+	assert calls == []
+	assert output == ""
+	assert plan["label"] == "plan"
+	assert plan["total_cases"] == 3
+
+	run_case(_make_case(calls), collect_only=True, select="slow")
+
+	assert [test["name"] for test in json.loads(capsys.readouterr().out)["tests"]] == [
+		"tagged"
+	]
+
+
+def test_merge_plans():
+	plans = [
+		{"total_tests": 2, "total_cases": 3, "estimated_duration_ns": 10},
+		{"total_tests": 1, "total_cases": 1, "estimated_duration_ns": 5},
+	]
+
+	assert merge_plans(plans) == {
+		"test_cases": plans,
+		"total_tests": 3,
+		"total_cases": 4,
+		"estimated_duration_ns": 15,
+	}
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from pyzitadelle import exceptions
+
+POOL_MODULE = """
+import asyncio
+import os
+from pathlib import Path
+
+from pyzitadelle.test_case import TestCase
+
+case = TestCase("pool")
+pids = {}
+
+
+@case.test()
+def first():
+	Path(__file__).with_name("worker.pid").write_text(str(os.getpid()))
+
+
+@case.test(arguments=[1, 2, 3])
+def parametrized(value):
+	assert value < 3
+
+
+@case.test()
+async def in_runner():
+	await asyncio.sleep(0)
+	pids["in_runner"] = os.getpid()
+
+
+def register_nested():
+	@case.test()
+	def nested():
+		pids["nested"] = os.getpid()
+
+
+register_nested()
+"""
+
+
+def test_pool_runs_module_level_tests_in_workers(run_case, import_module, tmp_path):
+	module = import_module("zitadelle_pool", POOL_MODULE)
+
+	code, output = run_case(module.case, workers=2)
+
+	assert code == 1
+	assert module.case.passed == 5
+	assert module.case.errors == 1
+	assert int((tmp_path / "worker.pid").read_text()) != os.getpid()
+	assert module.pids == {"in_runner": os.getpid(), "nested": os.getpid()}
+	assert [
+		line.split()[3] for line in output.splitlines() if line[:4] in ("PASS", "ERR ")
+	] == [
+		"first:[line",
+		"parametrized[0]:[line",
+		"parametrized[1]:[line",
+		"parametrized[2]:[line",
+		"in_runner:[line",
+		"nested:[line",
+	]
+
+
+@pytest.mark.parametrize("workers", [0, -1, "2"])
+def test_pool_rejects_invalid_workers(run_case, import_module, workers):
+	module = import_module("zitadelle_pool_invalid", POOL_MODULE)
+
+	with pytest.raises(exceptions.TestValidationError):
+		run_case(module.case, workers=workers)
+
+
+WORKER_OPTIONS_MODULE = """
+import threading
+from pathlib import Path
+
+from pyzitadelle.test_case import TestCase, each
+
+case = TestCase("pool_options")
+together = threading.Barrier(2, timeout=5)
+executed = Path(__file__).with_name("executed.txt")
+
+
+@case.test(arguments=each(1, 2, 3, 4))
+def in_case_threads(value):
+	together.wait()
+
+
+@case.test(arguments=each(*range(10)))
+def failing(value):
+	with open(executed, "a") as file:
+		file.write(f"{value}\\n")
+
+	assert False
+"""
+
+
+def test_pool_workers_use_case_threads_and_max_failures(
+	run_case, import_module, tmp_path
+):
+	module = import_module("zitadelle_pool_options", WORKER_OPTIONS_MODULE)
+
+	code, output = run_case(module.case, workers=1, case_threads=2, max_failures=3)
+
+	assert code == 1
+	assert module.case.passed == 4
+	assert module.case.errors == 3
+	assert "stopped after 3 failures" in output
+	assert len((tmp_path / "executed.txt").read_text().split()) < 10
@@ -0,0 +1,139 @@
+import ast
+import io
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import pyzitadelle
+from pyzitadelle import exceptions
+from pyzitadelle.reporter import PlainReporter, RichReporter, get_reporter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(pyzitadelle.__file__)))
+
+
+class CountingStream(io.StringIO):
+	def __init__(self):
+		super().__init__()
+		self.writes = 0
+
+	def write(self, text):
+		self.writes += 1
+		return super().write(text)
+
+
+def test_plain_reporter_buffers_output():
+	stream = CountingStream()
+	reporter = PlainReporter(stream, buffer_size=500)
+	reporter.columns = 80
+
+	for n in range(3):
+		reporter.print_test_result(n * 10, f"test_{n}")
+
+	assert stream.getvalue() == ""
+
+	for n in range(3, 10):
+		reporter.print_test_result(n * 10, f"test_{n}")
+
+	assert 0 < stream.writes < 10
+
+	reporter.flush()
+	lines = stream.getvalue().splitlines()
+
+	assert len(lines) == 10
+	assert all(line.startswith("PASS ") for line in lines)
+	assert lines[9].endswith("[ 90%]")
+
+
+def test_plain_reporter_prints_errors_with_output():
+	stream = io.StringIO()
+	reporter = PlainReporter(stream)
+
+	reporter.print_test_result(
+		100, "broken", status="error", output="Traceback: boom", postmessage="later"
+	)
+	reporter.flush()
+
+	assert stream.getvalue().startswith("\nERR  ")
+	assert "ERROR: broken" in stream.getvalue()
+	assert "Traceback: boom" in stream.getvalue()
+
+
+def test_get_reporter():
+	reporter = PlainReporter(io.StringIO())
+
+	assert get_reporter(reporter) is reporter
+	assert isinstance(get_reporter(), RichReporter)
+	assert isinstance(get_reporter("plain"), PlainReporter)
+
+	with pytest.raises(exceptions.TestValidationError, match="Unknown reporter"):
+		get_reporter("html")
+
+
+def test_plain_reporter_writes_tables_to_stream():
+	stream = io.StringIO()
+	reporter = PlainReporter(stream)
+	reporter.columns = 60
+
+	reporter.print_results_table(10, 7, 1, 2, 1, timeouts=0, xfailed=3)
+	reporter.print_coverage([("module.py", 10, 5)])
+	reporter.flush()
+	lines = stream.getvalue().splitlines()
+
+	assert "Tests Result" in lines[0]
+	assert lines[1].split() == ["Tests", "encountered", "N", "Percent"]
+	assert lines[3].split() == ["Passed", "7", "70%"]
+	assert lines[7].split() == ["Expected", "failures", "3", "30%"]
+	assert not any(line.startswith("Timeouts") for line in lines)
+	assert "Coverage" in lines[8]
+	assert lines[10:] == [
+		"module.py     10     5    50%",
+		"Total         10     5    50%",
+	]
+
+
+def test_plain_run_writes_everything_to_stream_without_rich(tmp_path):
+	script = tmp_path / "plain_run.py"
+	script.write_text(
+		textwrap.dedent(
+			"""
+			import io
+			import sys
+
+			from pyzitadelle.reporter import PlainReporter
+			from pyzitadelle.test_case import TestCase
+
+			case = TestCase("plain")
+
+
+			@case.benchmark(target_time=0.01, min_rounds=3)
+			def measured():
+				pass
+
+
+			stream = io.StringIO()
+			case.run(
+				reporter=PlainReporter(stream),
+				check_updates=False,
+				durations=0,
+				standalone=False,
+			)
+			sys.stdout.write(repr((stream.getvalue(), "rich" in sys.modules)))
+			"""
+		)
+	)
+	result = subprocess.run(
+		[sys.executable, str(script)],
+		capture_output=True,
+		text=True,
+		env={**os.environ, "PYTHONPATH": ROOT},
+		check=True,
+	)
+	output, rich_imported = ast.literal_eval(result.stdout)
+
+	assert not rich_imported
+	assert "1 tests runned" in output
+	assert "Slowest tests" in output
+	assert "Benchmarks" in output
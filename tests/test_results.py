@@ -0,0 +1,90 @@
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ElementTree
+
+from pyzitadelle import test_case
+from pyzitadelle.results import read_json_lines
+
+
+def _make_case():
+	case = test_case.TestCase("junit")
+
+	@case.test(arguments=test_case.each(1, 2))
+	def positive(value):
+		assert value > 1
+
+	@case.test()
+	def passes():
+		pass
+
+	return case
+
+
+def test_junit_xml_without_report_leaves_no_stream(run_case, tmp_path, monkeypatch):
+	temporary = tmp_path / "tmp"
+	temporary.mkdir()
+	monkeypatch.setattr(tempfile, "tempdir", str(temporary))
+	junit_xml = tmp_path / "out.xml"
+
+	code, _ = run_case(_make_case(), junit_xml=str(junit_xml))
+
+	assert code == 1
+	assert list(temporary.iterdir()) == []
+	assert sorted(path.name for path in tmp_path.iterdir() if path.is_file()) == [
+		"out.xml"
+	]
+
+	suite = ElementTree.parse(junit_xml).getroot().find("testsuite")
+
+	assert suite.get("tests") == "3"
+	assert suite.get("failures") == "1"
+	assert [testcase.get("name") for testcase in suite.iter("testcase")] == [
+		"positive[0]",
+		"positive[1]",
+		"passes",
+	]
+	assert "AssertionError" in suite.find("testcase/failure").text
+
+
+def test_junit_xml_with_report_keeps_stream(run_case, tmp_path):
+	report = tmp_path / "report.jsonl"
+	junit_xml = tmp_path / "out.xml"
+
+	run_case(_make_case(), report=str(report), junit_xml=str(junit_xml))
+
+	records = list(read_json_lines(report))
+
+	assert [record["outcome"] for record in records] == ["FAIL", "PASS", "PASS"]
+	assert junit_xml.exists()
+
+
+def test_junit_xml_strips_invalid_characters(run_case, tmp_path):
+	case = test_case.TestCase("junit\x00control")
+
+	@case.test()
+	def colored():
+		raise AssertionError("\x1b[31mred\x1b[0m and \x00null")
+
+	junit_xml = tmp_path / "out.xml"
+	run_case(case, junit_xml=str(junit_xml))
+
+	suite = ElementTree.parse(junit_xml).getroot().find("testsuite")
+
+	assert suite.get("name") == "junitcontrol"
+	assert "[31mred[0m and null" in suite.find("testcase/failure").text
+
+
+def test_junit_xml_support_is_imported_lazily():
+	process = subprocess.run(
+		[
+			sys.executable,
+			"-c",
+			"import sys, pyzitadelle.test_case; print('xml.sax' in sys.modules)",
+		],
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+
+	assert process.stdout == "False\n"
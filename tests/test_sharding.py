@@ -0,0 +1,127 @@
+import time
+
+import pytest
+
+from pyzitadelle import exceptions, test_case
+from pyzitadelle.sharding import (
+	merge_histories,
+	merge_summaries,
+	split_tests,
+	validate_shard,
+)
+
+
+def test_hash_split_covers_every_test_once():
+	names = [f"test_{n}" for n in range(50)]
+	shards = split_tests(names, 4)
+
+	assert sorted(name for shard in shards for name in shard) == sorted(names)
+	assert all(shard == sorted(shard, key=names.index) for shard in shards)
+	assert split_tests(reversed(names), 4) == [list(reversed(shard)) for shard in shards]
+
+
+def test_split_is_balanced_by_durations():
+	durations = {"a": 90, "b": 50, "c": 40, "d": 30, "e": 20}
+	shards = split_tests(["a", "b", "c", "d", "e", "new"], 2, durations)
+
+	# the test without duration counts as the mean one, 46
+	assert shards == [["a", "c"], ["b", "d", "e", "new"]]
+
+
+@pytest.mark.parametrize(
+	"shard, total_shards",
+	[(0, None), (None, 2), (2, 2), (-1, 2), (0, 0)],
+)
+def test_invalid_shards(shard, total_shards):
+	with pytest.raises(exceptions.TestValidationError):
+		validate_shard(shard, total_shards)
+
+
+def test_shards_of_run_merge_to_whole_suite(run_case, tmp_path, monkeypatch):
+	def make_test(n):
+		def test():
+			assert n != 4
+
+		test.__name__ = f"test_{n}"
+
+		return test
+
+	def make_case():
+		case = test_case.TestCase("shards")
+
+		for n in range(9):
+			case.test()(make_test(n))
+
+		return case
+
+	paths = []
+
+	for shard in range(3):
+		# every node starts from the same (empty) history
+		monkeypatch.setenv("PYZITADELLE_CACHE_DIR", str(tmp_path / f"node{shard}"))
+		paths.append(tmp_path / f"shard{shard}.json")
+		run_case(make_case(), shard=shard, total_shards=3, summary=str(paths[-1]))
+
+	merged = merge_summaries(paths)
+
+	assert merged["tests"] == 9
+	assert merged["total"] == 9
+	assert merged["passed"] == 8
+	assert merged["errors"] == 1
+	assert sorted(merged["shards"]) == [0, 1, 2]
+
+
+def _run_nodes(run_case, tmp_path, monkeypatch, durations, **kwargs):
+	"""Run every shard as a node with its own cache, returning tests run by each."""
+	shards = []
+
+	def make_test(n):
+		def test():
+			shards[-1].append(n)
+			time.sleep(durations[n])
+
+		test.__name__ = f"test_{n}"
+
+		return test
+
+	for shard in range(2):
+		monkeypatch.setenv("PYZITADELLE_CACHE_DIR", str(tmp_path / f"node{shard}"))
+		case = test_case.TestCase("nodes")
+
+		for n in range(len(durations)):
+			case.test()(make_test(n))
+
+		shards.append([])
+		run_case(case, shard=shard, total_shards=2, **kwargs)
+
+	return shards
+
+
+def test_local_histories_of_nodes_do_not_change_split(run_case, tmp_path, monkeypatch):
+	durations = [0.03, 0, 0, 0, 0.02, 0]
+	first = _run_nodes(run_case, tmp_path, monkeypatch, durations)
+
+	assert sorted(first[0] + first[1]) == list(range(6))
+	# every node only knows durations of its own tests now
+	assert _run_nodes(run_case, tmp_path, monkeypatch, durations) == first
+
+
+def test_shards_are_balanced_by_shared_history(run_case, tmp_path, monkeypatch):
+	durations = [0.04, 0, 0, 0, 0.03, 0]
+	shared = tmp_path / "shared" / "history.json"
+
+	_run_nodes(run_case, tmp_path, monkeypatch, durations)
+	merge_histories(
+		[tmp_path / f"node{shard}" / "history.json" for shard in range(2)], shared
+	)
+
+	shards = _run_nodes(
+		run_case, tmp_path, monkeypatch, durations, shard_history=str(shared)
+	)
+
+	assert sorted(shards[0] + shards[1]) == list(range(6))
+	assert sorted([0 in shards[0], 4 in shards[0]]) == [False, True]
+	assert (
+		_run_nodes(run_case, tmp_path, monkeypatch, durations, shard_history=str(shared))
+		== shards
+	)
@@ -0,0 +1,133 @@
+import pytest
+
+from pyzitadelle import standard, test_case
+from pyzitadelle.store import ResultStore
+
+
+def _make_store():
+	store = ResultStore()
+	store.add("first", standard.TestOutcome.PASS, 100)
+	store.add_result(
+		"second",
+		1,
+		standard.TestResult(
+			invocations=[
+				standard.TestInvocation(0, 0, standard.TestOutcome.PASS, 200),
+				standard.TestInvocation(
+					0, 1, standard.TestOutcome.FAIL, 300, "Traceback: boom"
+				),
+			]
+		),
+	)
+	store.add("first", standard.TestOutcome.SKIP)
+
+	return store
+
+
+def _check_store(store):
+	assert len(store) == 4
+	assert store.get(2) == (
+		"second",
+		standard.TestOutcome.FAIL,
+		300,
+		1,
+		"Traceback: boom",
+	)
+	assert store.get(3).argument_index is None
+	assert [invocation.test_name for invocation in store] == [
+		"first",
+		"second",
+		"second",
+		"first",
+	]
+	assert store.count_outcomes() == {
+		standard.TestOutcome.PASS: 2,
+		standard.TestOutcome.FAIL: 1,
+		standard.TestOutcome.SKIP: 1,
+	}
+	assert store.get_total_durations() == {"first": 100, "second": 500}
+
+
+def test_store_columns():
+	store = _make_store()
+
+	assert store.names == ["first", "second"]
+	assert store.intern("second") == 1
+	_check_store(store)
+
+
+def test_store_round_trip(tmp_path):
+	path = tmp_path / "results" / "store.bin"
+	_make_store().write(path)
+	store = ResultStore.load(path)
+
+	_check_store(store)
+
+	with pytest.raises(AttributeError):
+		store.add("third", standard.TestOutcome.PASS)
+
+
+def test_load_rejects_other_files(tmp_path):
+	path = tmp_path / "store.bin"
+	path.write_bytes(b"not a result store at all, just some bytes")
+
+	with pytest.raises(ValueError):
+		ResultStore.load(path)
+
+
+def test_run_writes_result_store(tmp_path, run_case):
+	case = test_case.TestCase("store")
+
+	@case.test(arguments=standard.Each([1, 2, 3]))
+	def odd(number):
+		assert number % 2
+
+	@case.test()
+	def fine():
+		pass
+
+	path = tmp_path / "store.bin"
+	code, _ = run_case(case, result_store=str(path))
+	store = ResultStore.load(path)
+
+	assert code == 1
+	assert sorted(
+		(invocation.test_name, invocation.argument_index, invocation.outcome)
+		for invocation in store
+	) == [
+		("fine", None, standard.TestOutcome.PASS),
+		("odd", 0, standard.TestOutcome.PASS),
+		("odd", 1, standard.TestOutcome.FAIL),
+		("odd", 2, standard.TestOutcome.PASS),
+	]
+
+	failed = next(
+		invocation
+		for invocation in store
+		if invocation.outcome is standard.TestOutcome.FAIL
+	)
+
+	assert "AssertionError" in failed.traceback
+
+
+def test_store_is_kept_only_when_written(tmp_path, run_case):
+	case = test_case.TestCase("store_optional")
+
+	@case.test(count_of_launchs=3)
+	def fine():
+		pass
+
+	run_case(case)
+
+	assert case.results is None
+
+	path = tmp_path / "store.bin"
+	run_case(case, result_store=str(path))
+	run_case(case, result_store=str(path))
+
+	assert len(case.results) == 3
+	assert len(ResultStore.load(path)) == 3
+
+	run_case(case)
+
+	assert case.results is None
@@ -0,0 +1,81 @@
+import pytest
+
+from pyzitadelle import exceptions, test_case
+from pyzitadelle.tagging import TagIndex, compile_expression
+
+
+def _make_index():
+	index = TagIndex()
+	index.add("query", ["db"])
+	index.add("migration", ["db", "slow"])
+	index.add("render", ["ui"])
+	index.add("upload", ["net", "slow"])
+	index.add("plain", [])
+
+	return index
+
+
+@pytest.mark.parametrize(
+	"expression, names",
+	[
+		("db", {"query", "migration"}),
+		("missing", set()),
+		("db and not slow", {"query"}),
+		("db or ui", {"query", "migration", "render"}),
+		("not slow", {"query", "render", "plain"}),
+		("slow and (db or ui)", {"migration"}),
+		("(db or net) and slow and not ui", {"migration", "upload"}),
+		("not (db or ui or net)", {"plain"}),
+		("missing and db", set()),
+	],
+)
+def test_select_by_expression(expression, names):
+	assert _make_index().select(expression) == names
+
+
+@pytest.mark.parametrize(
+	"expression", ["", "db and", "db slow", "(db", "not", "db and or ui"]
+)
+def test_invalid_expression(expression):
+	with pytest.raises(exceptions.TestValidationError):
+		compile_expression(expression)
+
+
+def test_readding_test_replaces_its_tags():
+	index = _make_index()
+	index.add("migration", ["ui"])
+
+	assert index.get("db") == {"query"}
+	assert index.get("ui") == {"render", "migration"}
+
+	index.add("upload", ["ui"])
+
+	assert "net" not in index
+	assert sorted(index) == ["db", "ui"]
+	assert len(index) == 2
+
+
+def test_run_selects_tests_by_expression(run_case):
+	calls = []
+	case = test_case.TestCase("tags")
+
+	@case.test(tags=["db"])
+	def query():
+		calls.append("query")
+
+	@case.test(tags=["db", "slow"])
+	def migration():
+		calls.append("migration")
+
+	@case.test()
+	def plain():
+		calls.append("plain")
+
+	code, output = run_case(case, select="db and not slow")
+
+	assert code == 0
+	assert calls == ["query"]
+	assert "migration" not in output
+
+	with pytest.raises(exceptions.TestValidationError):
+		run_case(case, select="db and")
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from pyzitadelle import test_case
+
+
+def test_threads_run_sync_tests_concurrently(run_case):
+	case = test_case.TestCase("threads")
+	started = threading.Barrier(4, timeout=5)
+
+	for n in range(4):
+
+		def blocking():
+			started.wait()
+
+		blocking.__name__ = f"blocking_{n}"
+		case.test()(blocking)
+
+	code, output = run_case(case, threads=4)
+
+	assert code == 0
+	assert case.passed == 4
+	assert [line.split()[3] for line in output.splitlines() if line.startswith("PASS")] == [
+		f"blocking_{n}:[line" for n in range(4)
+	]
+
+
+def test_threads_with_async_and_timed_sync_tests(run_case):
+	case = test_case.TestCase("threads_timeout")
+
+	@case.test()
+	async def slow_async():
+		import asyncio
+
+		await asyncio.sleep(0.05)
+
+	for n in range(8):
+
+		def timed():
+			time.sleep(0.01)
+
+		timed.__name__ = f"timed_{n}"
+		case.test(timeout=2)(timed)
+
+	@case.test(timeout=0.05)
+	def hung():
+		time.sleep(1)
+
+	code, _ = run_case(case, threads=4, concurrency=2)
+
+	assert code == 1
+	assert case.passed == 9
+	assert case.timeouts == 1
+	assert case.errors == 0
+
+
+def test_threads_report_failures_in_order(run_case):
+	case = test_case.TestCase("threads_failures")
+
+	@case.test()
+	def first():
+		time.sleep(0.05)
+
+	@case.test()
+	def second():
+		assert False, "broken"
+
+	code, output = run_case(case, threads=2)
+
+	assert code == 1
+	assert case.errors == 1
+	assert output.index("first:") < output.index("second:")
+
+
+def test_benchmarks_run_after_thread_tests(run_case):
+	case = test_case.TestCase("threads_benchmark")
+	benchmark_calls = []
+	busy = []
+
+	@case.benchmark(target_time=0.02, min_rounds=3)
+	def timed_rounds():
+		benchmark_calls.append(time.perf_counter())
+
+	for n in range(4):
+
+		def busy_loop():
+			start = time.perf_counter()
+
+			while time.perf_counter() - start < 0.01:
+				pass
+
+			busy.append((start, time.perf_counter()))
+
+		busy_loop.__name__ = f"busy_loop_{n}"
+		case.test(count_of_launchs=5)(busy_loop)
+
+	code, _ = run_case(case, threads=2)
+
+	assert code == 0
+	assert len(busy) == 20
+	assert max(end for _, end in busy) < min(benchmark_calls)
@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import pytest
+
+from pyzitadelle import exceptions, test_case
+
+
+def test_hung_async_test_is_cancelled(run_case):
+	case = test_case.TestCase("timeout_async")
+	cancelled = []
+
+	@case.test(timeout=0.05)
+	async def hangs():
+		try:
+			await asyncio.sleep(10)
+		except asyncio.CancelledError:
+			cancelled.append(True)
+			raise
+
+	@case.test()
+	async def passes():
+		pass
+
+	code, output = run_case(case)
+
+	assert code == 1
+	assert cancelled == [True]
+	assert case.timeouts == 1
+	assert case.passed == 1
+	assert "Test cancelled after 0.05s" in output
+
+
+def test_hung_sync_test_is_abandoned(run_case):
+	case = test_case.TestCase("timeout_sync")
+
+	@case.test()
+	def hangs():
+		time.sleep(1)
+
+	@case.test(timeout=5)
+	def own_timeout():
+		time.sleep(0.1)
+
+	start = time.perf_counter()
+	code, output = run_case(case, timeout=0.05)
+
+	assert time.perf_counter() - start < 1
+	assert code == 1
+	assert case.timeouts == 1
+	assert case.passed == 1
+	assert "Test abandoned after 0.05s" in output
+
+
+def test_hung_test_is_killed_in_worker(run_case, import_module):
+	module = import_module(
+		"zitadelle_timeout",
+		"""
+		import time
+
+		from pyzitadelle.test_case import TestCase
+
+		case = TestCase("timeout_worker")
+
+
+		@case.test(timeout=0.05)
+		def hangs():
+			time.sleep(10)
+		""",
+	)
+
+	code, output = run_case(module.case, workers=1)
+
+	assert code == 1
+	assert module.case.timeouts == 1
+	assert "Test killed after 0.05s" in output
+
+
+@pytest.mark.parametrize("timeout", [0, -1, "1"])
+def test_invalid_timeout(run_case, timeout):
+	case = test_case.TestCase("timeout_invalid")
+
+	with pytest.raises(exceptions.TestValidationError):
+		run_case(case, timeout=timeout)
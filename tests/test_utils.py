@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+import time
+
+import pyzitadelle
+from pyzitadelle import utils
+
+
+def test_import_has_no_side_effects():
+	process = subprocess.run(
+		[
+			sys.executable,
+			"-c",
+			"import sys, pyzitadelle; print(sorted({'requests', 'rich'} & set(sys.modules)))",
+		],
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+
+	assert process.stdout == "[]\n"
+	assert process.stderr == ""
+
+
+def test_check_for_update_is_exported():
+	assert pyzitadelle.__all__ == ["__version__", "check_for_update"]
+	assert pyzitadelle.check_for_update is utils.check_for_update
+
+
+def test_latest_version_is_cached_for_a_day(tmp_path, monkeypatch):
+	cache_file = tmp_path / "update-check.json"
+	fetched = []
+
+	def fetch():
+		fetched.append(True)
+		return "9.9.9"
+
+	monkeypatch.setattr(utils, "_fetch_latest_version", fetch)
+
+	assert utils.get_latest_version(cache_file) == "9.9.9"
+	assert utils.get_latest_version(cache_file) == "9.9.9"
+	assert len(fetched) == 1
+
+	cache_file.write_text(
+		json.dumps({"checked_at": time.time() - utils.UPDATE_CHECK_INTERVAL, "version": "1.0"})
+	)
+
+	assert utils.get_latest_version(cache_file) == "9.9.9"
+	assert len(fetched) == 2
+
+
+def test_versions_are_compared_by_digits():
+	assert utils._version_tuple("0.10.0") > utils._version_tuple("0.9.9")